@@ -0,0 +1,105 @@
+"""
+Local HTTP review service: python -m api --catalog NAME=tests.csv [...]
+
+Loads each catalog once and keeps it warm; CI jobs POST JUnit XML to
+/review/<NAME>[?format=md|json|html|junit] and receive the report. See
+core.control.service for the routes and admission control.
+"""
+
+import argparse
+import sys
+
+from core.control.cli_contract import PREFIX_PATTERN, add_input_options, cache_dir_from_args, id_options_from_args
+from core.errors import IngestionError, ValidationError
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="api", description="Serve QA risk reviews over local HTTP")
+    parser.add_argument(
+        "--catalog",
+        action="append",
+        required=True,
+        metavar="NAME=PATH",
+        help="Test case CSV to keep loaded, reviewed at POST /review/NAME; repeatable",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on; 0 picks a free port (default: 8000)")
+    parser.add_argument("--workers", type=int, default=4, help="Reviews processed at the same time (default: 4)")
+    parser.add_argument(
+        "--queue",
+        type=int,
+        default=16,
+        help="Reviews waiting for a worker before new ones get HTTP 429 (default: 16)",
+    )
+    parser.add_argument(
+        "--max-body-mb",
+        type=int,
+        default=256,
+        help="Largest JUnit XML body accepted, after gzip decoding; larger ones get HTTP 413 (default: 256)",
+    )
+    add_input_options(parser)
+    return parser
+
+
+def parse_catalogs(values: list[str]) -> dict[str, str]:
+    """Parse NAME=PATH catalog options; raises ValidationError for invalid or duplicate names."""
+    catalogs: dict[str, str] = {}
+    for value in values:
+        name, sep, path = value.partition("=")
+        name, path = name.strip(), path.strip()
+        if not sep or not path:
+            raise ValidationError(f"catalog '{value}' is invalid: expected NAME=PATH")
+        if not PREFIX_PATTERN.match(name):
+            raise ValidationError(
+                f"catalog name '{name}' is invalid: must start with alphanumeric and contain only [a-zA-Z0-9_-], max 64 chars"
+            )
+        if name in catalogs:
+            raise ValidationError(f"duplicate catalog name '{name}'")
+        catalogs[name] = path
+    return catalogs
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Load the catalogs and serve until interrupted.
+
+    Returns 0 on Ctrl-C, 2 on invalid arguments or unreadable catalogs.
+    """
+    try:
+        args = build_parser().parse_args(argv)
+        catalogs = parse_catalogs(args.catalog)
+        id_schemes, id_patterns = id_options_from_args(args)
+        cache_dir = cache_dir_from_args(args)
+
+        from core.control.service import ReviewService, make_server
+        from core.ingestion.cache import ParseCache, default_cache_dir
+        from core.ingestion.id_extraction import IdExtractor
+
+        cache = None if args.no_cache else ParseCache(cache_dir or default_cache_dir())
+        service = ReviewService.from_catalog_files(
+            catalogs,
+            cache=cache,
+            id_extractor=IdExtractor.from_schemes(id_schemes, id_patterns),
+            max_workers=args.workers,
+            max_queue=args.queue,
+            max_body_bytes=args.max_body_mb << 20,
+        )
+        server = make_server(service, host=args.host, port=args.port)
+    except (ValidationError, IngestionError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    except SystemExit as e:
+        return 0 if e.code == 0 else 2
+
+    host, port = server.server_address[:2]
+    print(f"Serving {len(catalogs)} catalog(s) on http://{host}:{port} ({', '.join(catalogs)})", flush=True)
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
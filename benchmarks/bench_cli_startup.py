@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark CLI startup time.
+
+Usage:
+    python -m benchmarks.bench_cli_startup [--repeat 20] [--budget-ms 100]
+
+Times fresh interpreter processes running the commands used by pre-commit
+and CI hooks (--help and a validated run --dry-run) against a bare
+interpreter. Exits with code 1 if the median of any command exceeds the
+budget, so a regression (e.g. an eager import of the reporting stack) fails
+the benchmark.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+COMMANDS = {
+    "python -c pass": ["-c", "pass"],
+    "cli --help": ["-m", "cli", "--help"],
+    "cli run --dry-run": ["-m", "cli", "run", "--tests", "a.csv", "--results", "b.xml", "--dry-run"],
+}
+
+
+def _median_ms(args: list[str], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=PROJECT_ROOT, stdout=subprocess.DEVNULL, check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=100.0)
+    args = parser.parse_args()
+
+    over_budget = []
+    for label, command in COMMANDS.items():
+        median = _median_ms(command, args.repeat)
+        print(f"{label:<20}{median:8.1f} ms")
+        if median > args.budget_ms:
+            over_budget.append(label)
+
+    if over_budget:
+        print(f"over the {args.budget_ms:.0f} ms budget: {', '.join(over_budget)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark the fused ingest+normalize loaders against the two-step path.
+
+Usage:
+    python -m benchmarks.bench_fused_ingestion [--rows 1000000]
+
+Generates a synthetic test case CSV and JUnit file with the given number of
+rows in a temporary directory, then times:
+- two-step: load_test_cases_csv / load_junit_results followed by normalize
+- fused:    load_test_case_catalog_csv / load_junit_result_models
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from core.ingestion.csv_loader import load_test_case_catalog_csv, load_test_cases_csv
+from core.ingestion.junit_loader import load_junit_result_models, load_junit_results
+from core.normalization import normalize
+
+
+def _write_inputs(directory: Path, rows: int) -> tuple[str, str]:
+    csv_path = directory / "cases.csv"
+    with csv_path.open("w", encoding="utf-8", newline="") as f:
+        f.write("id,title,description,priority,component\n")
+        for i in range(rows):
+            f.write(f"TC-{i},Test case {i},\"Steps for {i}\",P{i % 4},comp-{i % 50}\n")
+
+    xml_path = directory / "results.xml"
+    with xml_path.open("w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="utf-8"?>\n<testsuite name="bench">\n')
+        for i in range(rows):
+            if i % 20 == 0:
+                f.write(f'  <testcase name="test_{i} TC-{i}" time="0.{i % 10}"><failure message="x"/></testcase>\n')
+            else:
+                f.write(f'  <testcase name="test_{i} TC-{i}" time="0.{i % 10}"/>\n')
+        f.write("</testsuite>\n")
+
+    return str(csv_path), str(xml_path)
+
+
+def _time(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark fused vs two-step ingestion")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows per input (default: 1000000)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path, xml_path = _write_inputs(Path(tmp), args.rows)
+
+        two_step = _time(lambda: normalize(load_test_cases_csv(csv_path), load_junit_results(xml_path)))
+        fused = _time(lambda: (load_test_case_catalog_csv(csv_path), load_junit_result_models(xml_path)))
+
+    print(f"rows:     {args.rows}")
+    print(f"two-step: {two_step:.2f}s")
+    print(f"fused:    {fused:.2f}s")
+    print(f"speedup:  {two_step / fused:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
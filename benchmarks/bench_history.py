@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark the SQLite run-history store.
+
+Usage:
+    python -m benchmarks.bench_history [--runs 20000] [--tests 50]
+
+Records the given number of synthetic runs (each with --tests per-test
+results) into a temporary database, then times the trend queries:
+- recent_runs / metric_trend over the last 200 runs
+- test_history of a single test id
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from core.history import RunHistoryStore
+from core.normalization.models import STATUS_NAMES, ResultBatch
+
+
+def _output(rng: random.Random, tests: int) -> dict:
+    failed = rng.randrange(tests // 5 + 1)
+    skipped = rng.randrange(tests // 10 + 1)
+    passed = tests - failed - skipped
+    return {
+        "metrics": {
+            "total_cases": tests,
+            "total_results": tests,
+            "mapped_results": tests,
+            "unmapped_results": 0,
+            "passed": passed,
+            "failed": failed,
+            "skipped": skipped,
+            "failure_rate": failed / tests,
+            "skip_rate": skipped / tests,
+        },
+        "score": max(0, 100 - failed * 10),
+        "risk": "High",
+    }
+
+
+def _time(label: str, fn, repeat: int = 20) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    print(f"{label:<28}{(time.perf_counter() - start) / repeat * 1000:8.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20_000)
+    parser.add_argument("--tests", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp, RunHistoryStore(Path(tmp) / "history.db") as store:
+        start = time.perf_counter()
+        for run in range(args.runs):
+            batch = ResultBatch()
+            for i in range(args.tests):
+                batch.append(f"TC-{i}", rng.choice(STATUS_NAMES), rng.random())
+            store.record_run(_output(rng, args.tests), batch, recorded_at=float(run))
+        elapsed = time.perf_counter() - start
+        print(f"runs:     {args.runs} x {args.tests} results")
+        print(f"recorded: {elapsed:.2f}s ({args.runs / elapsed:.0f} runs/s)")
+
+        _time("recent_runs(200)", lambda: store.recent_runs(200))
+        _time("metric_trend(failure_rate)", lambda: store.metric_trend("failure_rate", 200))
+        _time("test_history(TC-7, 200)", lambda: store.test_history("TC-7", limit=200))
+        _time("test_history(TC-7)", lambda: store.test_history("TC-7"), repeat=3)
+
+
+if __name__ == "__main__":
+    main()
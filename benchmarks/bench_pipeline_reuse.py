@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark a reusable Pipeline against calling run_pipeline per result set.
+
+Usage:
+    python -m benchmarks.bench_pipeline_reuse [--cases 200000] [--results 5000] [--evaluations 20]
+
+Builds a synthetic catalog of --cases test case dicts and --evaluations
+result sets of --results results each (e.g. one per environment or retry),
+then times:
+- run_pipeline:     catalog normalized and indexed on every call
+- Pipeline.evaluate_dicts: catalog prepared once, per-results work only
+and reports the amortized cost per evaluation, including the one-off setup.
+"""
+
+import argparse
+import random
+import time
+
+from core.normalization.models import STATUS_NAMES
+from core.pipeline import Pipeline, run_pipeline
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cases", type=int, default=200_000)
+    parser.add_argument("--results", type=int, default=5_000)
+    parser.add_argument("--evaluations", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    cases = [
+        {"id": f"TC-{i}", "title": f"Test case {i}", "priority": f"P{i % 4}", "component": f"comp-{i % 50}"}
+        for i in range(args.cases)
+    ]
+    result_sets = [
+        [
+            {"id": f"TC-{rng.randrange(args.cases)}", "status": rng.choice(STATUS_NAMES), "duration_sec": rng.random()}
+            for _ in range(args.results)
+        ]
+        for _ in range(args.evaluations)
+    ]
+
+    start = time.perf_counter()
+    expected = [run_pipeline(cases, results) for results in result_sets]
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pipeline = Pipeline(cases)
+    setup = time.perf_counter() - start
+    start = time.perf_counter()
+    outputs = [pipeline.evaluate_dicts(results) for results in result_sets]
+    warm = time.perf_counter() - start
+    assert outputs == expected
+
+    n = args.evaluations
+    print(f"catalog: {args.cases} cases, {n} evaluations x {args.results} results")
+    print(f"run_pipeline:       {cold / n * 1000:8.1f} ms per evaluation")
+    print(f"Pipeline setup:     {setup * 1000:8.1f} ms once")
+    print(f"Pipeline.evaluate:  {warm / n * 1000:8.1f} ms per evaluation")
+    print(f"amortized:          {(setup + warm) / n * 1000:8.1f} ms per evaluation ({cold / (setup + warm):.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
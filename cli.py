@@ -0,0 +1,8 @@
+"""Command-line entry point: python -m cli <command> ..."""
+
+import sys
+
+from core.control.cli_contract import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,27 @@
 """Control/orchestration package (Phase 1 skeleton)."""
 
-from .cli_contract import RunPlan, parse_run_plan
+from .cli_contract import (
+    BatchPlan,
+    DiffPlan,
+    RunPlan,
+    SweepPlan,
+    WatchPlan,
+    parse_batch_plan,
+    parse_diff_plan,
+    parse_run_plan,
+    parse_sweep_plan,
+    parse_watch_plan,
+)
 
 __all__ = [
     "RunPlan",
     "parse_run_plan",
+    "BatchPlan",
+    "parse_batch_plan",
+    "SweepPlan",
+    "parse_sweep_plan",
+    "WatchPlan",
+    "parse_watch_plan",
+    "DiffPlan",
+    "parse_diff_plan",
 ]
-
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import csv
+import json
+import os
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from core.control.cli_contract import PREFIX_PATTERN, RunPlan, normalize_formats
+from core.errors import IngestionError, ValidationError
+
+# Manifest fields; name, tests and results are required.
+MANIFEST_FIELDS: tuple[str, ...] = ("name", "tests", "results", "format", "history")
+_REQUIRED_FIELDS = ("name", "tests", "results")
+
+# Combined index written next to the per-entry report directories.
+INDEX_NAME = "batch_index"
+
+
+@dataclass(frozen=True, slots=True)
+class BatchEntry:
+    """One (tests, results) pair of a batch manifest and the plan to review it."""
+
+    name: str
+    plan: RunPlan
+
+
+@dataclass(frozen=True, slots=True)
+class BatchEntryResult:
+    """Outcome of reviewing one batch entry; error is set if it failed."""
+
+    name: str
+    ok: bool
+    score: int | None = None
+    risk: str | None = None
+    reports: dict[str, str] = field(default_factory=dict)  # format -> saved path
+    error: str | None = None
+    elapsed_sec: float = 0.0
+
+
+def load_batch_manifest(path: str | Path, defaults: RunPlan) -> list[BatchEntry]:
+    """
+    Load a batch manifest (JSON list of objects, or CSV with a header row).
+
+    Each entry has name, tests and results, and optionally format and history
+    (see MANIFEST_FIELDS). Relative paths are resolved against the manifest's
+    directory. Every other setting comes from defaults, except that each
+    entry's reports go to <defaults.outdir>/<name> and shards are parsed
+    in-process (the batch parallelizes across entries).
+
+    Raises IngestionError if the file cannot be read or parsed and
+    ValidationError for missing fields, invalid names or formats, and
+    duplicate names.
+    """
+    path = Path(path)
+    rows = _read_manifest_rows(path)
+    base_dir = path.parent
+
+    entries = []
+    seen: set[str] = set()
+    for i, row in enumerate(rows):
+        where = f"manifest '{path}': entry {i}"
+        if not isinstance(row, dict):
+            raise ValidationError(f"{where} is not an object")
+        unknown = sorted(str(key) for key in row if key not in MANIFEST_FIELDS)
+        if unknown:
+            raise ValidationError(f"{where} has unknown fields {unknown} (expected: {list(MANIFEST_FIELDS)})")
+        values = {key: row.get(key) for key in MANIFEST_FIELDS}
+        for key, value in values.items():
+            if value is not None and not isinstance(value, str):
+                raise ValidationError(f"{where}: '{key}' must be a string")
+            if value is not None and not value.strip():
+                values[key] = None
+        for key in _REQUIRED_FIELDS:
+            if values[key] is None:
+                raise ValidationError(f"{where}: '{key}' is required")
+
+        name = values["name"].strip()
+        if not PREFIX_PATTERN.match(name):
+            raise ValidationError(
+                f"{where}: name '{name}' is invalid: must start with alphanumeric and contain only [a-zA-Z0-9_-], max 64 chars"
+            )
+        if name in seen:
+            raise ValidationError(f"{where}: duplicate name '{name}'")
+        seen.add(name)
+
+        try:
+            format_str = normalize_formats(values["format"]) if values["format"] is not None else defaults.format
+        except ValidationError as e:
+            raise ValidationError(f"{where}: {e}") from e
+        history = values["history"]
+        entries.append(
+            BatchEntry(
+                name=name,
+                plan=RunPlan(
+                    tests_path=base_dir / values["tests"],
+                    results_path=base_dir / values["results"],
+                    outdir=defaults.outdir / name,
+                    prefix=defaults.prefix,
+                    format=format_str,
+                    jobs=1,
+                    use_cache=defaults.use_cache,
+                    cache_dir=defaults.cache_dir,
+                    id_schemes=defaults.id_schemes,
+                    id_patterns=defaults.id_patterns,
+                    history_path=base_dir / history if history is not None else None,
+                    fail_on=defaults.fail_on,
+                ),
+            )
+        )
+    return entries
+
+
+def run_batch(
+    entries: Sequence[BatchEntry],
+    max_workers: int | None = None,
+    on_result: Callable[[BatchEntryResult], None] | None = None,
+) -> list[BatchEntryResult]:
+    """
+    Review every entry, in worker processes, and return the results in entry order.
+
+    Each worker imports the pipeline once and reviews many entries, so the
+    interpreter start and imports are not repeated per entry. A failing entry
+    (invalid input, unreadable file, crashed worker) is reported as a failed
+    BatchEntryResult and does not stop the batch. on_result is called in the
+    parent process as each entry finishes, in completion order. With
+    max_workers=1 everything runs in-process.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(entries)))
+
+    if max_workers == 1:
+        results = []
+        for entry in entries:
+            result = review_batch_entry(entry)
+            if on_result is not None:
+                on_result(result)
+            results.append(result)
+        return results
+
+    results: list[BatchEntryResult | None] = [None] * len(entries)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(review_batch_entry, entry): i for i, entry in enumerate(entries)}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:  # the worker process died
+                result = BatchEntryResult(name=entries[i].name, ok=False, error=f"{type(e).__name__}: {e}")
+            if on_result is not None:
+                on_result(result)
+            results[i] = result
+    return results
+
+
+def review_batch_entry(entry: BatchEntry) -> BatchEntryResult:
+    """Review one entry and save its reports; errors are captured in the result."""
+    # Imported here so that loading a manifest does not import the pipeline.
+    from core.control.runner import execute_run_plan
+
+    start = time.perf_counter()
+    try:
+        output, reports = execute_run_plan(entry.plan)
+    except (ValidationError, IngestionError, OSError) as e:
+        return BatchEntryResult(name=entry.name, ok=False, error=str(e), elapsed_sec=time.perf_counter() - start)
+    except Exception as e:  # keep the batch going on unexpected errors too
+        return BatchEntryResult(
+            name=entry.name, ok=False, error=f"{type(e).__name__}: {e}", elapsed_sec=time.perf_counter() - start
+        )
+    return BatchEntryResult(
+        name=entry.name,
+        ok=True,
+        score=output["score"],
+        risk=output["risk"],
+        reports=reports,
+        elapsed_sec=time.perf_counter() - start,
+    )
+
+
+def write_batch_index(results: Sequence[BatchEntryResult], output_dir: str | Path) -> dict[str, str]:
+    """
+    Write the combined batch index as JSON and Markdown into output_dir.
+
+    Both list every entry with its score, risk, report paths (relative to
+    output_dir) or error. Returns the absolute path of each index by format.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    def relative(report_path: str) -> str:
+        return Path(os.path.relpath(report_path, output_dir)).as_posix()
+
+    entries = [
+        {
+            "name": r.name,
+            "ok": r.ok,
+            "score": r.score,
+            "risk": r.risk,
+            "reports": {fmt: relative(p) for fmt, p in r.reports.items()},
+            "error": r.error,
+            "elapsed_sec": round(r.elapsed_sec, 3),
+        }
+        for r in results
+    ]
+    succeeded = sum(1 for r in results if r.ok)
+    index = {"entries": entries, "succeeded": succeeded, "failed": len(results) - succeeded}
+
+    lines = [
+        "# Batch QA Risk Review",
+        "",
+        f"{succeeded} of {len(results)} review(s) succeeded.",
+        "",
+        "| Name | Score | Risk | Reports | Error |",
+        "|---|---|---|---|---|",
+    ]
+    for entry in entries:
+        links = ", ".join(f"[{fmt}]({p})" for fmt, p in entry["reports"].items())
+        error = (entry["error"] or "").replace("|", "\\|").replace("\n", " ")
+        score = "-" if entry["score"] is None else str(entry["score"])
+        lines.append(f"| {entry['name']} | {score} | {entry['risk'] or '-'} | {links or '-'} | {error or '-'} |")
+
+    json_path = output_dir / f"{INDEX_NAME}.json"
+    md_path = output_dir / f"{INDEX_NAME}.md"
+    json_path.write_text(json.dumps(index, indent=2), encoding="utf-8")
+    md_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return {"json": str(json_path.resolve()), "md": str(md_path.resolve())}
+
+
+def _read_manifest_rows(path: Path) -> list:
+    try:
+        with open(path, encoding="utf-8", newline="") as f:
+            if path.suffix.lower() == ".csv":
+                return list(csv.DictReader(f))
+            data = json.load(f)
+    except FileNotFoundError as e:
+        raise IngestionError(f"manifest '{path}': file not found") from e
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        raise IngestionError(f"manifest '{path}': unable to read file ({e})") from e
+    except json.JSONDecodeError as e:
+        raise IngestionError(f"manifest '{path}': invalid JSON ({e})") from e
+    if not isinstance(data, list):
+        raise ValidationError(f"manifest '{path}': expected a JSON list of entries")
+    return data
@@ -2,14 +2,29 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
 import sys
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
-from core.errors import ValidationError
+from core.errors import IngestionError, ValidationError
 
-_PREFIX_PATTERN = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9_-]{0,63}$")
+# Report prefixes, batch entry names and service catalog names.
+PREFIX_PATTERN = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9_-]{0,63}$")
+
+# Mirrors core.ingestion.id_extraction.BUILTIN_ID_SCHEMES (kept here so parsing
+# arguments does not import the ingestion stack).
+_ID_SCHEMES = ("tc", "jira", "testrail", "classname")
+
+# Mirrors the built-in core.reporting.REPORT_FORMATS (kept here for the same reason).
+_REPORT_FORMATS = ("md", "json", "html", "junit")
+
+# Risk levels in increasing order, as accepted by --fail-on.
+_RISK_LEVELS = ("low", "medium", "high")
+
+# Exit code of a run whose risk level meets --fail-on.
+EXIT_RISK_GATE = 1
 
 
 @dataclass(frozen=True, slots=True)
@@ -20,11 +35,66 @@ class RunPlan:
     results_path: Path
     outdir: Path
     prefix: str
-    format: str  # for now fixed to "md" but present for future compatibility
+    format: str  # comma-separated report formats, e.g. "md,json"
+    jobs: int = 1
+    use_cache: bool = True
+    cache_dir: Path | None = None  # None -> default per-user cache directory
+    id_schemes: tuple[str, ...] = ("tc",)
+    id_patterns: tuple[str, ...] = ()
+    history_path: Path | None = None  # None -> run history is not recorded
+    baseline: str | None = None  # JUnit results spec, or a run id in history_path
+    fail_on: str | None = None  # risk level ("medium" or "high") that fails the run
+    dry_run: bool = False  # print the plan instead of running it
+
+    @property
+    def formats(self) -> tuple[str, ...]:
+        """Report formats to emit, in order."""
+        return tuple(self.format.split(","))
+
+
+@dataclass(frozen=True, slots=True)
+class SweepPlan:
+    """CLI contract for a what-if sweep of scoring configs over historical runs."""
+
+    runs_path: Path
+    grid_path: Path
+    format: str = "table"
+
+
+@dataclass(frozen=True, slots=True)
+class BatchPlan:
+    """CLI contract for reviewing many (tests, results) pairs listed in a manifest."""
+
+    manifest_path: Path
+    outdir: Path
+    jobs: int  # worker processes, one entry per process at a time
+    defaults: RunPlan  # settings shared by all entries (paths are placeholders)
+
+
+@dataclass(frozen=True, slots=True)
+class WatchPlan:
+    """CLI contract for re-scoring a results directory as JUnit files land in it."""
+
+    run: RunPlan  # catalog, results directory or glob, reports and id options
+    interval: float = 2.0  # seconds between polls
+    debounce: float = 10.0  # minimum seconds between report updates
+    timeout: float | None = None  # stop after this many seconds (None -> until interrupted)
+
+
+@dataclass(frozen=True, slots=True)
+class DiffPlan:
+    """CLI contract for comparing a candidate run against a baseline run."""
+
+    baseline: str  # JUnit results spec, or a run id when history_path is set
+    candidate: str
+    history_path: Path | None = None
+    format: str = "text"
+    id_schemes: tuple[str, ...] = ("tc",)
+    id_patterns: tuple[str, ...] = ()
 
 
 def build_parser() -> argparse.ArgumentParser:
-    """Build the argument parser with 'run' subcommand."""
+    """Build the argument parser with 'run', 'batch', 'watch', 'sweep' and 'diff' subcommands."""
     parser = argparse.ArgumentParser(description="QA review command-line interface")
     subparsers = parser.add_subparsers(dest="command", help="Available commands", required=True)
 
@@ -37,7 +107,7 @@ def build_parser() -> argparse.ArgumentParser:
     run_parser.add_argument(
         "--results",
         required=True,
-        help="Path to test results file (JUnit XML)",
+        help="Path to test results file, directory or glob of shards (JUnit XML)",
     )
     run_parser.add_argument(
         "--outdir",
@@ -51,10 +121,161 @@ def build_parser() -> argparse.ArgumentParser:
     )
     run_parser.add_argument(
         "--format",
-        choices=["md"],
         default="md",
-        help="Output format (default: md)",
+        help=f"Comma-separated report formats: {', '.join(_REPORT_FORMATS)} (default: md)",
+    )
+    run_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for parsing JUnit shards in parallel (default: 1)",
+    )
+    add_input_options(run_parser)
+    run_parser.add_argument(
+        "--history",
+        default=None,
+        help="SQLite database to append this run to for trend analysis (default: not recorded)",
+    )
+    run_parser.add_argument(
+        "--baseline",
+        default=None,
+        help="Baseline JUnit results (file, directory or glob), or a run id in --history, to report changes against",
+    )
+    run_parser.add_argument(
+        "--fail-on",
+        choices=_RISK_LEVELS[1:],
+        default=None,
+        help=f"Exit with code {EXIT_RISK_GATE} if the risk level is at or above this level (default: never)",
+    )
+    run_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Validate the arguments and print the run plan as JSON without running it",
+    )
+
+    batch_parser = subparsers.add_parser("batch", help="Run QA review for every entry of a manifest")
+    batch_parser.add_argument(
+        "--manifest",
+        required=True,
+        help="JSON list or CSV of entries with name, tests, results and optional format and history",
+    )
+    batch_parser.add_argument(
+        "--outdir",
+        default="reports",
+        help="Output directory; each entry's reports go to <outdir>/<name> (default: reports)",
+    )
+    batch_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Entries reviewed in parallel worker processes (default: number of CPUs)",
+    )
+    batch_parser.add_argument(
+        "--format",
+        default="md",
+        help=f"Comma-separated report formats for entries without one: {', '.join(_REPORT_FORMATS)} (default: md)",
+    )
+    add_input_options(batch_parser)
+    batch_parser.add_argument(
+        "--fail-on",
+        choices=_RISK_LEVELS[1:],
+        default=None,
+        help=f"Exit with code {EXIT_RISK_GATE} if any entry's risk level is at or above this level (default: never)",
+    )
+
+    watch_parser = subparsers.add_parser("watch", help="Re-score a results directory as JUnit files land in it")
+    watch_parser.add_argument(
+        "--tests",
+        required=True,
+        help="Path to test cases file (CSV)",
+    )
+    watch_parser.add_argument(
+        "--results",
+        required=True,
+        help="Directory or glob of JUnit XML shards to watch",
+    )
+    watch_parser.add_argument(
+        "--outdir",
+        default="reports",
+        help="Output directory for reports (default: reports)",
+    )
+    watch_parser.add_argument(
+        "--prefix",
+        default="live_report",
+        help="Filename prefix; reports are rewritten in place as <prefix>.<ext> (default: live_report)",
+    )
+    watch_parser.add_argument(
+        "--format",
+        default="md",
+        help=f"Comma-separated report formats: {', '.join(_REPORT_FORMATS)} (default: md)",
+    )
+    watch_parser.add_argument(
+        "--interval",
+        type=float,
+        default=2.0,
+        help="Seconds between polls of the results directory (default: 2)",
+    )
+    watch_parser.add_argument(
+        "--debounce",
+        type=float,
+        default=10.0,
+        help="Minimum seconds between report updates (default: 10)",
+    )
+    watch_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Stop watching after this many seconds (default: until interrupted)",
+    )
+    add_input_options(watch_parser)
+    watch_parser.add_argument(
+        "--fail-on",
+        choices=_RISK_LEVELS[1:],
+        default=None,
+        help=f"Exit with code {EXIT_RISK_GATE} if the final risk level is at or above this level (default: never)",
+    )
+
+    sweep_parser = subparsers.add_parser("sweep", help="Re-score historical runs under a grid of scoring configs")
+    sweep_parser.add_argument(
+        "--runs",
+        required=True,
+        help="JSON list of run metrics (or pipeline outputs with a 'metrics' object)",
+    )
+    sweep_parser.add_argument(
+        "--grid",
+        required=True,
+        help="JSON object mapping ScoringConfig fields to candidate values",
     )
+    sweep_parser.add_argument(
+        "--format",
+        choices=["table", "json"],
+        default="table",
+        help="Output format (default: table)",
+    )
+
+    diff_parser = subparsers.add_parser("diff", help="Compare a candidate run against a baseline run")
+    diff_parser.add_argument(
+        "--baseline",
+        required=True,
+        help="Baseline JUnit results (file, directory or glob), or a run id with --history",
+    )
+    diff_parser.add_argument(
+        "--candidate",
+        required=True,
+        help="Candidate JUnit results (file, directory or glob), or a run id with --history",
+    )
+    diff_parser.add_argument(
+        "--history",
+        default=None,
+        help="SQLite run history database; --baseline and --candidate are then run ids",
+    )
+    diff_parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format (default: text)",
+    )
+    add_input_options(diff_parser, cache=False)
 
     return parser
 
@@ -72,7 +293,60 @@ def parse_run_plan(argv: list[str]) -> RunPlan:
     except SystemExit:
         # Re-raise SystemExit from argparse (e.g., for malformed arguments like --prefix -invalid)
         raise
+    if args.command != "run":
+        raise ValidationError(f"expected the 'run' command (got '{args.command}')")
+    return _run_plan_from_args(args)
+
+
+def parse_sweep_plan(argv: list[str]) -> SweepPlan:
+    """
+    Parse command-line arguments for the 'sweep' command into a SweepPlan.
+
+    Raises ValidationError / SystemExit as parse_run_plan.
+    """
+    args = build_parser().parse_args(argv)
+    if args.command != "sweep":
+        raise ValidationError(f"expected the 'sweep' command (got '{args.command}')")
+    return _sweep_plan_from_args(args)
+
+
+def parse_batch_plan(argv: list[str]) -> BatchPlan:
+    """
+    Parse command-line arguments for the 'batch' command into a BatchPlan.
+
+    Raises ValidationError / SystemExit as parse_run_plan.
+    """
+    args = build_parser().parse_args(argv)
+    if args.command != "batch":
+        raise ValidationError(f"expected the 'batch' command (got '{args.command}')")
+    return _batch_plan_from_args(args)
+
+
+def parse_watch_plan(argv: list[str]) -> WatchPlan:
+    """
+    Parse command-line arguments for the 'watch' command into a WatchPlan.
 
+    Raises ValidationError / SystemExit as parse_run_plan.
+    """
+    args = build_parser().parse_args(argv)
+    if args.command != "watch":
+        raise ValidationError(f"expected the 'watch' command (got '{args.command}')")
+    return _watch_plan_from_args(args)
+
+
+def parse_diff_plan(argv: list[str]) -> DiffPlan:
+    """
+    Parse command-line arguments for the 'diff' command into a DiffPlan.
+
+    Raises ValidationError / SystemExit as parse_run_plan.
+    """
+    args = build_parser().parse_args(argv)
+    if args.command != "diff":
+        raise ValidationError(f"expected the 'diff' command (got '{args.command}')")
+    return _diff_plan_from_args(args)
+
+
+def _run_plan_from_args(args: argparse.Namespace) -> RunPlan:
     # Validate tests_path
     tests_str = args.tests
     if not tests_str or not tests_str.strip():
@@ -93,12 +367,38 @@ def parse_run_plan(argv: list[str]) -> RunPlan:
 
     # Validate prefix
     prefix = args.prefix
-    if not _PREFIX_PATTERN.match(prefix):
+    if not PREFIX_PATTERN.match(prefix):
         raise ValidationError(
             f"prefix '{prefix}' is invalid: must start with alphanumeric and contain only [a-zA-Z0-9_-], max 64 chars"
         )
 
-    format_str = args.format
+    format_str = normalize_formats(args.format)
+
+    # Validate jobs
+    jobs = args.jobs
+    if jobs < 1:
+        raise ValidationError(f"jobs must be >= 1 (got {jobs})")
+
+    # Validate cache_dir
+    cache_dir = cache_dir_from_args(args)
+
+    # Validate id extraction
+    id_schemes, id_patterns = id_options_from_args(args)
+
+    # Validate history_path
+    history_path: Path | None = None
+    if args.history is not None:
+        if not args.history.strip():
+            raise ValidationError("history path must be non-empty")
+        history_path = Path(args.history)
+
+    # Validate baseline: a run id when --history is given and it is numeric,
+    # otherwise JUnit results
+    baseline = args.baseline
+    if baseline is not None:
+        baseline = baseline.strip()
+        if not baseline:
+            raise ValidationError("baseline must be non-empty")
 
     return RunPlan(
         tests_path=tests_path,
@@ -106,35 +406,393 @@ def parse_run_plan(argv: list[str]) -> RunPlan:
         outdir=outdir,
         prefix=prefix,
         format=format_str,
+        jobs=jobs,
+        use_cache=not args.no_cache,
+        cache_dir=cache_dir,
+        id_schemes=id_schemes,
+        id_patterns=id_patterns,
+        history_path=history_path,
+        baseline=baseline,
+        fail_on=args.fail_on,
+        dry_run=args.dry_run,
+    )
+
+
+def _batch_plan_from_args(args: argparse.Namespace) -> BatchPlan:
+    if not args.manifest or not args.manifest.strip():
+        raise ValidationError("manifest path must be non-empty")
+    if not args.outdir or not args.outdir.strip():
+        raise ValidationError("outdir must be non-empty")
+    outdir = Path(args.outdir)
+
+    jobs = args.jobs if args.jobs is not None else (os.cpu_count() or 1)
+    if jobs < 1:
+        raise ValidationError(f"jobs must be >= 1 (got {jobs})")
+
+    id_schemes, id_patterns = id_options_from_args(args)
+    defaults = RunPlan(
+        tests_path=Path(),
+        results_path=Path(),
+        outdir=outdir,
+        prefix="pre_release_report",
+        format=normalize_formats(args.format),
+        use_cache=not args.no_cache,
+        cache_dir=cache_dir_from_args(args),
+        id_schemes=id_schemes,
+        id_patterns=id_patterns,
+        fail_on=args.fail_on,
+    )
+    return BatchPlan(manifest_path=Path(args.manifest), outdir=outdir, jobs=jobs, defaults=defaults)
+
+
+def _watch_plan_from_args(args: argparse.Namespace) -> WatchPlan:
+    for name in ("tests", "results", "outdir"):
+        value = getattr(args, name)
+        if not value or not value.strip():
+            raise ValidationError(f"{name} must be non-empty")
+    if not PREFIX_PATTERN.match(args.prefix):
+        raise ValidationError(
+            f"prefix '{args.prefix}' is invalid: must start with alphanumeric and contain only [a-zA-Z0-9_-], max 64 chars"
+        )
+    if not args.interval > 0:
+        raise ValidationError(f"interval must be > 0 (got {args.interval})")
+    if not args.debounce >= 0:
+        raise ValidationError(f"debounce must be >= 0 (got {args.debounce})")
+    if args.timeout is not None and not args.timeout > 0:
+        raise ValidationError(f"timeout must be > 0 (got {args.timeout})")
+
+    id_schemes, id_patterns = id_options_from_args(args)
+    run = RunPlan(
+        tests_path=Path(args.tests),
+        results_path=Path(args.results),
+        outdir=Path(args.outdir),
+        prefix=args.prefix,
+        format=normalize_formats(args.format),
+        use_cache=not args.no_cache,
+        cache_dir=cache_dir_from_args(args),
+        id_schemes=id_schemes,
+        id_patterns=id_patterns,
+        fail_on=args.fail_on,
+    )
+    return WatchPlan(run=run, interval=args.interval, debounce=args.debounce, timeout=args.timeout)
+
+
+def _sweep_plan_from_args(args: argparse.Namespace) -> SweepPlan:
+    if not args.runs or not args.runs.strip():
+        raise ValidationError("runs path must be non-empty")
+    if not args.grid or not args.grid.strip():
+        raise ValidationError("grid path must be non-empty")
+    return SweepPlan(runs_path=Path(args.runs), grid_path=Path(args.grid), format=args.format)
+
+
+def _diff_plan_from_args(args: argparse.Namespace) -> DiffPlan:
+    for name in ("baseline", "candidate"):
+        value = getattr(args, name)
+        if not value or not value.strip():
+            raise ValidationError(f"{name} must be non-empty")
+
+    history_path: Path | None = None
+    if args.history is not None:
+        if not args.history.strip():
+            raise ValidationError("history path must be non-empty")
+        history_path = Path(args.history)
+        for name in ("baseline", "candidate"):
+            value = getattr(args, name)
+            if not value.isdigit():
+                raise ValidationError(f"{name} must be a run id with --history (got '{value}')")
+
+    id_schemes, id_patterns = id_options_from_args(args)
+    return DiffPlan(
+        baseline=args.baseline,
+        candidate=args.candidate,
+        history_path=history_path,
+        format=args.format,
+        id_schemes=id_schemes,
+        id_patterns=id_patterns,
+    )
+
+
+def normalize_formats(value: str) -> str:
+    """
+    Validate a comma-separated list of report formats.
+
+    Returns it without blanks and duplicates (order is kept); raises
+    ValidationError for unknown formats.
+    """
+    formats = [name.strip() for name in value.split(",")]
+    for name in formats:
+        if name not in _REPORT_FORMATS:
+            raise ValidationError(
+                f"format '{value}' is invalid: expected a comma-separated list of {', '.join(_REPORT_FORMATS)}"
+            )
+    return ",".join(dict.fromkeys(formats))
+
+
+def meets_risk_gate(risk: str, fail_on: str | None) -> bool:
+    """Return True if a risk level ("Low", "Medium", "High") is at or above fail_on."""
+    return fail_on is not None and _RISK_LEVELS.index(risk.lower()) >= _RISK_LEVELS.index(fail_on)
+
+
+def add_input_options(parser: argparse.ArgumentParser, cache: bool = True) -> None:
+    """
+    Add the test id options (--id-scheme, --id-pattern) and, with cache, the
+    parse cache options (--no-cache, --cache-dir) to a parser.
+
+    Read them back with id_options_from_args and cache_dir_from_args.
+    """
+    if cache:
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Always re-parse inputs instead of using the on-disk parse cache",
+        )
+        parser.add_argument(
+            "--cache-dir",
+            default=None,
+            help="Directory for the parse cache (default: $XDG_CACHE_HOME/qa_review)",
+        )
+    parser.add_argument(
+        "--id-scheme",
+        action="append",
+        choices=_ID_SCHEMES,
+        default=None,
+        help="Test id scheme to extract from testcase names; repeatable (default: tc)",
+    )
+    parser.add_argument(
+        "--id-pattern",
+        action="append",
+        default=None,
+        help="Custom regex for test ids; a group named 'id' selects part of the match. Repeatable",
+    )
+
+
+def cache_dir_from_args(args: argparse.Namespace) -> Path | None:
+    """Return the validated --cache-dir (None for the default cache directory)."""
+    if args.cache_dir is None:
+        return None
+    if not args.cache_dir.strip():
+        raise ValidationError("cache dir must be non-empty")
+    return Path(args.cache_dir)
+
+
+def id_options_from_args(args: argparse.Namespace) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Return the validated (id_schemes, id_patterns) of --id-scheme and --id-pattern.
+
+    Raises ValidationError for patterns that do not compile together.
+    """
+    id_schemes = tuple(args.id_scheme) if args.id_scheme else ("tc",)
+    id_patterns = tuple(args.id_pattern or ())
+    if id_patterns:
+        # Custom patterns are validated the way they will run: combined into
+        # one alternation. Imported only then, to keep startup light.
+        from core.ingestion.id_extraction import IdExtractor
+
+        IdExtractor.from_schemes(id_schemes, id_patterns)
+    return id_schemes, id_patterns
+
+
+def _run_review(plan: RunPlan) -> int:
+    # Imported here so that --help, argument validation and --dry-run do not
+    # load the ingestion, scoring and reporting stacks.
+    from core.control.runner import execute_run_plan
+
+    output, paths = execute_run_plan(plan)
+    print(f"Score: {output['score']} / 100 ({output['risk']} risk)")
+    for path in paths.values():
+        print(f"Report saved: {path}")
+    if "run_id" in output:
+        print(f"Run recorded in history: {plan.history_path} (run {output['run_id']})")
+
+    if meets_risk_gate(output["risk"], plan.fail_on):
+        print(f"Error: risk level {output['risk']} meets --fail-on {plan.fail_on}", file=sys.stderr)
+        return EXIT_RISK_GATE
+    return 0
+
+
+def _run_batch(plan: BatchPlan) -> int:
+    # Imported here so that parsing arguments stays lightweight; the pipeline
+    # itself is only imported by the worker processes.
+    from core.control.batch import load_batch_manifest, run_batch, write_batch_index
+
+    entries = load_batch_manifest(plan.manifest_path, plan.defaults)
+
+    def report(result) -> None:
+        if result.ok:
+            print(f"[ok] {result.name}: score {result.score} / 100 ({result.risk} risk)")
+        else:
+            print(f"[failed] {result.name}: {result.error}")
+
+    results = run_batch(entries, max_workers=plan.jobs, on_result=report)
+    index_paths = write_batch_index(results, plan.outdir)
+    failed = [r.name for r in results if not r.ok]
+    gated = [r.name for r in results if r.ok and meets_risk_gate(r.risk, plan.defaults.fail_on)]
+    print(f"{len(results) - len(failed)} of {len(results)} review(s) succeeded; index: {index_paths['md']}")
+
+    if failed:
+        print(f"Error: {len(failed)} review(s) failed: {', '.join(failed)}", file=sys.stderr)
+        return 2
+    if gated:
+        print(f"Error: risk level meets --fail-on {plan.defaults.fail_on} for: {', '.join(gated)}", file=sys.stderr)
+        return EXIT_RISK_GATE
+    return 0
+
+
+def _run_watch(plan: WatchPlan) -> int:
+    # Imported here so that parsing arguments stays lightweight.
+    from datetime import datetime
+
+    from core.control.watch import ResultsWatcher, watch_results
+    from core.ingestion.cache import ParseCache, default_cache_dir
+    from core.ingestion.id_extraction import IdExtractor
+    from core.pipeline import Pipeline
+    from core.reporting.exporter import save_reports
+
+    run = plan.run
+    cache = ParseCache(run.cache_dir or default_cache_dir()) if run.use_cache else None
+    pipeline = Pipeline.from_csv(
+        str(run.tests_path), cache=cache, id_extractor=IdExtractor.from_schemes(run.id_schemes, run.id_patterns)
     )
+    watcher = ResultsWatcher(pipeline, str(run.results_path))
+    print(f"Watching {run.results_path} (Ctrl-C to stop)", flush=True)
+
+    announced = False
+
+    def update(output: dict) -> None:
+        nonlocal announced
+        paths = save_reports(
+            output["report"], formats=run.formats, output_dir=str(run.outdir), prefix=run.prefix, timestamped=False
+        )
+        pending = f", {len(watcher.pending)} incomplete" if watcher.pending else ""
+        print(
+            f"[{datetime.now():%H:%M:%S}] Score: {output['score']} / 100 ({output['risk']} risk) - "
+            f"{watcher.results} result(s) from {watcher.files} file(s){pending}",
+            flush=True,
+        )
+        if not announced:
+            for path in paths.values():
+                print(f"Report updated in place: {path}", flush=True)
+            announced = True
+
+    output = watch_results(watcher, update, interval=plan.interval, debounce=plan.debounce, timeout=plan.timeout)
+
+    if output is None:
+        print(f"Error: no JUnit results were read from {run.results_path}", file=sys.stderr)
+        return 2
+    if meets_risk_gate(output["risk"], run.fail_on):
+        print(f"Error: risk level {output['risk']} meets --fail-on {run.fail_on}", file=sys.stderr)
+        return EXIT_RISK_GATE
+    return 0
+
+
+def _run_sweep(plan: SweepPlan) -> int:
+    # Imported here so that parsing arguments stays lightweight.
+    from pack.sweep import format_sweep_table, load_config_grid, load_sweep_runs, sweep_configs
+
+    runs = load_sweep_runs(plan.runs_path)
+    configs, varied_fields = load_config_grid(plan.grid_path)
+    results = sweep_configs(runs, configs)
+    if plan.format == "json":
+        print(json.dumps([
+            {
+                "config": asdict(r.config),
+                "runs": r.runs,
+                "low": r.low,
+                "medium": r.medium,
+                "high": r.high,
+                "mean_score": r.mean_score,
+            }
+            for r in results
+        ]))
+    else:
+        print(format_sweep_table(results, varied_fields))
+    return 0
+
+
+def _run_diff(plan: DiffPlan) -> int:
+    # Imported here so that parsing arguments stays lightweight.
+    from core.reasoning.diff import DIFF_CATEGORIES, diff_history_runs, diff_results
+
+    if plan.history_path is not None:
+        from core.history.store import RunHistoryStore
+
+        with RunHistoryStore(plan.history_path) as store:
+            diff = diff_history_runs(store, int(plan.baseline), int(plan.candidate))
+    else:
+        from core.ingestion.id_extraction import IdExtractor
+        from core.ingestion.junit_loader import load_junit_result_batch_many, resolve_junit_paths
+
+        id_extractor = IdExtractor.from_schemes(plan.id_schemes, plan.id_patterns)
+        diff = diff_results(
+            load_junit_result_batch_many(resolve_junit_paths(plan.baseline), max_workers=1, id_extractor=id_extractor),
+            load_junit_result_batch_many(resolve_junit_paths(plan.candidate), max_workers=1, id_extractor=id_extractor),
+        )
+
+    if plan.format == "json":
+        print(json.dumps(diff))
+    else:
+        print(f"baseline: {diff['baseline_tests']} tests, candidate: {diff['candidate_tests']} tests")
+        for category in DIFF_CATEGORIES:
+            ids = diff[category]
+            print(f"{category} ({len(ids)}){': ' + ', '.join(ids) if ids else ''}")
+    return 0
 
 
 def main(argv: list[str] | None = None) -> int:
     """
     CLI entry point for QA review.
 
-    On success: prints JSON to stdout and returns 0.
-    On validation error: prints error message to stderr and returns 2.
+    run: loads the inputs, scores them and saves the report in each requested
+    format; returns 0, or EXIT_RISK_GATE if the risk level meets --fail-on.
+    With --dry-run it only prints the validated plan as JSON and returns 0.
+    batch: reviews every manifest entry, writes the batch index and returns 0,
+    2 if any entry failed, or EXIT_RISK_GATE if any entry meets --fail-on.
+    watch: re-scores a results directory as files land in it, rewriting the
+    reports in place; returns 0, EXIT_RISK_GATE if the final risk level meets
+    --fail-on, or 2 if no results were read.
+    sweep: prints the risk distribution per config and returns 0.
+    diff: prints the changes between a baseline and a candidate run and returns 0.
+    On validation or input error: prints error message to stderr and returns 2.
     On parsing error: returns 2 (argparse prints usage).
     """
     if argv is None:
         argv = sys.argv[1:]
 
     try:
-        run_plan = parse_run_plan(argv)
+        args = build_parser().parse_args(argv)
+        if args.command == "batch":
+            return _run_batch(_batch_plan_from_args(args))
+        if args.command == "watch":
+            return _run_watch(_watch_plan_from_args(args))
+        if args.command == "sweep":
+            return _run_sweep(_sweep_plan_from_args(args))
+        if args.command == "diff":
+            return _run_diff(_diff_plan_from_args(args))
+
+        run_plan = _run_plan_from_args(args)
+        if not run_plan.dry_run:
+            return _run_review(run_plan)
         output = {
             "tests": str(run_plan.tests_path),
             "results": str(run_plan.results_path),
             "outdir": str(run_plan.outdir),
             "prefix": run_plan.prefix,
             "format": run_plan.format,
+            "jobs": run_plan.jobs,
+            "use_cache": run_plan.use_cache,
+            "cache_dir": str(run_plan.cache_dir) if run_plan.cache_dir is not None else None,
+            "id_schemes": list(run_plan.id_schemes),
+            "id_patterns": list(run_plan.id_patterns),
+            "history": str(run_plan.history_path) if run_plan.history_path is not None else None,
+            "baseline": run_plan.baseline,
+            "fail_on": run_plan.fail_on,
         }
         print(json.dumps(output))
         return 0
-    except ValidationError as e:
+    except (ValidationError, IngestionError) as e:
         print(f"Error: {e}", file=sys.stderr)
         return 2
     except SystemExit as e:
-        # argparse raises SystemExit on parse errors
-        return 2
+        # argparse raises SystemExit on parse errors, and with code 0 after --help
+        return 0 if e.code == 0 else 2
 
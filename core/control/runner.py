@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+
+from core.control.cli_contract import RunPlan
+from core.history.store import RunHistoryStore
+from core.ingestion.cache import ParseCache, default_cache_dir
+from core.ingestion.id_extraction import IdExtractor
+from core.ingestion.junit_loader import load_junit_result_batch_many, resolve_junit_paths
+from core.normalization.models import ResultBatch
+from core.pipeline import run_pipeline_async
+from core.reporting.exporter import save_reports
+
+
+def execute_run_plan(plan: RunPlan) -> tuple[dict, dict[str, str]]:
+    """
+    Run the review described by a RunPlan and save its reports.
+
+    Returns the pipeline output and the saved report path per format (see
+    save_reports). Raises ValidationError / IngestionError for invalid inputs.
+    """
+    cache = ParseCache(plan.cache_dir or default_cache_dir()) if plan.use_cache else None
+    id_extractor = IdExtractor.from_schemes(plan.id_schemes, plan.id_patterns)
+    history = RunHistoryStore(plan.history_path) if plan.history_path is not None else None
+    try:
+        baseline = _load_baseline(plan, history, id_extractor)
+        output = asyncio.run(
+            run_pipeline_async(
+                str(plan.tests_path),
+                str(plan.results_path),
+                max_workers=plan.jobs,
+                cache=cache,
+                id_extractor=id_extractor,
+                history=history,
+                baseline=baseline,
+            )
+        )
+    finally:
+        if history is not None:
+            history.close()
+
+    paths = save_reports(output["report"], formats=plan.formats, output_dir=str(plan.outdir), prefix=plan.prefix)
+    return output, paths
+
+
+def _load_baseline(plan: RunPlan, history: RunHistoryStore | None, id_extractor: IdExtractor) -> ResultBatch | None:
+    # With a history store a numeric baseline is a stored run id, as for diff
+    # (read before this run is recorded), anything else is JUnit results.
+    if plan.baseline is None:
+        return None
+    if history is not None and plan.baseline.isdigit():
+        return history.run_results(int(plan.baseline))
+    return load_junit_result_batch_many(
+        resolve_junit_paths(plan.baseline), max_workers=plan.jobs, id_extractor=id_extractor
+    )
@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import BinaryIO
+from urllib.parse import parse_qs, urlsplit
+
+from core.errors import IngestionError, ValidationError
+from core.ingestion.cache import ParseCache
+from core.ingestion.id_extraction import IdExtractor
+from core.ingestion.junit_loader import iter_junit_result_models_stream
+from core.pipeline import Pipeline, RunAccumulators
+from core.reporting.renderers import get_report_format
+from pack.config import ScoringConfig
+
+# Content type of each built-in report format, by file extension.
+_CONTENT_TYPES = {
+    ".md": "text/markdown; charset=utf-8",
+    ".json": "application/json",
+    ".html": "text/html; charset=utf-8",
+    ".xml": "application/xml",
+}
+
+# Seconds a rejected client is asked to wait before retrying.
+RETRY_AFTER_SEC = 1
+
+# Largest request body accepted (after gzip decoding).
+DEFAULT_MAX_BODY_BYTES = 256 << 20
+
+# Seconds a connection may stall (mid-body or idle between requests) before it is dropped.
+READ_TIMEOUT_SEC = 30.0
+
+
+class ReviewService:
+    """
+    Warm catalogs and admission control shared by all request threads.
+
+    Each catalog is loaded and indexed once into a Pipeline, so a review only
+    parses and folds the posted results. At most max_workers + max_queue
+    reviews are admitted at a time; try_admit fails beyond that, and the HTTP
+    handler answers 429 without reading the request body. An admitted review
+    parses its body as it arrives (see fold) and holds one of the max_workers
+    worker slots only to score and render the folded results, so slow uploads
+    never hold a worker. Bodies larger than max_body_bytes are rejected with 413.
+    """
+
+    def __init__(
+        self,
+        pipelines: Mapping[str, Pipeline],
+        max_workers: int = 4,
+        max_queue: int = 16,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+    ) -> None:
+        if max_workers < 1:
+            raise ValidationError(f"max_workers must be >= 1, got {max_workers}")
+        if max_queue < 0:
+            raise ValidationError(f"max_queue must be >= 0, got {max_queue}")
+        if max_body_bytes < 1:
+            raise ValidationError(f"max_body_bytes must be >= 1, got {max_body_bytes}")
+        self.pipelines = dict(pipelines)
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.max_body_bytes = max_body_bytes
+        self._workers = threading.Semaphore(max_workers)
+        self._lock = threading.Lock()
+        self._admitted = 0
+
+    @classmethod
+    def from_catalog_files(
+        cls,
+        catalogs: Mapping[str, str],
+        cache: ParseCache | None = None,
+        config: ScoringConfig | None = None,
+        id_extractor: IdExtractor | None = None,
+        max_workers: int = 4,
+        max_queue: int = 16,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+    ) -> ReviewService:
+        """Load each catalog CSV (name -> path) into a warm Pipeline."""
+        pipelines = {
+            name: Pipeline.from_csv(path, cache=cache, config=config, id_extractor=id_extractor)
+            for name, path in catalogs.items()
+        }
+        return cls(pipelines, max_workers=max_workers, max_queue=max_queue, max_body_bytes=max_body_bytes)
+
+    @property
+    def in_flight(self) -> int:
+        """Reviews admitted and not yet finished (uploading, waiting for a worker or running)."""
+        return self._admitted
+
+    def try_admit(self) -> bool:
+        """Reserve a place for one review without blocking; False if the queue is full."""
+        with self._lock:
+            if self._admitted >= self.max_workers + self.max_queue:
+                return False
+            self._admitted += 1
+            return True
+
+    def release(self) -> None:
+        """Give back a place reserved by try_admit."""
+        with self._lock:
+            self._admitted -= 1
+
+    @contextmanager
+    def worker(self) -> Iterator[None]:
+        """Hold one of the max_workers worker slots, waiting for one if needed."""
+        with self._workers:
+            yield
+
+    def review(self, catalog: str, body: BinaryIO, source: str = "<request>") -> dict:
+        """
+        Evaluate a JUnit XML stream against a warm catalog; returns the run_pipeline dict.
+
+        The stream is parsed incrementally while the results are folded (see
+        fold), then scored (see evaluate). Raises ValidationError for unknown
+        catalogs and IngestionError for unreadable or invalid XML.
+        """
+        return self.evaluate(catalog, self.fold(catalog, body, source))
+
+    def fold(self, catalog: str, body: BinaryIO, source: str = "<request>") -> RunAccumulators:
+        """
+        Fold a JUnit XML stream into fresh accumulators for a warm catalog.
+
+        The stream is fed to the incremental parser chunk by chunk and each
+        result is folded as its testcase closes, so memory per review does not
+        grow with the body. Raises as review.
+        """
+        pipeline = self._pipeline(catalog)
+        return pipeline.accumulators().fold(iter_junit_result_models_stream(body, source, pipeline.id_extractor))
+
+    def evaluate(self, catalog: str, accumulators: RunAccumulators) -> dict:
+        """Score results folded by fold; returns the run_pipeline dict."""
+        return self._pipeline(catalog).evaluate_accumulated(accumulators)
+
+    def _pipeline(self, catalog: str) -> Pipeline:
+        pipeline = self.pipelines.get(catalog)
+        if pipeline is None:
+            raise ValidationError(f"unknown catalog '{catalog}' (expected one of: {sorted(self.pipelines)})")
+        return pipeline
+
+
+class ReviewServer(ThreadingHTTPServer):
+    """HTTP server (one thread per connection) bound to a ReviewService."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], service: ReviewService) -> None:
+        super().__init__(address, ReviewRequestHandler)
+        self.service = service
+
+
+class ReviewRequestHandler(BaseHTTPRequestHandler):
+    """
+    Routes of the review service.
+
+    GET /health: service status, catalogs and load.
+    POST /review/<catalog>[?format=json]: review the JUnit XML request body
+    (Content-Length or chunked, optionally Content-Encoding: gzip) and return
+    the report in the requested format (md, json, html or junit). The body is
+    fed to the XML parser as it arrives and a worker is taken only once it has
+    been read. Errors are JSON objects with an "error" message.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Socket timeout: a client stalling mid-body gets 408, an idle keep-alive
+    # connection is closed.
+    timeout = READ_TIMEOUT_SEC
+    # Headers and body are written separately; with Nagle's algorithm the body
+    # waits for the client's delayed ACK (~40 ms per keep-alive request).
+    disable_nagle_algorithm = True
+    server: ReviewServer
+
+    def do_GET(self) -> None:
+        if urlsplit(self.path).path != "/health":
+            self._send_error(404, f"no route for GET {self.path}")
+            return
+        service = self.server.service
+        self._send_json(
+            200,
+            {
+                "status": "ok",
+                "catalogs": sorted(service.pipelines),
+                "in_flight": service.in_flight,
+                "max_workers": service.max_workers,
+                "max_queue": service.max_queue,
+            },
+        )
+
+    def do_POST(self) -> None:
+        url = urlsplit(self.path)
+        route, _, catalog = url.path.strip("/").partition("/")
+        if route != "review" or not catalog or "/" in catalog:
+            self._send_error(404, f"no route for POST {self.path}")
+            return
+        service = self.server.service
+        if catalog not in service.pipelines:
+            self._send_error(404, f"unknown catalog '{catalog}' (expected one of: {sorted(service.pipelines)})")
+            return
+        try:
+            report_format = get_report_format(parse_qs(url.query).get("format", ["json"])[-1])
+        except ValidationError as e:
+            self._send_error(400, str(e))
+            return
+
+        # Admission happens before the body is read, so a full queue sheds load
+        # without spending any work on the rejected request.
+        if not service.try_admit():
+            self._send_error(
+                429, "review queue is full, retry later", headers={"Retry-After": str(RETRY_AFTER_SEC)}
+            )
+            return
+        try:
+            body = self._open_body(service.max_body_bytes)
+            if body is None:
+                return
+            # Parsing waits on the client, so it runs before taking a worker.
+            accumulators = service.fold(catalog, body, source=f"POST {url.path}")
+            with service.worker():
+                output = service.evaluate(catalog, accumulators)
+                payload = report_format.render(output["report"]).encode("utf-8")
+        except _BodyRejected as e:
+            self._send_error(e.status, str(e))
+            return
+        except (ValidationError, IngestionError) as e:
+            self._send_error(400, str(e))
+            return
+        except Exception as e:  # keep serving other requests on unexpected errors
+            self._send_error(500, f"{type(e).__name__}: {e}")
+            return
+        finally:
+            service.release()
+
+        content_type = _CONTENT_TYPES.get(report_format.extension, "text/plain; charset=utf-8")
+        self._send(200, payload, content_type)
+
+    def _open_body(self, max_bytes: int) -> BinaryIO | None:
+        """
+        Return the request body as a stream, or send an error and return None.
+
+        Nothing is buffered: reads come straight from the socket, decoding
+        chunked transfer and gzip on the way. Reading past max_bytes (counted
+        after gzip decoding) or stalling for READ_TIMEOUT_SEC raises
+        _BodyRejected.
+        """
+        encoding = self.headers.get("Content-Encoding", "identity").strip().lower()
+        if encoding not in ("identity", "gzip"):
+            self._send_error(415, f"unsupported Content-Encoding '{encoding}' (expected identity or gzip)")
+            return None
+
+        if self.headers.get("Transfer-Encoding", "").strip().lower() == "chunked":
+            body: BinaryIO = _ChunkedBody(self.rfile)
+        else:
+            length = self.headers.get("Content-Length")
+            if length is None:
+                self._send_error(411, "request body needs a Content-Length or chunked Transfer-Encoding")
+                return None
+            try:
+                body = _LengthBody(self.rfile, int(length))
+            except ValueError:
+                self._send_error(400, f"invalid Content-Length '{length}'")
+                return None
+            if encoding == "identity" and int(length) > max_bytes:
+                self._send_error(413, f"request body of {length} bytes exceeds the limit of {max_bytes} bytes")
+                return None
+        if encoding == "gzip":
+            body = gzip.GzipFile(fileobj=body, mode="rb")
+        return _BoundedBody(body, max_bytes)
+
+    def _send_error(self, status: int, message: str, headers: Mapping[str, str] | None = None) -> None:
+        # The body may be partly unread; closing the connection keeps the next
+        # request on it from being parsed out of leftover body bytes.
+        self.close_connection = True
+        self._send_json(status, {"error": message}, headers={"Connection": "close", **(headers or {})})
+
+    def _send_json(self, status: int, data: dict, headers: Mapping[str, str] | None = None) -> None:
+        self._send(status, json.dumps(data).encode("utf-8"), "application/json", headers)
+
+    def _send(self, status: int, payload: bytes, content_type: str, headers: Mapping[str, str] | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def make_server(service: ReviewService, host: str = "127.0.0.1", port: int = 8000) -> ReviewServer:
+    """Bind a ReviewServer for service; port 0 picks a free port (see server.server_address)."""
+    return ReviewServer((host, port), service)
+
+
+class _BodyRejected(Exception):
+    """A request body that is refused while it is read; status is the HTTP answer."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class _BoundedBody:
+    """
+    Passes a decoded request body through, counting its bytes.
+
+    Raises _BodyRejected (not an OSError, so the XML stream parser does not
+    report it as an unreadable stream) past max_bytes or on a socket timeout.
+    """
+
+    def __init__(self, body: BinaryIO, max_bytes: int) -> None:
+        self._body = body
+        self._max_bytes = max_bytes
+        self._size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        try:
+            data = self._body.read(size)
+        except TimeoutError:
+            raise _BodyRejected(408, f"request body stalled for more than {READ_TIMEOUT_SEC:g}s") from None
+        self._size += len(data)
+        if self._size > self._max_bytes:
+            raise _BodyRejected(413, f"request body exceeds the limit of {self._max_bytes} bytes")
+        return data
+
+
+class _LengthBody:
+    """Reads exactly length bytes of a request body, then reports end of stream."""
+
+    def __init__(self, rfile: BinaryIO, length: int) -> None:
+        if length < 0:
+            raise ValueError(length)
+        self._rfile = rfile
+        self._remaining = length
+
+    def read(self, size: int = -1) -> bytes:
+        if self._remaining <= 0:
+            return b""
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._rfile.read(size)
+        if not data:
+            raise OSError("request body ended before Content-Length bytes")
+        self._remaining -= len(data)
+        return data
+
+
+class _ChunkedBody:
+    """Decodes a chunked request body (RFC 9112 section 7.1) as it is read."""
+
+    def __init__(self, rfile: BinaryIO) -> None:
+        self._rfile = rfile
+        self._remaining = 0  # bytes left in the current chunk
+        self._done = False
+
+    def read(self, size: int = -1) -> bytes:
+        if self._done:
+            return b""
+        if self._remaining == 0:
+            line = self._rfile.readline(1 << 16)
+            try:
+                self._remaining = int(line.split(b";", 1)[0].strip(), 16)
+            except ValueError:
+                raise OSError(f"invalid chunk size line {line[:40]!r}") from None
+            if self._remaining == 0:
+                # Skip trailer fields up to the empty line ending the body.
+                while self._rfile.readline(1 << 16) not in (b"\r\n", b"\n", b""):
+                    pass
+                self._done = True
+                return b""
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._rfile.read(size)
+        if not data:
+            raise OSError("request body ended inside a chunk")
+        self._remaining -= len(data)
+        if self._remaining == 0:
+            self._rfile.readline(1 << 16)  # CRLF after the chunk data
+        return data
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from core.errors import IngestionError
+from core.ingestion.junit_loader import load_junit_result_batch, resolve_junit_paths
+from core.pipeline import Pipeline, RunAccumulators
+
+
+@dataclass(frozen=True, slots=True)
+class _ShardState:
+    """What was last read from one results file."""
+
+    key: tuple[int, int]  # (mtime_ns, size) when it was read
+    accumulators: RunAccumulators | None  # None while the file cannot be parsed
+    results: int = 0
+    error: str | None = None
+
+
+class ResultsWatcher:
+    """
+    Incrementally folds a growing set of JUnit result files into one run.
+
+    Each poll lists the files matched by results_spec (a directory or glob,
+    as for run) and parses only the ones that are new or whose modification
+    time or size changed since they were last read. Every file is folded into
+    its own accumulators, so a rewritten file replaces its earlier
+    contribution and a deleted one drops out. The run is the merge of the
+    per-file accumulators in path order, which gives the same output as
+    run_pipeline over the same files (duration totals may differ in the last
+    digits, being summed per file). New files that sort after every file
+    already read, the usual case for numbered shards, are merged into the
+    running total directly; anything else rebuilds it on the next evaluate.
+    A file that fails to parse (typically a shard still being written) is
+    counted as pending and retried once it changes.
+    """
+
+    __slots__ = ("pipeline", "results_spec", "_files", "_merged", "_last_merged")
+
+    def __init__(self, pipeline: Pipeline, results_spec: str) -> None:
+        self.pipeline = pipeline
+        self.results_spec = results_spec
+        self._files: dict[Path, _ShardState] = {}
+        # Accumulators of every readable file, merged in path order up to
+        # _last_merged; None when they must be rebuilt.
+        self._merged: RunAccumulators | None = pipeline.accumulators()
+        self._last_merged: Path | None = None
+
+    @property
+    def files(self) -> int:
+        """Number of files read successfully."""
+        return sum(1 for state in self._files.values() if state.accumulators is not None)
+
+    @property
+    def results(self) -> int:
+        """Number of results in the files read successfully."""
+        return sum(state.results for state in self._files.values())
+
+    @property
+    def pending(self) -> dict[str, str]:
+        """Files that could not be parsed yet, with the parse error, by path."""
+        return {str(path): state.error for path, state in sorted(self._files.items()) if state.error is not None}
+
+    def poll_once(self) -> list[str]:
+        """
+        Read new and changed files and forget deleted ones.
+
+        Returns the paths whose contribution changed (sorted); an empty list
+        means the run is unchanged since the previous poll.
+        """
+        changed = []
+        seen = set()
+        for path in self._list_files():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue  # deleted since it was listed
+            seen.add(path)
+            key = (stat.st_mtime_ns, stat.st_size)
+            previous = self._files.get(path)
+            if previous is not None and previous.key == key:
+                continue
+            state = self._read(path, key)
+            self._files[path] = state
+            if previous is not None and previous.accumulators is not None:
+                self._merged = None  # its earlier contribution must be retracted
+            elif state.accumulators is None:
+                continue  # not readable yet and nothing to retract: the run is unchanged
+            elif self._merged is not None and (self._last_merged is None or path > self._last_merged):
+                self._merged.merge(state.accumulators)
+                self._last_merged = path
+            else:
+                self._merged = None
+            changed.append(str(path))
+
+        for path in [p for p in self._files if p not in seen]:
+            if self._files.pop(path).accumulators is not None:
+                self._merged = None
+                changed.append(str(path))
+        return sorted(changed)
+
+    def evaluate(self) -> dict:
+        """Return the run_pipeline dict for every file read so far."""
+        if self._merged is None:
+            merged = self.pipeline.accumulators()
+            self._last_merged = None
+            for path, state in sorted(self._files.items()):
+                if state.accumulators is not None:
+                    merged.merge(state.accumulators)
+                    self._last_merged = path
+            self._merged = merged
+        return self.pipeline.evaluate_accumulated(self._merged)
+
+    def _list_files(self) -> list[Path]:
+        try:
+            paths = resolve_junit_paths(self.results_spec)
+        except IngestionError:
+            return []  # nothing matched yet
+        return [p for p in paths if p.is_file()]
+
+    def _read(self, path: Path, key: tuple[int, int]) -> _ShardState:
+        try:
+            batch = load_junit_result_batch(str(path), self.pipeline.id_extractor)
+        except IngestionError as e:
+            return _ShardState(key=key, accumulators=None, error=str(e))
+        return _ShardState(key=key, accumulators=self.pipeline.accumulators().fold(batch), results=len(batch))
+
+
+def watch_results(
+    watcher: ResultsWatcher,
+    on_update: Callable[[dict], None],
+    interval: float = 2.0,
+    debounce: float = 10.0,
+    timeout: float | None = None,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], None] = time.sleep,
+) -> dict | None:
+    """
+    Poll the watcher every interval seconds and report the run as it grows.
+
+    on_update is called with the run_pipeline dict after a poll finds changes,
+    at most once per debounce seconds; changes found in between are included
+    in the next update. Polling stops after timeout seconds (if given) or on
+    KeyboardInterrupt, after a final update for any changes not yet reported.
+    Returns the last output passed to on_update (None if there was none).
+    """
+    start = clock()
+    last_update: float | None = None
+    output = None
+    pending = False
+    try:
+        while True:
+            if watcher.poll_once():
+                pending = True
+            now = clock()
+            done = timeout is not None and now - start >= timeout
+            if pending and (done or last_update is None or now - last_update >= debounce):
+                output = watcher.evaluate()
+                on_update(output)
+                last_update = now
+                pending = False
+            if done:
+                return output
+            sleep(interval)
+    except KeyboardInterrupt:
+        if pending:
+            output = watcher.evaluate()
+            on_update(output)
+        return output
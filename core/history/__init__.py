@@ -0,0 +1,10 @@
+"""Run history package: persistent storage of pipeline runs for trend analysis."""
+
+from .store import TREND_METRICS, RunHistoryStore, RunRecord, TestHistoryEntry
+
+__all__ = [
+    "RunHistoryStore",
+    "RunRecord",
+    "TestHistoryEntry",
+    "TREND_METRICS",
+]
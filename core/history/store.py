@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from itertools import repeat
+from pathlib import Path
+
+from core.errors import IngestionError, ValidationError
+from core.normalization.models import STATUS_CODES, STATUS_NAMES, ResultBatch, TestResultModel
+
+# Bump when the schema changes incompatibly; older databases are rejected.
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recorded_at REAL NOT NULL,
+    label TEXT,
+    score INTEGER NOT NULL,
+    risk TEXT NOT NULL,
+    total_cases INTEGER NOT NULL,
+    total_results INTEGER NOT NULL,
+    mapped_results INTEGER NOT NULL,
+    unmapped_results INTEGER NOT NULL,
+    passed INTEGER NOT NULL,
+    failed INTEGER NOT NULL,
+    skipped INTEGER NOT NULL,
+    failure_rate REAL NOT NULL,
+    skip_rate REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_recorded_at ON runs (recorded_at);
+CREATE TABLE IF NOT EXISTS test_results (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    test_id TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    duration_sec REAL
+);
+CREATE INDEX IF NOT EXISTS idx_test_results_test_id ON test_results (test_id, run_id);
+CREATE INDEX IF NOT EXISTS idx_test_results_run_id ON test_results (run_id);
+"""
+
+# Metrics stored per run (the compute_metrics keys); also the columns that
+# metric_trend may query.
+TREND_METRICS: tuple[str, ...] = (
+    "total_cases",
+    "total_results",
+    "mapped_results",
+    "unmapped_results",
+    "passed",
+    "failed",
+    "skipped",
+    "failure_rate",
+    "skip_rate",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RunRecord:
+    """One stored pipeline run."""
+
+    run_id: int
+    recorded_at: float  # Unix timestamp
+    label: str | None
+    score: int
+    risk: str
+    metrics: dict
+
+
+@dataclass(frozen=True, slots=True)
+class TestHistoryEntry:
+    """The status of one test in one stored run."""
+
+    run_id: int
+    recorded_at: float
+    status: str
+    duration_sec: float | None
+
+
+class RunHistoryStore:
+    """
+    Local SQLite store of pipeline runs and their per-test statuses.
+
+    Each recorded run adds a row to `runs` (metrics, score, risk) and one row
+    per result to `test_results`, inserted with executemany in a single
+    transaction. Runs are indexed by timestamp and results by (test id, run),
+    so trend and per-test history queries are index range scans that do not
+    grow with the total number of stored runs.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute("PRAGMA foreign_keys = ON")
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
+            self._init_schema()
+        except (OSError, sqlite3.Error) as e:
+            raise IngestionError(f"history '{path}': unable to open database ({e})") from e
+
+    def __enter__(self) -> RunHistoryStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def record_run(
+        self,
+        output: dict,
+        results: Iterable[TestResultModel] | ResultBatch = (),
+        recorded_at: float | None = None,
+        label: str | None = None,
+    ) -> int:
+        """
+        Store a run_pipeline output and its per-test results; returns the run id.
+
+        recorded_at defaults to the current time; label is free text (e.g. a
+        build number). The run and all its results are written atomically.
+        """
+        metrics = output["metrics"]
+        run_row = (
+            time.time() if recorded_at is None else recorded_at,
+            label,
+            output["score"],
+            output["risk"],
+            *(metrics[key] for key in TREND_METRICS),
+        )
+        try:
+            with self._conn:
+                cur = self._conn.execute(
+                    f"INSERT INTO runs (recorded_at, label, score, risk, {', '.join(TREND_METRICS)}) "
+                    f"VALUES ({', '.join('?' * (4 + len(TREND_METRICS)))})",
+                    run_row,
+                )
+                run_id = cur.lastrowid
+                self._conn.executemany(
+                    "INSERT INTO test_results (run_id, test_id, status, duration_sec) VALUES (?, ?, ?, ?)",
+                    _result_rows(run_id, results),
+                )
+        except sqlite3.Error as e:
+            raise IngestionError(f"history '{self.path}': unable to record run ({e})") from e
+        return run_id
+
+    def latest_run_id(self) -> int | None:
+        """Return the id of the most recently recorded run, or None if empty."""
+        row = self._conn.execute("SELECT run_id FROM runs ORDER BY recorded_at DESC, run_id DESC LIMIT 1").fetchone()
+        return row[0] if row else None
+
+    def get_run(self, run_id: int) -> RunRecord:
+        """Return one stored run; raises ValidationError if it does not exist."""
+        row = self._conn.execute(f"SELECT {_RUN_COLUMNS} FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        if row is None:
+            raise ValidationError(f"history '{self.path}': no run with id {run_id}")
+        return _run_record(row)
+
+    def recent_runs(self, limit: int = 200) -> list[RunRecord]:
+        """Return up to limit most recent runs, newest first."""
+        rows = self._conn.execute(
+            f"SELECT {_RUN_COLUMNS} FROM runs ORDER BY recorded_at DESC, run_id DESC LIMIT ?", (limit,)
+        )
+        return [_run_record(row) for row in rows]
+
+    def metric_trend(self, metric: str, limit: int = 200) -> list[tuple[int, float, float]]:
+        """
+        Return (run_id, recorded_at, value) of one metric for the last limit runs.
+
+        Oldest first, e.g. metric_trend("failure_rate") for a trend line.
+        Raises ValidationError for metrics not in TREND_METRICS.
+        """
+        if metric not in TREND_METRICS and metric != "score":
+            raise ValidationError(f"unknown trend metric '{metric}' (expected score or one of: {list(TREND_METRICS)})")
+        rows = self._conn.execute(
+            f"SELECT run_id, recorded_at, {metric} FROM runs ORDER BY recorded_at DESC, run_id DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+        rows.reverse()
+        return rows
+
+    def test_history(self, test_id: str, limit: int | None = None) -> list[TestHistoryEntry]:
+        """Return the stored statuses of one test id, most recently recorded run first."""
+        rows = self._conn.execute(
+            "SELECT r.run_id, r.recorded_at, t.status, t.duration_sec "
+            "FROM test_results AS t JOIN runs AS r ON r.run_id = t.run_id "
+            "WHERE t.test_id = ? ORDER BY t.run_id DESC LIMIT ?",
+            (test_id, -1 if limit is None else limit),
+        )
+        return [
+            TestHistoryEntry(run_id=run_id, recorded_at=recorded_at, status=STATUS_NAMES[code], duration_sec=duration)
+            for run_id, recorded_at, code, duration in rows
+        ]
+
+    def run_results(self, run_id: int) -> ResultBatch:
+        """Return the stored results of one run as a ResultBatch, in insertion order."""
+        self.get_run(run_id)
+        batch = ResultBatch()
+        for test_id, code, duration in self._conn.execute(
+            "SELECT test_id, status, duration_sec FROM test_results WHERE run_id = ? ORDER BY rowid", (run_id,)
+        ):
+            batch.append(test_id, STATUS_NAMES[code], duration)
+        return batch
+
+    def _init_schema(self) -> None:
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, _SCHEMA_VERSION):
+            raise sqlite3.DatabaseError(f"unsupported schema version {version}")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+
+_RUN_COLUMNS = f"run_id, recorded_at, label, score, risk, {', '.join(TREND_METRICS)}"
+
+
+def _run_record(row: tuple) -> RunRecord:
+    run_id, recorded_at, label, score, risk, *metric_values = row
+    return RunRecord(
+        run_id=run_id,
+        recorded_at=recorded_at,
+        label=label,
+        score=score,
+        risk=risk,
+        metrics=dict(zip(TREND_METRICS, metric_values)),
+    )
+
+
+def _result_rows(run_id: int, results: Iterable[TestResultModel] | ResultBatch) -> Iterator[tuple]:
+    if isinstance(results, ResultBatch):
+        # NaN marks a missing duration in the batch; store it as NULL.
+        durations = (None if d != d else d for d in results.durations)
+        return zip(repeat(run_id), results.ids, results.status_codes, durations)
+    return ((run_id, r.id, STATUS_CODES[r.status], r.duration_sec) for r in results)
@@ -1,10 +1,41 @@
 """Ingestion package (Phase 1 skeleton)."""
 
-from .csv_loader import load_test_cases_csv
-from .junit_loader import load_junit_results
+from .csv_loader import (
+    iter_test_case_models_csv,
+    iter_test_cases_csv,
+    load_test_case_catalog_csv,
+    load_test_case_catalog_csv_parallel,
+    load_test_cases_csv,
+)
+from .junit_loader import (
+    iter_junit_result_models,
+    iter_junit_result_models_many,
+    iter_junit_result_models_stream,
+    iter_junit_results,
+    iter_junit_results_many,
+    load_junit_result_batch,
+    load_junit_result_batch_many,
+    load_junit_result_models,
+    load_junit_results,
+    load_junit_results_many,
+    resolve_junit_paths,
+)
 
 __all__ = [
     "load_test_cases_csv",
+    "iter_test_cases_csv",
+    "iter_test_case_models_csv",
+    "load_test_case_catalog_csv",
+    "load_test_case_catalog_csv_parallel",
     "load_junit_results",
+    "iter_junit_results",
+    "load_junit_result_models",
+    "iter_junit_result_models",
+    "load_junit_results_many",
+    "iter_junit_results_many",
+    "iter_junit_result_models_many",
+    "iter_junit_result_models_stream",
+    "load_junit_result_batch",
+    "load_junit_result_batch_many",
+    "resolve_junit_paths",
 ]
-
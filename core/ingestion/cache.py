@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+from array import array
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from core.ingestion.csv_loader import load_test_case_catalog_csv
+from core.ingestion.id_extraction import DEFAULT_ID_EXTRACTOR, IdExtractor
+from core.ingestion.junit_loader import load_junit_result_batch
+from core.normalization.models import ResultBatch, TestCaseModel
+
+# Bump when the on-disk payload layout or loader semantics change.
+_FORMAT_VERSION = 1
+_ENTRY_MAGIC = b"QARC"
+_ENTRY_SUFFIX = ".bin"
+_HASH_CHUNK_SIZE = 1 << 20
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def default_cache_dir() -> Path:
+    """Return $XDG_CACHE_HOME/qa_review (or ~/.cache/qa_review)."""
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "qa_review"
+
+
+class ParseCache:
+    """
+    On-disk cache of parsed and normalized inputs, keyed by file fingerprint.
+
+    The fingerprint combines the file size, modification time and a SHA-256 of
+    its content, so a hit is only served for byte-identical input. Entries are
+    stored as marshal-encoded columns (no per-record objects) and the cache
+    directory is kept under max_bytes by evicting least recently used entries.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def load_test_case_catalog(self, path: str) -> dict[str, TestCaseModel]:
+        """Cached equivalent of load_test_case_catalog_csv."""
+        columns = self._get_or_build(path, "csv", lambda: _catalog_to_columns(load_test_case_catalog_csv(path)))
+        return _catalog_from_columns(columns)
+
+    def load_junit_result_batch(self, path: str, id_extractor: IdExtractor | None = None) -> ResultBatch:
+        """Cached equivalent of load_junit_result_batch."""
+        columns = self._get_or_build(
+            path,
+            _junit_kind(id_extractor),
+            lambda: _batch_to_columns(load_junit_result_batch(path, id_extractor)),
+        )
+        return _batch_from_columns(columns)
+
+    def load_junit_result_batch_many(
+        self,
+        paths: Iterable[str | Path],
+        max_workers: int | None = None,
+        id_extractor: IdExtractor | None = None,
+    ) -> ResultBatch:
+        """
+        Cached equivalent of load_junit_result_batch_many.
+
+        Shards found in the cache are read back directly; the remaining ones are
+        parsed together (in parallel when max_workers allows) and then stored.
+        """
+        kind = _junit_kind(id_extractor)
+        path_strs = [str(p) for p in paths]
+        shards: dict[str, ResultBatch] = {}
+        misses: list[tuple[str, str | None]] = []
+        for p in path_strs:
+            key = self._key_or_none(p, kind)
+            columns = self._read(key) if key is not None else None
+            if columns is None:
+                misses.append((p, key))
+            else:
+                shards[p] = _batch_from_columns(columns)
+
+        if misses:
+            parsed = _load_batches([p for p, _ in misses], max_workers, id_extractor)
+            for (p, key), batch in zip(misses, parsed):
+                if key is not None:
+                    self._write(key, _batch_to_columns(batch))
+                shards[p] = batch
+            self._evict()
+
+        merged = ResultBatch()
+        for p in path_strs:
+            merged.extend(shards[p])
+        return merged
+
+    def clear(self) -> None:
+        """Remove all cache entries."""
+        for entry in self._entries():
+            entry.unlink(missing_ok=True)
+
+    def _get_or_build(self, path: str, kind: str, build: Callable[[], tuple]) -> tuple:
+        key = self._key_or_none(path, kind)
+        if key is not None:
+            columns = self._read(key)
+            if columns is not None:
+                return columns
+
+        columns = build()
+        if key is not None:
+            self._write(key, columns)
+            self._evict()
+        return columns
+
+    def _key_or_none(self, path: str, kind: str) -> str | None:
+        # Unreadable inputs are not cached; the loader then raises the usual
+        # IngestionError for them.
+        try:
+            return _fingerprint(Path(path), kind)
+        except OSError:
+            return None
+
+    def _read(self, key: str) -> tuple | None:
+        entry = self.directory / f"{key}{_ENTRY_SUFFIX}"
+        try:
+            data = entry.read_bytes()
+        except OSError:
+            return None
+        if not data.startswith(_ENTRY_MAGIC):
+            entry.unlink(missing_ok=True)
+            return None
+        try:
+            columns = marshal.loads(data[len(_ENTRY_MAGIC):])
+        except (EOFError, ValueError, TypeError):
+            entry.unlink(missing_ok=True)
+            return None
+        # Touch the entry so eviction sees it as recently used.
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return columns
+
+    def _write(self, key: str, columns: tuple) -> None:
+        payload = _ENTRY_MAGIC + marshal.dumps(columns)
+        if len(payload) > self.max_bytes:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_name, self.directory / f"{key}{_ENTRY_SUFFIX}")
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError:
+            # A cache that cannot be written must never fail the run.
+            pass
+
+    def _evict(self) -> None:
+        stats = []
+        for entry in self._entries():
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            stats.append((st.st_mtime_ns, st.st_size, entry))
+
+        total = sum(size for _, size, _ in stats)
+        for _, size, entry in sorted(stats, key=lambda s: s[0]):
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+    def _entries(self) -> list[Path]:
+        if not self.directory.is_dir():
+            return []
+        return [p for p in self.directory.iterdir() if p.suffix == _ENTRY_SUFFIX]
+
+
+def _fingerprint(path: Path, kind: str) -> str:
+    st = path.stat()
+    h = hashlib.sha256()
+    # marshal output is interpreter-version specific, so the version is part of the key.
+    h.update(f"{kind}:{_FORMAT_VERSION}:{sys.version_info[:2]}:{st.st_size}:{st.st_mtime_ns}:".encode())
+    with path.open("rb") as f:
+        while True:
+            chunk = f.read(_HASH_CHUNK_SIZE)
+            if not chunk:
+                break
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _junit_kind(id_extractor: IdExtractor | None) -> str:
+    # Results depend on how ids are extracted, so the extractor is part of the key.
+    return f"junit:{(id_extractor or DEFAULT_ID_EXTRACTOR).signature}"
+
+
+def _load_batches(
+    paths: list[str], max_workers: int | None, id_extractor: IdExtractor | None
+) -> list[ResultBatch]:
+    # Each shard is kept as its own batch so it can be cached individually.
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(paths)))
+    if max_workers == 1:
+        return [load_junit_result_batch(p, id_extractor) for p in paths]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(partial(load_junit_result_batch, id_extractor=id_extractor), paths))
+
+
+def _catalog_to_columns(catalog: dict[str, TestCaseModel]) -> tuple:
+    cases = catalog.values()
+    return (
+        [tc.id for tc in cases],
+        [tc.title for tc in cases],
+        [tc.priority for tc in cases],
+        [tc.component for tc in cases],
+        [tc.description for tc in cases],
+    )
+
+
+def _catalog_from_columns(columns: tuple) -> dict[str, TestCaseModel]:
+    ids, titles, priorities, components, descriptions = columns
+    return {
+        tc_id: TestCaseModel(id=tc_id, title=title, priority=priority, component=component, description=description)
+        for tc_id, title, priority, component, description in zip(ids, titles, priorities, components, descriptions)
+    }
+
+
+def _batch_to_columns(batch: ResultBatch) -> tuple:
+    return (batch.ids, batch.status_codes.tobytes(), batch.durations.tobytes())
+
+
+def _batch_from_columns(columns: tuple) -> ResultBatch:
+    ids, status_bytes, duration_bytes = columns
+    status_codes = array("b")
+    status_codes.frombytes(status_bytes)
+    durations = array("d")
+    durations.frombytes(duration_bytes)
+    return ResultBatch(ids=[sys.intern(i) for i in ids], status_codes=status_codes, durations=durations)
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import bz2
+import gzip
+import lzma
+import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO
+
+# Magic-byte signatures of the stdlib-supported compression formats.
+_SIGNATURES: tuple[tuple[bytes, str], ...] = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+)
+_MAX_SIGNATURE_LEN = max(len(sig) for sig, _ in _SIGNATURES)
+
+# Raised by the decompressors for corrupt or truncated archives (in addition to
+# OSError, e.g. gzip.BadGzipFile); loaders report these as unreadable files.
+DECOMPRESSION_ERRORS: tuple[type[Exception], ...] = (EOFError, lzma.LZMAError, zlib.error)
+
+
+def detect_compression(head: bytes) -> str | None:
+    """Return "gzip", "bz2" or "xz" if head starts with a known signature, else None."""
+    for sig, name in _SIGNATURES:
+        if head.startswith(sig):
+            return name
+    return None
+
+
+@contextmanager
+def open_input(path: Path) -> Iterator[BinaryIO]:
+    """
+    Open path for binary reading, transparently decompressing gzip/bz2/xz input.
+
+    Compression is detected from the leading magic bytes, not the file name.
+    Decompression is streamed: the decompressed content is never written to
+    disk or held in memory as a whole.
+    """
+    with path.open("rb") as raw:
+        head = raw.read(_MAX_SIGNATURE_LEN)
+        raw.seek(0)
+        kind = detect_compression(head)
+        if kind is None:
+            yield raw
+            return
+
+        if kind == "gzip":
+            stream: BinaryIO = gzip.GzipFile(fileobj=raw, mode="rb")
+        elif kind == "bz2":
+            stream = bz2.BZ2File(raw, mode="rb")
+        else:
+            stream = lzma.LZMAFile(raw, mode="rb")
+        # Closing the decompressor does not close a caller-supplied file object,
+        # so raw is closed by the enclosing with-block.
+        with stream:
+            yield stream
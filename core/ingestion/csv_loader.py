@@ -1,9 +1,28 @@
 from __future__ import annotations
 
 import csv
+import io
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
-from core.errors import IngestionError
+from core.errors import IngestionError, ValidationError
+from core.ingestion.compression import DECOMPRESSION_ERRORS, detect_compression, open_input
+from core.normalization.models import TestCaseModel
+
+# Target size of a chunk handed to one worker by the parallel catalog loader.
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024
+_SCAN_BLOCK_BYTES = 1 << 20
+
+# Record appended after each chunk's text: it parses back as a record of its
+# own only if the chunk ended outside a quoted field (no quotes, commas or
+# line breaks, so it can never close or open a field itself).
+_CHUNK_END_SENTINEL = "\x1eqa_review_chunk_end\x1e"
+
+# (id, title, description, priority, component) column indexes; None = absent.
+_ColumnIndexes = tuple[int, int | None, int | None, int | None, int | None]
 
 
 def load_test_cases_csv(path: str) -> list[dict]:
@@ -12,56 +31,333 @@ def load_test_cases_csv(path: str) -> list[dict]:
 
     Output keys are exactly:
       { "id": str, "title": str, "description": str|None, "priority": str|None, "component": str|None }
+
+    gzip, bz2 and xz compressed files are detected and decompressed on the fly.
+    """
+    return list(iter_test_cases_csv(path))
+
+
+def iter_test_cases_csv(path: str) -> Iterator[dict]:
+    """
+    Stream test cases from a CSV file, yielding one dictionary per data row.
+
+    Yields the same dictionaries as load_test_cases_csv and raises the same
+    IngestionError messages; errors in later rows are raised after earlier rows
+    have been yielded.
+    """
+    for tc_id, title, description, priority, component in _iter_case_fields(path):
+        yield {
+            "id": tc_id,
+            "title": title,
+            "description": description,
+            "priority": priority,
+            "component": component,
+        }
+
+
+def iter_test_case_models_csv(path: str) -> Iterator[TestCaseModel]:
+    """
+    Stream test cases from a CSV file as validated TestCaseModel instances.
+
+    Fused ingest+normalize path: each field is stripped and validated once and
+    no intermediate dictionary is built. Produces the same models as
+    normalize_test_cases(iter_test_cases_csv(path)) except for the duplicate-id
+    check, which needs the whole catalog (see load_test_case_catalog_csv).
+    """
+    for tc_id, title, description, priority, component in _iter_case_fields(path):
+        yield TestCaseModel(
+            id=tc_id,
+            title=title,
+            priority=priority,
+            component=component,
+            description=description,
+        )
+
+
+def load_test_case_catalog_csv(path: str) -> dict[str, TestCaseModel]:
+    """
+    Load a CSV file straight into a test case catalog keyed by id.
+
+    Equivalent to normalize_test_cases(load_test_cases_csv(path)).
+
+    Raises IngestionError for unreadable/invalid CSV (as load_test_cases_csv)
+    and ValidationError for duplicate test case ids (as normalize).
+    """
+    return _catalog_from_fields(_iter_case_fields(path))
+
+
+def load_test_case_catalog_csv_parallel(
+    path: str,
+    max_workers: int | None = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    include_description: bool = False,
+) -> dict[str, TestCaseModel]:
+    """
+    Load a large CSV catalog by parsing byte-range chunks in worker processes.
+
+    The file is split at newlines that quote-character parity places outside
+    any quoted field, so quoted multi-line cells are normally not cut. Parity
+    is only a guess (a literal quote inside an unquoted field, which csv
+    accepts, throws it off), so every split is confirmed by the real parse:
+    each worker checks that csv.reader ends its chunk between records, and if
+    the header or any chunk does not, the file is parsed serially instead.
+    Workers only extract the projected columns; description/steps is skipped
+    unless include_description is set. Chunks are merged in file order, so
+    duplicate detection and row numbers in error messages match
+    load_test_case_catalog_csv.
+
+    Compressed input cannot be split by offset and is parsed serially.
+
+    Raises IngestionError / ValidationError as load_test_case_catalog_csv.
     """
     csv_path = Path(path)
     try:
-        with csv_path.open("r", encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f)
-            headers = reader.fieldnames or []
-            header_map = {_canon(h): h for h in headers if h is not None}
-
-            id_col = _pick_col(header_map, {"id", "test_id", "case_id"})
-            if id_col is None:
-                raise IngestionError(
-                    f"CSV '{path}': missing id column (expected one of: id, test_id, case_id)"
-                )
-
-            title_col = _pick_col(header_map, {"title", "name", "summary"})
-            desc_col = _pick_col(header_map, {"description", "steps"})
-            prio_col = _pick_col(header_map, {"priority", "severity"})
-            comp_col = _pick_col(header_map, {"component", "area", "module"})
-
-            out: list[dict] = []
-            # csv.DictReader line numbers start at 2 for first data row (header is line 1)
-            for row_idx, row in enumerate(reader, start=2):
-                tc_id = _get_cell(row, id_col)
-                if tc_id == "":
-                    raise IngestionError(f"CSV '{path}': empty id at row {row_idx}")
+        with csv_path.open("rb") as f:
+            compressed = detect_compression(f.read(8)) is not None
+        if compressed:
+            return _catalog_from_fields(_iter_case_fields(path, include_description))
+
+        offsets = _record_offsets(csv_path, chunk_bytes)
+        with csv_path.open("rb") as f:
+            header_text = f.read(offsets[0]).decode("utf-8")
+        header_rows = [
+            row for row in csv.reader(io.StringIO(header_text + _CHUNK_END_SENTINEL, newline="")) if row
+        ]
+    except FileNotFoundError as e:
+        raise IngestionError(f"CSV '{path}': file not found") from e
+    except (OSError, UnicodeDecodeError) as e:
+        raise IngestionError(f"CSV '{path}': unable to read file ({e})") from e
+    except csv.Error as e:
+        raise IngestionError(f"CSV '{path}': invalid CSV ({e})") from e
+
+    if len(header_rows) != 2 or header_rows[1] != [_CHUNK_END_SENTINEL]:
+        # The header does not end where parity says: split points are unreliable.
+        return _catalog_from_fields(_iter_case_fields(path, include_description))
+    indexes = _resolve_columns(path, header_rows[0], include_description)
+    ranges = list(zip(offsets, offsets[1:]))
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(ranges)))
+
+    parse = partial(_parse_chunk, path, indexes)
+    try:
+        if max_workers == 1:
+            return _merge_chunks(path, map(parse, ranges))
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            # map() yields in submission (= file) order.
+            return _merge_chunks(path, pool.map(parse, ranges))
+    except _MisalignedChunk:
+        return _catalog_from_fields(_iter_case_fields(path, include_description))
+
+
+def _iter_case_fields(
+    path: str, include_description: bool = True
+) -> Iterator[tuple[str, str, str | None, str | None, str | None]]:
+    """Yield (id, title, description, priority, component) per data row, fully cleaned."""
+    csv_path = Path(path)
+    try:
+        with open_input(csv_path) as raw, io.TextIOWrapper(raw, encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            headers = next(reader, [])
+            indexes = _resolve_columns(path, headers, include_description)
+
+            # Row numbers start at 2 for first data row (header is line 1); blank
+            # lines are skipped without being counted, as csv.DictReader does.
+            row_idx = 1
+            for row in reader:
+                if not row:
+                    continue
+                row_idx += 1
 
-                title = _get_cell(row, title_col) if title_col else ""
-                description = _none_if_blank(_get_cell(row, desc_col)) if desc_col else None
-                priority = _none_if_blank(_get_cell(row, prio_col)) if prio_col else None
-                component = _none_if_blank(_get_cell(row, comp_col)) if comp_col else None
-
-                out.append(
-                    {
-                        "id": tc_id,
-                        "title": title,
-                        "description": description,
-                        "priority": priority,
-                        "component": component,
-                    }
-                )
-
-            return out
+                fields = _fields_from_row(row, indexes)
+                if fields is None:
+                    raise IngestionError(f"CSV '{path}': empty id at row {row_idx}")
+                yield fields
     except IngestionError:
         raise
     except FileNotFoundError as e:
         raise IngestionError(f"CSV '{path}': file not found") from e
-    except OSError as e:
+    except (OSError, *DECOMPRESSION_ERRORS) as e:
+        raise IngestionError(f"CSV '{path}': unable to read file ({e})") from e
+    except csv.Error as e:
+        raise IngestionError(f"CSV '{path}': invalid CSV ({e})") from e
+
+
+def _resolve_columns(path: str, headers: list[str], include_description: bool) -> _ColumnIndexes:
+    """Map the header row to (id, title, description, priority, component) column indexes."""
+    header_map = {_canon(h): h for h in headers}
+
+    id_col = _pick_col(header_map, {"id", "test_id", "case_id"})
+    if id_col is None:
+        raise IngestionError(
+            f"CSV '{path}': missing id column (expected one of: id, test_id, case_id)"
+        )
+
+    title_col = _pick_col(header_map, {"title", "name", "summary"})
+    desc_col = _pick_col(header_map, {"description", "steps"}) if include_description else None
+    prio_col = _pick_col(header_map, {"priority", "severity"})
+    comp_col = _pick_col(header_map, {"component", "area", "module"})
+
+    # Like csv.DictReader, a repeated header name resolves to its last column.
+    col_index = {h: i for i, h in enumerate(headers)}
+    return (
+        col_index[id_col],
+        col_index[title_col] if title_col else None,
+        col_index[desc_col] if desc_col else None,
+        col_index[prio_col] if prio_col else None,
+        col_index[comp_col] if comp_col else None,
+    )
+
+
+def _fields_from_row(
+    row: list[str], indexes: _ColumnIndexes
+) -> tuple[str, str, str | None, str | None, str | None] | None:
+    """Clean one data row; returns None if its id is blank."""
+    id_idx, title_idx, desc_idx, prio_idx, comp_idx = indexes
+    tc_id = _get_cell(row, id_idx)
+    if tc_id == "":
+        return None
+    return (
+        tc_id,
+        _get_cell(row, title_idx),
+        _none_if_blank(_get_cell(row, desc_idx)),
+        _none_if_blank(_get_cell(row, prio_idx)),
+        _none_if_blank(_get_cell(row, comp_idx)),
+    )
+
+
+def _catalog_from_fields(
+    fields: Iterable[tuple[str, str, str | None, str | None, str | None]]
+) -> dict[str, TestCaseModel]:
+    catalog: dict[str, TestCaseModel] = {}
+    for tc_id, title, description, priority, component in fields:
+        if tc_id in catalog:
+            raise ValidationError(f"Duplicate test case id: {tc_id}")
+        catalog[tc_id] = TestCaseModel(
+            id=tc_id,
+            title=title,
+            priority=priority,
+            component=component,
+            description=description,
+        )
+    return catalog
+
+
+def _record_offsets(path: Path, chunk_bytes: int) -> list[int]:
+    """
+    Return chunk offsets [header_end, ..., file_size] aligned to record boundaries.
+
+    A boundary is the byte after a newline preceded by an even number of quote
+    characters (escaped quotes come in pairs), i.e. a newline outside any quoted
+    field. The first boundary is the end of the header record; later ones are
+    the first boundaries at least chunk_bytes past the previous one.
+    """
+    offsets: list[int] = []
+    target = 0
+    parity = 0
+    block_start = 0
+    with path.open("rb") as f:
+        while True:
+            block = f.read(_SCAN_BLOCK_BYTES)
+            if not block:
+                break
+            pos = 0  # quote parity is known for block[:pos]
+            while True:
+                local_target = target - block_start
+                if local_target >= len(block):
+                    break
+                if local_target > pos:
+                    parity ^= block.count(b'"', pos, local_target) & 1
+                    pos = local_target
+                nl = block.find(b"\n", pos)
+                if nl == -1:
+                    break
+                parity ^= block.count(b'"', pos, nl) & 1
+                pos = nl + 1
+                if parity == 0:
+                    offsets.append(block_start + pos)
+                    target = block_start + pos + chunk_bytes
+            parity ^= block.count(b'"', pos) & 1
+            block_start += len(block)
+
+    if not offsets or offsets[-1] != block_start:
+        offsets.append(block_start)
+    return offsets
+
+
+class _MisalignedChunk(Exception):
+    """A chunk did not end on a record boundary; the caller falls back to a serial parse."""
+
+
+def _parse_chunk(
+    path: str, indexes: _ColumnIndexes, byte_range: tuple[int, int]
+) -> tuple[list[tuple], int, int | None, bool]:
+    """
+    Parse one chunk in a worker.
+
+    Returns (fields, record_count, blank_id_record, aligned): blank_id_record
+    is the 1-based record number within the chunk whose id is blank (parsing
+    stops there), so the caller can report the global row number. aligned is
+    False if the chunk ended inside a quoted field, i.e. if it started on a
+    real record boundary, the next one does not.
+    """
+    start, end = byte_range
+    try:
+        with open(path, "rb") as f:
+            f.seek(start)
+            text = f.read(end - start).decode("utf-8")
+    except FileNotFoundError as e:
+        raise IngestionError(f"CSV '{path}': file not found") from e
+    except (OSError, UnicodeDecodeError) as e:
         raise IngestionError(f"CSV '{path}': unable to read file ({e})") from e
+
+    out: list[tuple] = []
+    records = 0
+    try:
+        reader = csv.reader(io.StringIO(text + _CHUNK_END_SENTINEL, newline=""))
+        for row in reader:
+            if not row:
+                continue
+            if row == [_CHUNK_END_SENTINEL]:
+                return out, records, None, True
+            records += 1
+            fields = _fields_from_row(row, indexes)
+            if fields is None:
+                # The rest of the chunk is not parsed, so alignment is checked by the reader alone.
+                return out, records, records, _ends_outside_quotes(reader)
+            out.append(fields)
     except csv.Error as e:
         raise IngestionError(f"CSV '{path}': invalid CSV ({e})") from e
+    return out, records, None, False  # the sentinel was swallowed by an open quoted field
+
+
+def _ends_outside_quotes(reader: Iterator[list[str]]) -> bool:
+    last = None
+    for row in reader:
+        if row:
+            last = row
+    return last == [_CHUNK_END_SENTINEL]
+
+
+def _merge_chunks(
+    path: str, chunks: Iterable[tuple[list[tuple], int, int | None, bool]]
+) -> dict[str, TestCaseModel]:
+    def fields() -> Iterator[tuple]:
+        records_before = 0
+        for rows, records, blank_id_record, aligned in chunks:
+            if not aligned:
+                # Chunks are consumed in file order, so this one started on a
+                # real boundary but the next does not; nothing from it is used.
+                raise _MisalignedChunk
+            if blank_id_record is not None:
+                yield from rows
+                # +1 for the header line
+                raise IngestionError(f"CSV '{path}': empty id at row {records_before + blank_id_record + 1}")
+            yield from rows
+            records_before += records
+
+    return _catalog_from_fields(fields())
 
 
 def _canon(header: str) -> str:
@@ -75,13 +371,10 @@ def _pick_col(header_map: dict[str, str], candidates: set[str]) -> str | None:
     return None
 
 
-def _get_cell(row: dict, col_name: str | None) -> str:
-    if not col_name:
-        return ""
-    v = row.get(col_name)
-    if v is None:
+def _get_cell(row: list[str], idx: int | None) -> str:
+    if idx is None or idx >= len(row):
         return ""
-    return str(v).strip()
+    return row[idx].strip()
 
 
 def _none_if_blank(v: str) -> str | None:
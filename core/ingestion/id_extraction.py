@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Sequence
+
+from core.errors import ValidationError
+
+# Built-in id schemes. A pattern may define a group named "id" to select part of
+# the match (e.g. the TestRail tag without brackets); otherwise the whole match
+# is the id. "classname" is not a pattern: it changes the fallback for names
+# that match no pattern from the raw name to "classname::name".
+BUILTIN_ID_SCHEMES: dict[str, str | None] = {
+    "tc": r"\bTC-\d+\b",
+    "jira": r"\b[A-Z][A-Z0-9]+-\d+\b",
+    "testrail": r"\[(?P<id>C\d+)\]",
+    "classname": None,
+}
+
+DEFAULT_ID_SCHEMES: tuple[str, ...] = ("tc",)
+
+# Distinct raw names remembered per extractor before the memo is reset.
+_MEMO_MAX_ENTRIES = 200_000
+
+# Inline global flags at the start of a pattern, e.g. "(?i)".
+_LEADING_FLAGS = re.compile(r"\(\?([aiLmsux]+)\)")
+
+
+class IdExtractor:
+    """
+    Maps JUnit testcase names to test case ids.
+
+    All patterns are compiled into one alternation and searched in a single
+    pass; the leftmost match wins, ties going to the earlier pattern. Results
+    are memoized per distinct raw name, since parametrized tests repeat the
+    same names across shards and reruns. Names matching no pattern fall back to
+    the raw name, or to "classname::name" when classname_fallback is set.
+
+    Inline global flags at the start of a pattern ("(?i)abc-\\d+") are scoped
+    to that pattern. Groups referenced by number ("\\1") are rejected, since
+    each pattern's groups are renumbered inside the alternation; use a named
+    group and (?P=name) instead.
+    """
+
+    def __init__(self, patterns: Sequence[str], classname_fallback: bool = False) -> None:
+        self.patterns = tuple(patterns)
+        self.classname_fallback = classname_fallback
+
+        alternatives = []
+        self._id_groups: list[str | None] = []
+        for i, pattern in enumerate(self.patterns):
+            try:
+                compiled = re.compile(pattern)
+            except re.error as e:
+                raise ValidationError(f"invalid id pattern '{pattern}' ({e})") from e
+            reference = _numbered_reference(pattern)
+            if reference is not None:
+                raise ValidationError(
+                    f"invalid id pattern '{pattern}' (group reference {reference} by number; use a named group and (?P=name))"
+                )
+            if "id" in compiled.groupindex:
+                # Group names must be unique across the combined alternation.
+                pattern = pattern.replace("(?P<id>", f"(?P<_id{i}>")
+                self._id_groups.append(f"_id{i}")
+            else:
+                self._id_groups.append(None)
+            alternatives.append(f"(?P<_p{i}>{_scope_leading_flags(pattern)})")
+
+        try:
+            self._regex = re.compile("|".join(alternatives)) if alternatives else None
+        except re.error as e:
+            raise ValidationError(f"invalid id patterns {list(self.patterns)} ({e})") from e
+        self._memo: dict[str, str | None] = {}
+
+    @classmethod
+    def from_schemes(cls, schemes: Iterable[str] = DEFAULT_ID_SCHEMES, patterns: Iterable[str] = ()) -> IdExtractor:
+        """
+        Build an extractor from built-in scheme names plus custom regex patterns.
+
+        Raises ValidationError for unknown scheme names or invalid patterns.
+        """
+        compiled_patterns: list[str] = []
+        classname_fallback = False
+        for scheme in schemes:
+            if scheme not in BUILTIN_ID_SCHEMES:
+                raise ValidationError(
+                    f"unknown id scheme '{scheme}' (expected one of: {sorted(BUILTIN_ID_SCHEMES)})"
+                )
+            pattern = BUILTIN_ID_SCHEMES[scheme]
+            if pattern is None:
+                classname_fallback = True
+            elif pattern not in compiled_patterns:
+                compiled_patterns.append(pattern)
+        compiled_patterns.extend(patterns)
+        return cls(compiled_patterns, classname_fallback=classname_fallback)
+
+    @property
+    def signature(self) -> str:
+        """Stable description of the configuration, e.g. for cache keys."""
+        return repr((self.patterns, self.classname_fallback))
+
+    def extract(self, raw_name: str, classname: str | None = None) -> str:
+        """Return the test case id for a (stripped) testcase name."""
+        try:
+            matched = self._memo[raw_name]
+        except KeyError:
+            matched = self._match(raw_name)
+            if len(self._memo) >= _MEMO_MAX_ENTRIES:
+                self._memo.clear()
+            self._memo[raw_name] = matched
+
+        if matched is not None:
+            return matched
+        if self.classname_fallback and classname and raw_name:
+            return f"{classname}::{raw_name}"
+        return raw_name
+
+    def _match(self, raw_name: str) -> str | None:
+        if self._regex is None:
+            return None
+        m = self._regex.search(raw_name)
+        if m is None:
+            return None
+        for i, id_group in enumerate(self._id_groups):
+            if m.group(f"_p{i}") is not None:
+                return m.group(id_group) if id_group is not None else m.group(f"_p{i}")
+        return None
+
+    def __getstate__(self) -> dict:
+        # Sent to worker processes; the memo is rebuilt there.
+        return {"patterns": self.patterns, "classname_fallback": self.classname_fallback}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["patterns"], classname_fallback=state["classname_fallback"])
+
+
+def _scope_leading_flags(pattern: str) -> str:
+    # "(?i)abc" would set the flag for the whole alternation (an error unless
+    # it comes first); "(?i:abc)" applies it to this pattern only.
+    flags = ""
+    m = _LEADING_FLAGS.match(pattern)
+    while m is not None:
+        flags += m.group(1)
+        pattern = pattern[m.end() :]
+        m = _LEADING_FLAGS.match(pattern)
+    return f"(?{flags}:{pattern})" if flags else pattern
+
+
+def _numbered_reference(pattern: str) -> str | None:
+    """Return the first reference to a group by number ("\\1", "(?(1)"), if any."""
+    i = 0
+    in_class = False
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            if not in_class and pattern[i + 1 : i + 2] in tuple("123456789"):
+                return pattern[i : i + 2]
+            i += 2
+            continue
+        if in_class:
+            in_class = c != "]"
+        elif c == "[":
+            in_class = True
+            # A "]" right after "[" or "[^" is a literal.
+            i += 1
+            if pattern[i : i + 1] == "^":
+                i += 1
+            if pattern[i : i + 1] == "]":
+                i += 1
+            continue
+        elif pattern.startswith("(?(", i) and pattern[i + 3 : i + 4].isdigit():
+            return pattern[i : pattern.find(")", i) + 1]
+        i += 1
+    return None
+
+
+DEFAULT_ID_EXTRACTOR = IdExtractor.from_schemes(DEFAULT_ID_SCHEMES)
@@ -1,84 +1,319 @@
 from __future__ import annotations
 
-import re
+import glob
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import BinaryIO
 from xml.etree import ElementTree as ET
 
 from core.errors import IngestionError
+from core.ingestion.compression import DECOMPRESSION_ERRORS, open_input
+from core.ingestion.id_extraction import DEFAULT_ID_EXTRACTOR, IdExtractor
+from core.normalization.models import ResultBatch, TestResultModel
 
-_TC_ID_RE = re.compile(r"\bTC-\d+\b")
+# Bytes fed to the XML parser per read; keeps peak memory flat for multi-GB files.
+_READ_CHUNK_SIZE = 1 << 16
 
+# File names picked up when a results directory is given (plain or compressed).
+_SHARD_SUFFIXES = (".xml", ".xml.gz", ".xml.bz2", ".xml.xz")
 
-def load_junit_results(path: str) -> list[dict]:
+
+def load_junit_results(path: str, id_extractor: IdExtractor | None = None) -> list[dict]:
     """
     Load JUnit XML results into a list of dictionaries.
 
     Output keys are exactly:
       { "id": str, "status": str, "duration_sec": float|None, "raw_name": str|None }
+
+    The id is derived from the testcase name by id_extractor (default: the
+    first TC-<n> token, falling back to the whole name).
+    """
+    return list(iter_junit_results(path, id_extractor))
+
+
+def iter_junit_results(path: str, id_extractor: IdExtractor | None = None) -> Iterator[dict]:
+    """
+    Stream JUnit XML results, yielding one dictionary per <testcase> as it closes.
+
+    Yields the same dictionaries as load_junit_results. The file is fed to the
+    parser in fixed-size chunks and only the attributes and outcome of the
+    currently open testcase are retained (element text such as <system-out> is
+    never buffered), so peak memory does not grow with file size. gzip, bz2 and
+    xz compressed files are detected and decompressed on the fly.
+
+    Raises IngestionError with the same messages as load_junit_results. Errors
+    found late in the file are raised after earlier results have been yielded.
+    """
+    extractor = id_extractor or DEFAULT_ID_EXTRACTOR
+    for attrib, status in _iter_testcases(path):
+        result_id, duration_sec, raw_name = _fields_from_testcase(path, attrib, extractor)
+        yield {
+            "id": result_id,
+            "status": status,
+            "duration_sec": duration_sec,
+            "raw_name": raw_name,
+        }
+
+
+def iter_junit_result_models(path: str, id_extractor: IdExtractor | None = None) -> Iterator[TestResultModel]:
+    """
+    Stream JUnit XML results as validated TestResultModel instances.
+
+    Fused ingest+normalize path: produces the same models as
+    iter_normalized_results(iter_junit_results(path)) without building an
+    intermediate dictionary or re-validating fields. Raises the same
+    IngestionError messages as iter_junit_results.
+    """
+    extractor = id_extractor or DEFAULT_ID_EXTRACTOR
+    for attrib, status in _iter_testcases(path):
+        result_id, duration_sec, raw_name = _fields_from_testcase(path, attrib, extractor)
+        yield TestResultModel(id=result_id, status=status, duration_sec=duration_sec, raw_name=raw_name)
+
+
+def load_junit_result_models(path: str, id_extractor: IdExtractor | None = None) -> list[TestResultModel]:
+    """Load JUnit XML results into a list of TestResultModel (fused path)."""
+    return list(iter_junit_result_models(path, id_extractor))
+
+
+def load_junit_result_batch(path: str, id_extractor: IdExtractor | None = None) -> ResultBatch:
+    """
+    Load JUnit XML results into a columnar ResultBatch.
+
+    No per-result dictionary or model is created; each testcase is appended
+    straight into the batch columns. Raises the same IngestionError messages as
+    load_junit_results. Raw testcase names are not retained.
     """
+    batch = ResultBatch()
+    extractor = id_extractor or DEFAULT_ID_EXTRACTOR
+    for attrib, status in _iter_testcases(path):
+        result_id, duration_sec, _raw_name = _fields_from_testcase(path, attrib, extractor)
+        batch.append(result_id, status, duration_sec)
+    return batch
+
+
+def iter_junit_result_models_stream(
+    stream: BinaryIO, source: str = "<stream>", id_extractor: IdExtractor | None = None
+) -> Iterator[TestResultModel]:
+    """
+    Stream JUnit XML results from an open binary stream (e.g. a request body).
+
+    The stream is read in fixed-size chunks and fed to the incremental parser,
+    so the document is never buffered as a whole; models are yielded as their
+    testcases close. source names the stream in IngestionError messages, which
+    otherwise match iter_junit_result_models. The stream is not closed.
+    """
+    extractor = id_extractor or DEFAULT_ID_EXTRACTOR
+    try:
+        for attrib, status in _iter_testcases_stream(stream):
+            result_id, duration_sec, raw_name = _fields_from_testcase(source, attrib, extractor)
+            yield TestResultModel(id=result_id, status=status, duration_sec=duration_sec, raw_name=raw_name)
+    except (OSError, *DECOMPRESSION_ERRORS) as e:
+        raise IngestionError(f"JUnit '{source}': unable to read stream ({e})") from e
+    except ET.ParseError as e:
+        raise IngestionError(f"JUnit '{source}': invalid XML ({e})") from e
+
+
+def _iter_testcases(path: str) -> Iterator[tuple[dict, str]]:
+    """Yield (attributes, status) for each closed <testcase>, streaming the file."""
     xml_path = Path(path)
     try:
-        tree = ET.parse(xml_path)
+        with open_input(xml_path) as f:
+            yield from _iter_testcases_stream(f)
     except FileNotFoundError as e:
         raise IngestionError(f"JUnit '{path}': file not found") from e
-    except OSError as e:
+    except (OSError, *DECOMPRESSION_ERRORS) as e:
         raise IngestionError(f"JUnit '{path}': unable to read file ({e})") from e
     except ET.ParseError as e:
         raise IngestionError(f"JUnit '{path}': invalid XML ({e})") from e
 
-    root = tree.getroot()
-
-    out: list[dict] = []
-    for tc in _iter_testcases(root):
-        raw_name = (tc.attrib.get("name") or "").strip()
-
-        duration_sec: float | None = None
-        time_attr = tc.attrib.get("time")
-        if time_attr is not None and time_attr.strip() != "":
-            try:
-                duration_sec = float(time_attr)
-            except ValueError as e:
-                raise IngestionError(
-                    f"JUnit '{path}': invalid testcase time value '{time_attr}' for name '{raw_name}'"
-                ) from e
-
-        status = _status_from_testcase(tc)
-
-        m = _TC_ID_RE.search(raw_name)
-        result_id = m.group(0) if m else raw_name
-        result_id = result_id.strip()
-        if result_id == "":
-            raise IngestionError(f"JUnit '{path}': empty testcase id (name missing or blank)")
-
-        out.append(
-            {
-                "id": result_id,
-                "status": status,
-                "duration_sec": duration_sec,
-                "raw_name": raw_name if raw_name != "" else None,
-            }
-        )
-
-    return out
-
-
-def _iter_testcases(root: ET.Element):
-    # Supports <testsuite> root, <testsuites> root, or nested structures.
-    for el in root.iter():
-        if _local_name(el.tag) == "testcase":
-            yield el
-
-
-def _status_from_testcase(tc: ET.Element) -> str:
-    has_failure_or_error = False
-    has_skipped = False
-    for child in list(tc):
-        t = _local_name(child.tag)
-        if t in {"failure", "error"}:
-            has_failure_or_error = True
-        elif t == "skipped":
-            has_skipped = True
 
+def _iter_testcases_stream(f: BinaryIO) -> Iterator[tuple[dict, str]]:
+    """Feed f to the incremental parser chunk by chunk, yielding closed testcases."""
+    collector = _TestcaseCollector()
+    parser = ET.XMLParser(target=collector)
+    while True:
+        chunk = f.read(_READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        parser.feed(chunk)
+        yield from collector.drain()
+    parser.close()
+    yield from collector.drain()
+
+
+def resolve_junit_paths(spec: str) -> list[Path]:
+    """
+    Expand a JUnit results spec into a sorted list of files.
+
+    The spec may be a single file, a directory (all *.xml files directly inside
+    it, optionally compressed as .gz/.bz2/.xz) or a glob pattern (``**`` is
+    recursive). Paths are sorted so shard order, and therefore merged output,
+    is deterministic across runs and machines.
+    """
+    spec_path = Path(spec)
+    if spec_path.is_dir():
+        paths = sorted(p for p in spec_path.iterdir() if p.name.endswith(_SHARD_SUFFIXES) and p.is_file())
+    elif glob.has_magic(spec):
+        paths = sorted(Path(p) for p in glob.glob(spec, recursive=True) if Path(p).is_file())
+    else:
+        return [spec_path]
+
+    if not paths:
+        raise IngestionError(f"JUnit '{spec}': no result files matched")
+    return paths
+
+
+def load_junit_results_many(
+    paths: Iterable[str | Path], max_workers: int | None = None, id_extractor: IdExtractor | None = None
+) -> list[dict]:
+    """
+    Load several JUnit XML shards, parsing them in parallel worker processes.
+
+    Results are concatenated in the order the paths are given, so the output is
+    identical to calling load_junit_results on each path serially. With
+    max_workers=1 (or a single path) everything runs in-process.
+
+    Raises the IngestionError of the first failing shard in path order.
+    """
+    return list(iter_junit_results_many(paths, max_workers=max_workers, id_extractor=id_extractor))
+
+
+def iter_junit_results_many(
+    paths: Iterable[str | Path], max_workers: int | None = None, id_extractor: IdExtractor | None = None
+) -> Iterator[dict]:
+    """
+    Stream results from several JUnit XML shards in path order.
+
+    Same ordering and error semantics as load_junit_results_many. In-process
+    parsing streams testcase by testcase; with worker processes, each shard is
+    handed back whole and yielded before the next one is taken.
+    """
+    return _iter_shards(paths, max_workers, iter_junit_results, load_junit_results, id_extractor)
+
+
+def iter_junit_result_models_many(
+    paths: Iterable[str | Path], max_workers: int | None = None, id_extractor: IdExtractor | None = None
+) -> Iterator[TestResultModel]:
+    """Fused-path counterpart of iter_junit_results_many yielding TestResultModel."""
+    return _iter_shards(paths, max_workers, iter_junit_result_models, load_junit_result_models, id_extractor)
+
+
+def load_junit_result_batch_many(
+    paths: Iterable[str | Path], max_workers: int | None = None, id_extractor: IdExtractor | None = None
+) -> ResultBatch:
+    """
+    Load several JUnit XML shards into one ResultBatch, in path order.
+
+    Shards are parsed in worker processes as with load_junit_results_many; the
+    columnar batches pickle compactly, which keeps the transfer back cheap.
+    """
+    path_strs = [str(p) for p in paths]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(path_strs)))
+
+    batch = ResultBatch()
+    if max_workers == 1:
+        for p in path_strs:
+            batch.extend(load_junit_result_batch(p, id_extractor))
+        return batch
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for shard in pool.map(partial(load_junit_result_batch, id_extractor=id_extractor), path_strs):
+            batch.extend(shard)
+    return batch
+
+
+def _iter_shards(
+    paths: Iterable[str | Path],
+    max_workers: int | None,
+    iter_one: Callable[[str, IdExtractor | None], Iterator],
+    load_one: Callable[[str, IdExtractor | None], list],
+    id_extractor: IdExtractor | None,
+) -> Iterator:
+    path_strs = [str(p) for p in paths]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(path_strs)))
+
+    if max_workers == 1:
+        for p in path_strs:
+            yield from iter_one(p, id_extractor)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        # map() yields in submission order regardless of completion order.
+        for shard in pool.map(partial(load_one, id_extractor=id_extractor), path_strs):
+            yield from shard
+
+
+class _TestcaseCollector:
+    """
+    XMLParser target that records closed <testcase> elements.
+
+    No element tree is built: the parser only reports tag boundaries, and each
+    open testcase keeps its attributes plus the outcome implied by its direct
+    children. Supports <testsuite> root, <testsuites> root, or nested structures.
+    """
+
+    def __init__(self) -> None:
+        # One frame per open element: [attrib, has_failure_or_error, has_skipped]
+        # for testcases, None for everything else.
+        self._open: list[list | None] = []
+        self._closed: list[tuple[dict, str]] = []
+
+    def start(self, tag: str, attrib: dict) -> None:
+        if _local_name(tag) == "testcase":
+            self._open.append([attrib, False, False])
+        else:
+            self._open.append(None)
+
+    def end(self, tag: str) -> None:
+        frame = self._open.pop()
+        if frame is not None:
+            self._closed.append((frame[0], _status_from_flags(frame[1], frame[2])))
+
+        parent = self._open[-1] if self._open else None
+        if parent is not None:
+            t = _local_name(tag)
+            if t in {"failure", "error"}:
+                parent[1] = True
+            elif t == "skipped":
+                parent[2] = True
+
+    def drain(self) -> list[tuple[dict, str]]:
+        closed, self._closed = self._closed, []
+        return closed
+
+
+def _fields_from_testcase(
+    path: str, attrib: dict, extractor: IdExtractor
+) -> tuple[str, float | None, str | None]:
+    """Extract (id, duration_sec, raw_name) from testcase attributes."""
+    raw_name = (attrib.get("name") or "").strip()
+
+    duration_sec: float | None = None
+    time_attr = attrib.get("time")
+    if time_attr is not None and time_attr.strip() != "":
+        try:
+            duration_sec = float(time_attr)
+        except ValueError as e:
+            raise IngestionError(
+                f"JUnit '{path}': invalid testcase time value '{time_attr}' for name '{raw_name}'"
+            ) from e
+
+    classname = (attrib.get("classname") or "").strip()
+    result_id = extractor.extract(raw_name, classname).strip()
+    if result_id == "":
+        raise IngestionError(f"JUnit '{path}': empty testcase id (name missing or blank)")
+
+    return result_id, duration_sec, raw_name if raw_name != "" else None
+
+
+def _status_from_flags(has_failure_or_error: bool, has_skipped: bool) -> str:
     if has_failure_or_error:
         return "failed"
     if has_skipped:
@@ -89,5 +324,3 @@ def _status_from_testcase(tc: ET.Element) -> str:
 def _local_name(tag: str) -> str:
     # Handles tags with namespaces: "{ns}testcase" -> "testcase"
     return tag.rsplit("}", 1)[-1]
-
-
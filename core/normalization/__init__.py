@@ -1,11 +1,16 @@
 """Normalization package (Phase 1 skeleton)."""
 
-from .normalizer import normalize
-from .models import NormalizedData, TestCaseModel, TestResultModel
+from .normalizer import iter_normalized_results, normalize, normalize_test_cases
+from .models import STATUS_CODES, STATUS_NAMES, NormalizedData, ResultBatch, TestCaseModel, TestResultModel
 
 __all__ = [
     "normalize",
+    "normalize_test_cases",
+    "iter_normalized_results",
     "NormalizedData",
     "TestCaseModel",
     "TestResultModel",
+    "ResultBatch",
+    "STATUS_CODES",
+    "STATUS_NAMES",
 ]
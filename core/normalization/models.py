@@ -1,6 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import math
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+# Status <-> int8 code mapping used by columnar result storage.
+STATUS_NAMES: tuple[str, ...] = ("passed", "failed", "skipped")
+STATUS_CODES: dict[str, int] = {name: code for code, name in enumerate(STATUS_NAMES)}
 
 
 @dataclass(frozen=True, slots=True)
@@ -20,9 +28,55 @@ class TestResultModel:
     raw_name: str | None = None
 
 
+@dataclass(slots=True)
+class ResultBatch:
+    """
+    Columnar, array-backed storage for many test results.
+
+    Row i is (ids[i], STATUS_NAMES[status_codes[i]], durations[i]). Ids are
+    interned so repeated ids share one string, statuses are int8 codes and
+    durations are float64 with NaN standing in for a missing duration. Raw
+    testcase names are not retained.
+    """
+
+    ids: list[str] = field(default_factory=list)
+    status_codes: array = field(default_factory=lambda: array("b"))
+    durations: array = field(default_factory=lambda: array("d"))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, result_id: str, status: str, duration_sec: float | None = None) -> None:
+        """Append one result; raises KeyError for an unknown status."""
+        code = STATUS_CODES[status]
+        self.ids.append(sys.intern(result_id))
+        self.status_codes.append(code)
+        self.durations.append(math.nan if duration_sec is None else duration_sec)
+
+    def extend(self, other: ResultBatch) -> None:
+        """Append all rows of another batch (e.g. a parsed shard)."""
+        self.ids.extend(other.ids)
+        self.status_codes.extend(other.status_codes)
+        self.durations.extend(other.durations)
+
+    @classmethod
+    def from_results(cls, results: Iterable[TestResultModel]) -> ResultBatch:
+        batch = cls()
+        for r in results:
+            batch.append(r.id, r.status, r.duration_sec)
+        return batch
+
+    def iter_results(self) -> Iterator[TestResultModel]:
+        """Yield rows as TestResultModel (raw_name is always None)."""
+        for result_id, code, duration in zip(self.ids, self.status_codes, self.durations):
+            yield TestResultModel(
+                id=result_id,
+                status=STATUS_NAMES[code],
+                duration_sec=None if math.isnan(duration) else duration,
+            )
+
+
 @dataclass(frozen=True, slots=True)
 class NormalizedData:
     test_cases: dict[str, TestCaseModel]
-    results: list[TestResultModel]
-
-
+    results: list[TestResultModel] | ResultBatch
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+
 from core.errors import ValidationError
 from core.normalization.models import NormalizedData, TestCaseModel, TestResultModel
 
@@ -16,6 +18,17 @@ def normalize(test_case_dicts: list[dict], result_dicts: list[dict]) -> Normaliz
     - Invalid duration_sec values
     - Empty/missing required fields
     """
+    test_cases = normalize_test_cases(test_case_dicts)
+    results = list(iter_normalized_results(result_dicts))
+    return NormalizedData(test_cases=test_cases, results=results)
+
+
+def normalize_test_cases(test_case_dicts: Iterable[dict]) -> dict[str, TestCaseModel]:
+    """
+    Normalize test case dictionaries into a catalog keyed by test case id.
+
+    Raises ValidationError for duplicate ids and empty/missing ids.
+    """
     test_cases: dict[str, TestCaseModel] = {}
     for d in test_case_dicts:
         tc_id = _get_str_field(d, "id", required=True).strip()
@@ -37,7 +50,16 @@ def normalize(test_case_dicts: list[dict], result_dicts: list[dict]) -> Normaliz
             component=component,
         )
 
-    results: list[TestResultModel] = []
+    return test_cases
+
+
+def iter_normalized_results(result_dicts: Iterable[dict]) -> Iterator[TestResultModel]:
+    """
+    Lazily normalize result dictionaries, one TestResultModel per input.
+
+    Raises ValidationError (when the offending item is reached) for invalid
+    status values, invalid duration_sec values and empty/missing ids.
+    """
     for d in result_dicts:
         result_id = _get_str_field(d, "id", required=True).strip()
         if result_id == "":
@@ -56,17 +78,13 @@ def normalize(test_case_dicts: list[dict], result_dicts: list[dict]) -> Normaliz
 
         raw_name = _none_if_blank(_get_str_field(d, "raw_name", required=False))
 
-        results.append(
-            TestResultModel(
-                id=result_id,
-                status=status,
-                duration_sec=duration_sec,
-                raw_name=raw_name,
-            )
+        yield TestResultModel(
+            id=result_id,
+            status=status,
+            duration_sec=duration_sec,
+            raw_name=raw_name,
         )
 
-    return NormalizedData(test_cases=test_cases, results=results)
-
 
 def _get_str_field(d: dict, key: str, required: bool) -> str:
     v = d.get(key)
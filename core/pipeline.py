@@ -1,41 +1,352 @@
 from __future__ import annotations
 
-from core.normalization import normalize
-from core.scoring.scorer import compute_metrics
-from core.reporting.report_builder import build_markdown_report
+import asyncio
+from collections.abc import Iterable, Mapping
+
+from core.history.store import RunHistoryStore
+from core.ingestion.cache import ParseCache
+from core.ingestion.csv_loader import load_test_case_catalog_csv, load_test_case_catalog_csv_parallel
+from core.ingestion.id_extraction import IdExtractor
+from core.ingestion.junit_loader import (
+    iter_junit_result_models_many,
+    load_junit_result_batch_many,
+    resolve_junit_paths,
+)
+from core.normalization import iter_normalized_results, normalize_test_cases
+from core.normalization.models import ResultBatch, TestCaseModel, TestResultModel
+from core.scoring.breakdown import BreakdownAccumulator, CatalogGroupIndex
+from core.scoring.durations import DurationAccumulator
+from core.scoring.scorer import MetricsAccumulator
+from core.reasoning.diff import diff_results
+from core.reasoning.flaky import FlakinessTracker
+from core.reporting.model import build_report_model
+from core.reporting.report_builder import render_markdown
 from pack.config import ScoringConfig, compute_score_with_config, classify_risk_with_config
 from pack.insights import generate_insights
 
+_DEFAULT_CONFIG = ScoringConfig()
+
+
+class Pipeline:
+    """
+    A pipeline bound to one test-case catalog, for evaluating many result sets.
+
+    The catalog is normalized and indexed (per-case breakdown groups) once,
+    together with the scoring config and id extractor, so each evaluate call
+    only does the per-results work: folding the results, scoring and
+    rendering. test_cases is a normalized catalog (id -> TestCaseModel) or
+    test case dicts to normalize. Outputs are identical to run_pipeline /
+    run_pipeline_from_files on the same inputs (with the default config).
+    """
+
+    __slots__ = ("test_cases", "config", "id_extractor", "_groups")
+
+    def __init__(
+        self,
+        test_cases: Mapping[str, TestCaseModel] | Iterable[dict],
+        config: ScoringConfig | None = None,
+        id_extractor: IdExtractor | None = None,
+    ) -> None:
+        self.test_cases = test_cases if isinstance(test_cases, Mapping) else normalize_test_cases(test_cases)
+        self.config = config or _DEFAULT_CONFIG
+        self.id_extractor = id_extractor
+        self._groups = CatalogGroupIndex(self.test_cases)
+
+    @classmethod
+    def from_csv(
+        cls,
+        tests_path: str,
+        max_workers: int = 1,
+        cache: ParseCache | None = None,
+        config: ScoringConfig | None = None,
+        id_extractor: IdExtractor | None = None,
+    ) -> Pipeline:
+        """Load the catalog from a test case CSV (see run_pipeline_from_files)."""
+        return cls(_load_catalog(tests_path, cache, max_workers), config=config, id_extractor=id_extractor)
+
+    def evaluate(
+        self,
+        results: Iterable[TestResultModel] | ResultBatch,
+        history: RunHistoryStore | None = None,
+        baseline: Iterable[TestResultModel] | ResultBatch | None = None,
+    ) -> dict:
+        """
+        Evaluate normalized results against the catalog; returns the run_pipeline dict.
+
+        history and baseline are as in run_pipeline.
+        """
+        return _run_normalized(
+            self.test_cases, results, history, baseline=baseline, config=self.config, group_index=self._groups
+        )
+
+    def accumulators(self) -> RunAccumulators:
+        """Return empty accumulators for folding results incrementally (see evaluate_accumulated)."""
+        return RunAccumulators(self.test_cases, group_index=self._groups)
+
+    def evaluate_accumulated(self, accumulators: RunAccumulators) -> dict:
+        """Score and render results already folded into accumulators; returns the run_pipeline dict."""
+        return _output_from_accumulators(self.test_cases, accumulators, self.config)
+
+    def evaluate_dicts(
+        self,
+        result_dicts: Iterable[dict],
+        history: RunHistoryStore | None = None,
+        baseline: Iterable[TestResultModel] | ResultBatch | None = None,
+    ) -> dict:
+        """Normalize result dicts (re-deriving ids with the id extractor, if any) and evaluate them."""
+        if self.id_extractor is not None:
+            result_dicts = _reextract_ids(result_dicts, self.id_extractor)
+        return self.evaluate(iter_normalized_results(result_dicts), history=history, baseline=baseline)
+
+    def evaluate_file(
+        self,
+        results_path: str,
+        max_workers: int = 1,
+        cache: ParseCache | None = None,
+        history: RunHistoryStore | None = None,
+        baseline: Iterable[TestResultModel] | ResultBatch | None = None,
+    ) -> dict:
+        """Load JUnit results (file, directory or glob of shards) and evaluate them."""
+        if cache is not None or history is not None or baseline is not None:
+            results = _load_result_batch(results_path, max_workers, cache, self.id_extractor)
+        else:
+            results = iter_junit_result_models_many(
+                resolve_junit_paths(results_path), max_workers=max_workers, id_extractor=self.id_extractor
+            )
+        return self.evaluate(results, history=history, baseline=baseline)
+
+
+class RunAccumulators:
+    """
+    The accumulators one run's results are folded into: metrics, per-group
+    breakdowns, durations and, given a tracker seeded from stored runs,
+    flakiness. Without one, flakiness is not tracked (a single run cannot
+    show a flaky test) and the output's flaky_tests is empty.
+
+    Accumulators built against the same catalog can be merged; merging
+    per-shard accumulators in shard order gives the same output as folding
+    all results in that order (up to floating-point rounding of duration
+    totals), so shards can be folded independently.
+    """
+
+    __slots__ = ("totals", "groups", "timings", "flakiness")
+
+    def __init__(
+        self,
+        test_cases: Mapping[str, TestCaseModel],
+        group_index: CatalogGroupIndex | None = None,
+        flakiness: FlakinessTracker | None = None,
+    ) -> None:
+        self.totals = MetricsAccumulator(test_cases)
+        if group_index is not None:
+            self.groups = BreakdownAccumulator.from_index(group_index)
+        else:
+            self.groups = BreakdownAccumulator(test_cases)
+        self.timings = DurationAccumulator()
+        self.flakiness = flakiness
+
+    def fold(self, results: Iterable[TestResultModel] | ResultBatch) -> RunAccumulators:
+        """Fold results into every accumulator in one pass; returns self."""
+        accumulators = (self.totals, self.groups, self.timings)
+        if self.flakiness is not None:
+            accumulators += (self.flakiness,)
+        _fold_results(results, accumulators)
+        return self
+
+    def merge(self, other: RunAccumulators) -> RunAccumulators:
+        """Add another run's accumulators (results that came after this one's); returns self."""
+        self.totals.merge(other.totals)
+        self.groups.merge(other.groups)
+        self.timings.merge(other.timings)
+        if other.flakiness is not None:
+            if self.flakiness is None:
+                self.flakiness = FlakinessTracker(other.flakiness.window)
+            self.flakiness.merge(other.flakiness)
+        return self
+
 
-def run_pipeline(test_case_dicts: list[dict], result_dicts: list[dict]) -> dict:
+def run_pipeline(
+    test_case_dicts: Iterable[dict],
+    result_dicts: Iterable[dict],
+    id_extractor: IdExtractor | None = None,
+    history: RunHistoryStore | None = None,
+    baseline: Iterable[TestResultModel] | ResultBatch | None = None,
+) -> dict:
     """
     Run the end-to-end QA pipeline: normalize, compute metrics, score, risk, and generate report.
 
+    Both inputs may be any iterable, e.g. iter_test_cases_csv / iter_junit_results.
+    Results are normalized and folded into the metrics one at a time and are
+    never held as a list, so memory depends on the catalog size only.
+
+    With id_extractor, result ids are re-derived from each result's raw_name
+    and optional classname, as the JUnit loaders do (results without a
+    raw_name keep their id). With history, the run and its per-test statuses
+    are appended to the store (results are then collected into a columnar
+    ResultBatch) and the output gains a run_id. With baseline
+    results (e.g. the last released build), the output gains a diff (see
+    diff_results) and the report a "Changes Since Baseline" section.
+
     Returns dict with:
     - metrics: dictionary from compute_metrics
     - score: release readiness score (0-100)
     - risk: risk level ("Low", "Medium", or "High")
     - markdown_report: complete markdown report string
+    - report: the ReportModel the report was rendered from (see save_reports
+      for other formats)
     - counts: dictionary with test_cases_count, results_count, mapped_results_count
     - insights: list of insights derived from metrics, score, and risk
+    - breakdowns: per-component and per-priority group rows (see BreakdownAccumulator)
+    - durations: total/mean/p50/p95/p99 and slowest results (see DurationAccumulator)
+    - flaky_tests: tests flipping between passed and failed across the recent
+      stored runs and this one (see FlakinessTracker); empty without history
+    """
+    pipeline = Pipeline(normalize_test_cases(test_case_dicts), id_extractor=id_extractor)
+    return pipeline.evaluate_dicts(result_dicts, history=history, baseline=baseline)
+
+
+def run_pipeline_from_files(
+    tests_path: str,
+    results_path: str,
+    max_workers: int = 1,
+    cache: ParseCache | None = None,
+    id_extractor: IdExtractor | None = None,
+    history: RunHistoryStore | None = None,
+    baseline: Iterable[TestResultModel] | ResultBatch | None = None,
+) -> dict:
+    """
+    Run the pipeline directly on a test case CSV and JUnit results.
+
+    Uses the fused loaders, which emit validated models straight from the CSV
+    reader and XML parser. results_path may be a file, directory or glob of
+    shards (parsed with max_workers processes); with max_workers > 1 a large
+    catalog CSV is also split into chunks and parsed in parallel. With a
+    ParseCache, inputs whose fingerprint is already cached are not parsed at
+    all. id_extractor selects how testcase names map to ids; history and
+    baseline are as in run_pipeline. Returns the same dict as run_pipeline on
+    the equivalent loaded dictionaries.
+    """
+    test_cases = _load_catalog(tests_path, cache, max_workers)
+    if cache is not None or history is not None or baseline is not None:
+        results = _load_result_batch(results_path, max_workers, cache, id_extractor)
+        return _run_normalized(test_cases, results, history, baseline=baseline)
+
+    results = iter_junit_result_models_many(
+        resolve_junit_paths(results_path), max_workers=max_workers, id_extractor=id_extractor
+    )
+    return _run_normalized(test_cases, results)
+
+
+async def run_pipeline_async(
+    tests_path: str,
+    results_path: str,
+    max_workers: int = 1,
+    cache: ParseCache | None = None,
+    id_extractor: IdExtractor | None = None,
+    history: RunHistoryStore | None = None,
+    baseline: Iterable[TestResultModel] | ResultBatch | None = None,
+) -> dict:
+    """
+    Async variant of run_pipeline_from_files that loads both inputs concurrently.
+
+    The catalog CSV and the JUnit results are independent, so each is read and
+    parsed in its own worker thread and their I/O overlaps (useful on network
+    mounts). Results are collected as a columnar ResultBatch. Returns the same
+    dict as run_pipeline_from_files; the first loading error is raised.
     """
-    data = normalize(test_case_dicts, result_dicts)
-    metrics = compute_metrics(data)
-    config = ScoringConfig()
+    test_cases, results = await asyncio.gather(
+        asyncio.to_thread(_load_catalog, tests_path, cache, max_workers),
+        asyncio.to_thread(_load_result_batch, results_path, max_workers, cache, id_extractor),
+    )
+    # SQLite connections are bound to their creating thread, so history is
+    # read and the run recorded on the caller's thread.
+    flakiness = FlakinessTracker.from_history(history) if history is not None else None
+    output = await asyncio.to_thread(_run_normalized, test_cases, results, None, flakiness, baseline)
+    if history is not None:
+        output["run_id"] = history.record_run(output, results)
+    return output
+
+
+def _load_catalog(tests_path: str, cache: ParseCache | None, max_workers: int) -> dict[str, TestCaseModel]:
+    if cache is not None:
+        return cache.load_test_case_catalog(tests_path)
+    if max_workers != 1:
+        # Scoring never reads descriptions, so the parallel loader skips them.
+        return load_test_case_catalog_csv_parallel(tests_path, max_workers=max_workers)
+    return load_test_case_catalog_csv(tests_path)
+
+
+def _load_result_batch(
+    results_path: str, max_workers: int, cache: ParseCache | None, id_extractor: IdExtractor | None
+) -> ResultBatch:
+    result_paths = resolve_junit_paths(results_path)
+    if cache is not None:
+        return cache.load_junit_result_batch_many(result_paths, max_workers=max_workers, id_extractor=id_extractor)
+    return load_junit_result_batch_many(result_paths, max_workers=max_workers, id_extractor=id_extractor)
+
+
+def _reextract_ids(result_dicts: Iterable[dict], id_extractor: IdExtractor) -> Iterable[dict]:
+    for d in result_dicts:
+        raw_name = d.get("raw_name")
+        if raw_name is not None and str(raw_name).strip() != "":
+            classname = d.get("classname")
+            classname = str(classname).strip() if classname is not None else None
+            d = {**d, "id": id_extractor.extract(str(raw_name).strip(), classname)}
+        yield d
+
+
+def _run_normalized(
+    test_cases: dict[str, TestCaseModel],
+    results: Iterable[TestResultModel] | ResultBatch,
+    history: RunHistoryStore | None = None,
+    flakiness: FlakinessTracker | None = None,
+    baseline: Iterable[TestResultModel] | ResultBatch | None = None,
+    config: ScoringConfig = _DEFAULT_CONFIG,
+    group_index: CatalogGroupIndex | None = None,
+) -> dict:
+    if (history is not None or baseline is not None) and not isinstance(results, ResultBatch):
+        # Stored per-test statuses and the diff need a second pass over the results.
+        results = ResultBatch.from_results(results)
+    if flakiness is None and history is not None:
+        # Flakiness spans runs: recent stored runs come first.
+        flakiness = FlakinessTracker.from_history(history)
+    accumulators = RunAccumulators(test_cases, group_index=group_index, flakiness=flakiness).fold(results)
+    diff = diff_results(baseline, results) if baseline is not None else None
+    output = _output_from_accumulators(test_cases, accumulators, config, diff=diff)
+    if history is not None:
+        output["run_id"] = history.record_run(output, results)
+    return output
+
+
+def _output_from_accumulators(
+    test_cases: Mapping[str, TestCaseModel],
+    accumulators: RunAccumulators,
+    config: ScoringConfig,
+    diff: dict | None = None,
+) -> dict:
+    metrics = accumulators.totals.metrics()
+    breakdowns = accumulators.groups.breakdowns()
+    durations = accumulators.timings.summary()
+    flaky_tests = accumulators.flakiness.flaky_tests() if accumulators.flakiness is not None else []
+
     score = compute_score_with_config(metrics, config)
     risk = classify_risk_with_config(score, config)
-    insights = generate_insights(metrics, score, risk)
-    markdown = build_markdown_report(metrics, score, risk, insights=insights)
+    insights = generate_insights(metrics, score, risk, durations=durations, flaky_tests=flaky_tests)
+    report = build_report_model(
+        metrics, score, risk, insights=insights, breakdowns=breakdowns, durations=durations, diff=diff
+    )
+    markdown = render_markdown(report)
 
-    test_cases_count = len(data.test_cases)
-    results_count = len(data.results)
+    test_cases_count = len(test_cases)
+    results_count = metrics["total_results"]
     mapped_results_count = metrics["mapped_results"]
 
-    return {
+    output = {
         "metrics": metrics,
         "score": score,
         "risk": risk,
         "markdown_report": markdown,
+        "report": report,
         "counts": {
             "test_cases_count": test_cases_count,
             "results_count": results_count,
@@ -45,6 +356,23 @@ def run_pipeline(test_case_dicts: list[dict], result_dicts: list[dict]) -> dict:
             {"code": i.code, "severity": i.severity, "title": i.title, "details": i.details}
             for i in insights
         ],
+        "breakdowns": breakdowns,
+        "durations": durations,
+        "flaky_tests": flaky_tests,
     }
+    if diff is not None:
+        output["diff"] = diff
+    return output
 
 
+def _fold_results(results: Iterable[TestResultModel] | ResultBatch, accumulators: tuple) -> None:
+    # A batch is held in memory and each accumulator scans its columns; any
+    # other iterable may be single-use, so it is fanned out row by row.
+    if isinstance(results, ResultBatch):
+        for acc in accumulators:
+            acc.add_batch(results)
+        return
+    adders = [acc.add for acc in accumulators]
+    for r in results:
+        for add in adders:
+            add(r)
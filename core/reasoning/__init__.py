@@ -1,2 +1,11 @@
-"""Reasoning package (Phase 1 skeleton)."""
+"""Reasoning package: cross-run analysis such as flaky-test detection and run-to-run diffs."""
 
+from .diff import DIFF_CATEGORIES, diff_history_runs, diff_results
+from .flaky import FlakinessTracker
+
+__all__ = [
+    "DIFF_CATEGORIES",
+    "diff_history_runs",
+    "diff_results",
+    "FlakinessTracker",
+]
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from core.history.store import RunHistoryStore
+from core.normalization.models import STATUS_CODES, ResultBatch, TestResultModel
+
+# Categories of a diff, in report order.
+DIFF_CATEGORIES: tuple[str, ...] = ("new_failures", "fixed", "newly_skipped", "disappeared", "added")
+
+_PASSED = STATUS_CODES["passed"]
+_FAILED = STATUS_CODES["failed"]
+_SKIPPED = STATUS_CODES["skipped"]
+
+
+def diff_results(
+    baseline: Iterable[TestResultModel] | ResultBatch, candidate: Iterable[TestResultModel] | ResultBatch
+) -> dict:
+    """
+    Compare two result sets by test id.
+
+    Each side is hashed into an id -> status map in one pass (for repeated ids,
+    e.g. reruns, the last result wins) and the maps are joined in O(n); only
+    the changed ids are sorted. Returns:
+    - baseline_tests / candidate_tests: distinct ids on each side
+    - new_failures: failed now, not failed in the baseline (or not present)
+    - fixed: failed in the baseline, passed now
+    - newly_skipped: skipped now, passed or failed in the baseline
+    - disappeared: in the baseline only
+    - added: in the candidate only
+    Id lists are sorted.
+    """
+    base = _status_map(baseline)
+    cand = _status_map(candidate)
+
+    new_failures = []
+    fixed = []
+    newly_skipped = []
+    common = 0
+    for test_id, code in cand.items():
+        before = base.get(test_id)
+        if before is None:
+            if code == _FAILED:
+                new_failures.append(test_id)
+            continue
+        common += 1
+        if code == before:
+            continue
+        if code == _FAILED:
+            new_failures.append(test_id)
+        elif code == _PASSED and before == _FAILED:
+            fixed.append(test_id)
+        elif code == _SKIPPED:
+            newly_skipped.append(test_id)
+
+    # Set differences are only needed when the id sets are not identical.
+    return {
+        "baseline_tests": len(base),
+        "candidate_tests": len(cand),
+        "new_failures": sorted(new_failures),
+        "fixed": sorted(fixed),
+        "newly_skipped": sorted(newly_skipped),
+        "disappeared": sorted(base.keys() - cand.keys()) if common < len(base) else [],
+        "added": sorted(cand.keys() - base.keys()) if common < len(cand) else [],
+    }
+
+
+def diff_history_runs(store: RunHistoryStore, baseline_run_id: int, candidate_run_id: int) -> dict:
+    """
+    Compare two runs stored in a RunHistoryStore (see diff_results).
+
+    Raises ValidationError if either run does not exist.
+    """
+    return diff_results(store.run_results(baseline_run_id), store.run_results(candidate_run_id))
+
+
+def _status_map(results: Iterable[TestResultModel] | ResultBatch) -> dict[str, int]:
+    if isinstance(results, ResultBatch):
+        return dict(zip(results.ids, results.status_codes))
+    return {r.id: STATUS_CODES[r.status] for r in results}
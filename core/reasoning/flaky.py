@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from core.errors import ValidationError
+from core.history.store import RunHistoryStore
+from core.normalization.models import STATUS_CODES, ResultBatch, TestResultModel
+
+# Pass/fail observations kept per test.
+DEFAULT_WINDOW = 64
+# Stored runs replayed by from_history.
+DEFAULT_HISTORY_RUNS = 20
+# Flips (passed <-> failed transitions) at which a test is reported as flaky.
+DEFAULT_MIN_FLIPS = 2
+
+_PASSED = STATUS_CODES["passed"]
+_FAILED = STATUS_CODES["failed"]
+
+
+class FlakinessTracker:
+    """
+    Rolling pass/fail bit history per test id, one observation per run.
+
+    Each test's history is a single int: bit 0 is the most recent run's
+    observation (1 = failed, 0 = passed), older runs are shifted up, and a
+    leading sentinel bit marks how many runs are held (at most window). Flips
+    are counted as popcount(bits ^ (bits >> 1)) over adjacent pairs, so
+    detection costs O(tests) integer operations instead of rescanning stored
+    results.
+
+    Results are recorded into the current run, where each test collapses to a
+    single outcome: failed if any of its results failed, passed if any passed,
+    and no observation if it was only skipped. Reruns and parametrized results
+    therefore never count as separate runs. end_run closes the current run;
+    queries treat a run still open as the most recent observation.
+    """
+
+    __slots__ = ("window", "_history", "_run")
+
+    def __init__(self, window: int = DEFAULT_WINDOW) -> None:
+        if window < 2:
+            raise ValidationError(f"flakiness window must be >= 2 (got {window})")
+        self.window = window
+        self._history: dict[str, int] = {}
+        self._run: dict[str, int] = {}  # current run: test id -> 1 if any result failed
+
+    @classmethod
+    def from_history(
+        cls, store: RunHistoryStore, runs: int = DEFAULT_HISTORY_RUNS, window: int = DEFAULT_WINDOW
+    ) -> FlakinessTracker:
+        """Build a tracker from the last runs stored in a RunHistoryStore, oldest first."""
+        tracker = cls(window)
+        for record in reversed(store.recent_runs(limit=runs)):
+            tracker.add_batch(store.run_results(record.run_id)).end_run()
+        return tracker
+
+    def add(self, result: TestResultModel) -> None:
+        """Record one result of the current run (skipped results are ignored)."""
+        if result.status == "failed":
+            self._run[result.id] = 1
+        elif result.status == "passed":
+            self._run.setdefault(result.id, 0)
+
+    def add_all(self, results: Iterable[TestResultModel]) -> FlakinessTracker:
+        """Record every result of an iterable into the current run; returns self."""
+        for r in results:
+            self.add(r)
+        return self
+
+    def add_batch(self, batch: ResultBatch) -> FlakinessTracker:
+        """Record every result of a columnar ResultBatch into the current run; returns self."""
+        run = self._run
+        for result_id, code in zip(batch.ids, batch.status_codes):
+            if code == _FAILED:
+                run[result_id] = 1
+            elif code == _PASSED:
+                run.setdefault(result_id, 0)
+        return self
+
+    def end_run(self) -> FlakinessTracker:
+        """Close the current run, adding one observation per test seen in it; returns self."""
+        history = self._history
+        for test_id, failed in self._run.items():
+            history[test_id] = self._push(history.get(test_id, 1), failed)
+        self._run = {}
+        return self
+
+    def merge(self, other: FlakinessTracker) -> FlakinessTracker:
+        """
+        Append another tracker's runs after this one's; returns self.
+
+        The other tracker's open run is combined with this one's, so merging
+        per-shard trackers of one run gives the same outcome as recording all
+        of its results in a single tracker. If the other tracker has closed
+        runs, this one's open run is closed before they are appended. Raises
+        ValidationError if the windows differ.
+        """
+        if other.window != self.window:
+            raise ValidationError(f"cannot merge flakiness trackers with windows {self.window} and {other.window}")
+        if other._history:
+            self.end_run()
+            history = self._history
+            window = self.window
+            for test_id, other_value in other._history.items():
+                n = other_value.bit_length() - 1
+                value = (history.get(test_id, 1) << n) | (other_value ^ (1 << n))
+                if value >> (window + 1):
+                    value = (value & ((1 << window) - 1)) | (1 << window)
+                history[test_id] = value
+        run = self._run
+        for test_id, failed in other._run.items():
+            run[test_id] = run.get(test_id, 0) | failed
+        return self
+
+    def flips(self, test_id: str) -> int:
+        """Return the number of passed <-> failed transitions in the test's window."""
+        value = self._value(test_id)
+        if value is None:
+            return 0
+        n = value.bit_length() - 1
+        bits = value ^ (1 << n)
+        return ((bits ^ (bits >> 1)) & ((1 << (n - 1)) - 1)).bit_count() if n > 1 else 0
+
+    def flaky_tests(self, min_flips: int = DEFAULT_MIN_FLIPS) -> list[dict]:
+        """
+        Return tests with at least min_flips flips, most unstable first.
+
+        Each item has: id, flips, observations (runs in the window where the
+        test passed or failed) and failures (runs where it failed). Ties are
+        ordered by id.
+        """
+        flaky = []
+        for test_id in self._history.keys() | self._run.keys():
+            value = self._value(test_id)
+            n = value.bit_length() - 1
+            if n <= min_flips:
+                continue  # n observations allow at most n - 1 flips
+            bits = value ^ (1 << n)
+            flips = ((bits ^ (bits >> 1)) & ((1 << (n - 1)) - 1)).bit_count()
+            if flips >= min_flips:
+                flaky.append({"id": test_id, "flips": flips, "observations": n, "failures": bits.bit_count()})
+        flaky.sort(key=lambda f: (-f["flips"], f["id"]))
+        return flaky
+
+    def _value(self, test_id: str) -> int | None:
+        # History bits including the open run, without closing it.
+        value = self._history.get(test_id)
+        failed = self._run.get(test_id)
+        if failed is None:
+            return value
+        return self._push(1 if value is None else value, failed)
+
+    def _push(self, value: int, failed: int) -> int:
+        value = (value << 1) | failed
+        if value >> (self.window + 1):
+            # Drop the oldest observation and move the sentinel back to bit `window`.
+            value = (value & ((1 << self.window) - 1)) | (1 << self.window)
+        return value
@@ -1,7 +1,42 @@
 """Reporting package (Phase 1 skeleton)."""
 
-from .report_builder import build_markdown_report
+from .exporter import save_markdown_report, save_markdown_report_lines, save_reports, write_markdown_lines
+from .model import ReportModel, build_report_model, report_model_to_dict
+from .renderers import (
+    REPORT_FORMATS,
+    ReportFormat,
+    get_report_format,
+    register_report_format,
+    render_html,
+    render_json,
+    render_junit_summary,
+)
+from .report_builder import (
+    build_markdown_report,
+    iter_failed_tests,
+    iter_markdown_lines,
+    iter_markdown_report,
+    render_markdown,
+)
 
 __all__ = [
     "build_markdown_report",
+    "iter_markdown_report",
+    "iter_markdown_lines",
+    "iter_failed_tests",
+    "render_markdown",
+    "ReportModel",
+    "build_report_model",
+    "report_model_to_dict",
+    "ReportFormat",
+    "REPORT_FORMATS",
+    "get_report_format",
+    "register_report_format",
+    "render_json",
+    "render_html",
+    "render_junit_summary",
+    "save_markdown_report",
+    "save_markdown_report_lines",
+    "save_reports",
+    "write_markdown_lines",
 ]
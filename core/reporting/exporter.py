@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import os
+from collections.abc import Iterable, Sequence
 from datetime import datetime
 from pathlib import Path
+from typing import TextIO
+
+from core.reporting.model import ReportModel
+from core.reporting.renderers import get_report_format
+from core.reporting.report_builder import iter_markdown_lines
 
 
 def save_markdown_report(markdown: str, output_dir: str = "reports", prefix: str = "pre_release_report") -> str:
@@ -16,14 +23,92 @@ def save_markdown_report(markdown: str, output_dir: str = "reports", prefix: str
     Returns:
         Absolute path to the saved file as a string
     """
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{prefix}_{timestamp}.md"
-    file_path = output_path / filename
+    file_path = _report_path(output_dir, prefix)
 
     file_path.write_text(markdown, encoding="utf-8")
 
     return str(file_path.resolve())
 
+
+def save_markdown_report_lines(
+    lines: Iterable[str], output_dir: str = "reports", prefix: str = "pre_release_report"
+) -> str:
+    """
+    Save a report given as lines (e.g. from iter_markdown_report) to a timestamped file.
+
+    Lines are written as they are produced, so large reports are never held
+    in memory as one string. The file is byte-identical to save_markdown_report
+    with the lines joined by newlines.
+
+    Returns:
+        Absolute path to the saved file as a string
+    """
+    file_path = _report_path(output_dir, prefix)
+
+    with open(file_path, "w", encoding="utf-8") as f:
+        write_markdown_lines(lines, f)
+
+    return str(file_path.resolve())
+
+
+def save_reports(
+    model: ReportModel,
+    formats: Sequence[str] = ("md",),
+    output_dir: str = "reports",
+    prefix: str = "pre_release_report",
+    timestamped: bool = True,
+) -> dict[str, str]:
+    """
+    Render one ReportModel in several formats and save each to a timestamped file.
+
+    All files share one timestamp and differ only by extension (see
+    REPORT_FORMATS); Markdown is streamed to disk. Raises ValidationError for
+    unknown formats before anything is written.
+
+    With timestamped=False the files are named <prefix>.<ext> and each one is
+    replaced atomically, so a report that is re-saved as results come in
+    (see watch) is never seen half-written.
+
+    Returns:
+        Absolute path of each saved file as a string, by format name
+    """
+    report_formats = [get_report_format(name) for name in formats]
+    if timestamped:
+        base_path = _report_path(output_dir, prefix)
+    else:
+        base_path = Path(output_dir) / f"{prefix}.md"
+        base_path.parent.mkdir(parents=True, exist_ok=True)
+
+    paths = {}
+    for fmt in report_formats:
+        file_path = base_path.with_suffix(fmt.extension)
+        write_path = file_path if timestamped else file_path.with_name(file_path.name + ".tmp")
+        if fmt.name == "md":
+            with open(write_path, "w", encoding="utf-8") as f:
+                write_markdown_lines(iter_markdown_lines(model), f)
+        else:
+            write_path.write_text(fmt.render(model), encoding="utf-8")
+        if not timestamped:
+            os.replace(write_path, file_path)
+        paths[fmt.name] = str(file_path.resolve())
+    return paths
+
+
+def write_markdown_lines(lines: Iterable[str], sink: TextIO) -> None:
+    """Write lines to a file-like sink separated by newlines, like "\\n".join(lines)."""
+    lines = iter(lines)
+    for line in lines:
+        sink.write(line)
+        break
+    for line in lines:
+        sink.write("\n")
+        sink.write(line)
+
+
+def _report_path(output_dir: str, prefix: str) -> Path:
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = f"{prefix}_{timestamp}.md"
+    return output_path / filename
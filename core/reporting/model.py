@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from pack.insights import Insight
+
+
+@dataclass(frozen=True, slots=True)
+class ReportModel:
+    """
+    Everything a report shows, computed once per run.
+
+    Renderers (Markdown, JSON, HTML, JUnit summary) only format this model, so
+    emitting several formats does not recompute metrics, insights, indicators
+    or recommendations. Indicator and recommendation texts are plain sentences
+    without list markers.
+    """
+
+    metrics: dict
+    score: int
+    risk: str
+    executive_summary: str
+    high_risk_indicators: tuple[str, ...]
+    recommendations: tuple[str, ...]
+    insights: tuple[Insight, ...] = ()
+    breakdowns: dict[str, list[dict]] | None = None
+    durations: dict | None = None
+    diff: dict | None = None
+
+
+def build_report_model(
+    metrics: dict,
+    score: int,
+    risk: str,
+    insights: list[Insight] | None = None,
+    breakdowns: dict[str, list[dict]] | None = None,
+    durations: dict | None = None,
+    diff: dict | None = None,
+) -> ReportModel:
+    """
+    Build the report model for a run.
+
+    Arguments are as for build_markdown_report; the executive summary, high-risk
+    indicators and recommendations are derived here.
+    """
+    return ReportModel(
+        metrics=metrics,
+        score=score,
+        risk=risk,
+        executive_summary=_build_executive_summary(score, risk),
+        high_risk_indicators=tuple(_build_high_risk_indicators(metrics)),
+        recommendations=tuple(_build_recommendations(metrics)),
+        insights=tuple(insights or ()),
+        breakdowns=breakdowns,
+        durations=durations,
+        diff=diff,
+    )
+
+
+def report_model_to_dict(model: ReportModel) -> dict:
+    """Return the model as a JSON-serializable dict (insights become dicts)."""
+    return {
+        "score": model.score,
+        "risk": model.risk,
+        "executive_summary": model.executive_summary,
+        "metrics": model.metrics,
+        "insights": [
+            {"code": i.code, "severity": i.severity, "title": i.title, "details": i.details} for i in model.insights
+        ],
+        "high_risk_indicators": list(model.high_risk_indicators),
+        "recommendations": list(model.recommendations),
+        "breakdowns": model.breakdowns,
+        "durations": model.durations,
+        "diff": model.diff,
+    }
+
+
+def _build_executive_summary(score: int, risk: str) -> str:
+    """Build 2-4 sentence executive summary."""
+    risk_lower = risk.lower()
+
+    if risk == "Low":
+        go_no_go = "The current test results suggest a favorable release outlook."
+    elif risk == "Medium":
+        go_no_go = "The current test results indicate moderate risk that warrants review before release."
+    else:  # High
+        go_no_go = "The current test results indicate elevated risk that requires attention before release."
+
+    sentences = [
+        f"This report provides an assessment of release readiness based on test execution results.",
+        f"The release readiness score is {score} out of 100, indicating a {risk_lower} risk level.",
+        go_no_go,
+        "Review the detailed metrics and recommendations below to inform your release decision.",
+    ]
+
+    return " ".join(sentences)
+
+
+def _build_high_risk_indicators(metrics: dict) -> list[str]:
+    """Build conditional high-risk indicators."""
+    indicators = []
+
+    if metrics["failed"] > 0:
+        indicators.append(f"{metrics['failed']} test(s) failed, indicating potential functional issues that may impact release quality.")
+
+    if metrics["unmapped_results"] > 0:
+        indicators.append(f"{metrics['unmapped_results']} test result(s) could not be mapped to test cases, indicating traceability gaps in test coverage.")
+
+    if metrics["skip_rate"] > 0.2:
+        skip_pct = metrics["skip_rate"] * 100
+        indicators.append(f"Skip rate is {skip_pct:.1f}%, indicating a high proportion of tests were not executed, which may reduce confidence in release readiness.")
+
+    if not indicators:
+        indicators.append("No critical risk indicators detected.")
+
+    return indicators
+
+
+def _build_recommendations(metrics: dict) -> list[str]:
+    """Build 3-6 deterministic recommendations."""
+    recommendations = []
+
+    if metrics["failed"] > 0:
+        recommendations.append("Address all failed tests before release. Investigate root causes and verify fixes through re-execution.")
+
+    if metrics["unmapped_results"] > 0:
+        recommendations.append("Improve test-to-requirement mapping to ensure full traceability and coverage visibility.")
+
+    if metrics["skip_rate"] > 0.2:
+        recommendations.append("Review and resolve reasons for skipped tests. High skip rates reduce test coverage confidence.")
+
+    if metrics["failure_rate"] > 0.1:
+        recommendations.append("Investigate patterns in test failures to identify systemic issues that may require broader fixes.")
+
+    # Always include at least one general recommendation
+    if metrics["mapped_results"] > 0:
+        recommendations.append("Re-run test suite after addressing identified issues to validate fixes and confirm readiness.")
+    else:
+        recommendations.append("Ensure test execution results are available and properly mapped to test cases for accurate assessment.")
+
+    recommendations.append("Monitor test execution trends over time to identify regressions and maintain release quality standards.")
+
+    return recommendations
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import html
+import json
+import xml.etree.ElementTree as ET
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from core.errors import ValidationError
+from core.reporting.model import ReportModel, report_model_to_dict
+from core.reporting.report_builder import DIFF_IDS_SHOWN, DIFF_LABELS, render_markdown
+
+# Insight severities reported as failures in the JUnit summary.
+_JUNIT_FAILING_SEVERITIES = frozenset({"critical"})
+
+
+@dataclass(frozen=True, slots=True)
+class ReportFormat:
+    """A report renderer and the file extension of its output."""
+
+    name: str
+    extension: str
+    render: Callable[[ReportModel], str]
+
+
+def render_json(model: ReportModel) -> str:
+    """Render a ReportModel as indented JSON (see report_model_to_dict)."""
+    return json.dumps(report_model_to_dict(model), indent=2)
+
+
+def render_html(model: ReportModel) -> str:
+    """Render a ReportModel as a self-contained HTML page (inline styles, no external assets)."""
+    e = html.escape
+    metrics = model.metrics
+    parts = [
+        "<!DOCTYPE html>",
+        '<html lang="en">',
+        "<head>",
+        '<meta charset="utf-8">',
+        "<title>Pre-Release QA Risk Review</title>",
+        "<style>",
+        "body{font-family:system-ui,sans-serif;max-width:960px;margin:2em auto;padding:0 1em;color:#222}",
+        "table{border-collapse:collapse;margin:1em 0}",
+        "th,td{border:1px solid #ccc;padding:.3em .6em;text-align:left}",
+        ".risk-low{color:#1a7f37}.risk-medium{color:#9a6700}.risk-high{color:#cf222e}",
+        "</style>",
+        "</head>",
+        "<body>",
+        "<h1>Pre-Release QA Risk Review</h1>",
+        "<h2>Executive Summary</h2>",
+        f"<p>{e(model.executive_summary)}</p>",
+        "<h2>Release Readiness Score</h2>",
+        f"<p><strong>Score:</strong> {model.score} / 100<br>",
+        f'<strong>Risk Level:</strong> <span class="risk-{e(model.risk.lower())}">{e(model.risk)}</span></p>',
+        "<h2>Key Metrics</h2>",
+        "<table>",
+        f"<tr><th>Total test cases</th><td>{metrics['total_cases']}</td></tr>",
+        f"<tr><th>Total test results</th><td>{metrics['total_results']}</td></tr>",
+        f"<tr><th>Mapped results</th><td>{metrics['mapped_results']}</td></tr>",
+        f"<tr><th>Unmapped results</th><td>{metrics['unmapped_results']}</td></tr>",
+        f"<tr><th>Passed</th><td>{metrics['passed']}</td></tr>",
+        f"<tr><th>Failed</th><td>{metrics['failed']}</td></tr>",
+        f"<tr><th>Skipped</th><td>{metrics['skipped']}</td></tr>",
+        f"<tr><th>Failure rate</th><td>{metrics['failure_rate'] * 100:.1f}%</td></tr>",
+        f"<tr><th>Skip rate</th><td>{metrics['skip_rate'] * 100:.1f}%</td></tr>",
+        "</table>",
+    ]
+
+    if model.diff is not None:
+        diff = model.diff
+        parts.append("<h2>Changes Since Baseline</h2>")
+        parts.append(f"<p>Compared {diff['candidate_tests']} test(s) against {diff['baseline_tests']} in the baseline.</p>")
+        parts.append("<table>")
+        for key, label in DIFF_LABELS:
+            ids = diff[key]
+            more = f" and {len(ids) - DIFF_IDS_SHOWN} more" if len(ids) > DIFF_IDS_SHOWN else ""
+            parts.append(
+                f"<tr><th>{label}</th><td>{len(ids)}</td><td>{e(', '.join(ids[:DIFF_IDS_SHOWN]))}{more}</td></tr>"
+            )
+        parts.append("</table>")
+
+    if model.breakdowns:
+        for dimension, rows in model.breakdowns.items():
+            if not rows:
+                continue
+            label = e(dimension.capitalize())
+            parts.append(f"<h2>Breakdown by {label}</h2>")
+            parts.append("<table>")
+            parts.append(
+                f"<tr><th>{label}</th><th>Cases</th><th>Results</th><th>Passed</th><th>Failed</th>"
+                "<th>Skipped</th><th>Failure Rate</th><th>Skip Rate</th></tr>"
+            )
+            for row in rows:
+                parts.append(
+                    f"<tr><td>{e(row['group'])}</td><td>{row['total_cases']}</td><td>{row['mapped_results']}</td>"
+                    f"<td>{row['passed']}</td><td>{row['failed']}</td><td>{row['skipped']}</td>"
+                    f"<td>{row['failure_rate'] * 100:.1f}%</td><td>{row['skip_rate'] * 100:.1f}%</td></tr>"
+                )
+            parts.append("</table>")
+
+    durations = model.durations
+    if durations and durations["timed_results"] > 0:
+        parts.append("<h2>Test Durations</h2>")
+        parts.append("<ul>")
+        parts.append(f"<li>Timed results: {durations['timed_results']}</li>")
+        parts.append(f"<li>Total duration: {durations['total_sec']:.2f}s</li>")
+        parts.append(f"<li>Mean duration: {durations['mean_sec']:.2f}s</li>")
+        parts.append(
+            f"<li>p50 / p95 / p99: {durations['p50_sec']:.2f}s / {durations['p95_sec']:.2f}s / "
+            f"{durations['p99_sec']:.2f}s</li>"
+        )
+        parts.append("</ul>")
+        if durations["slowest"]:
+            parts.append("<p><strong>Slowest tests:</strong></p>")
+            parts.append("<ol>")
+            for entry in durations["slowest"]:
+                parts.append(f"<li>{e(entry['id'])} ({entry['duration_sec']:.2f}s)</li>")
+            parts.append("</ol>")
+
+    if model.insights:
+        parts.append("<h2>Key Insights</h2>")
+        parts.append("<ul>")
+        for insight in model.insights:
+            parts.append(
+                f"<li><strong>{e(insight.severity.upper())}</strong> {e(insight.title)}: {e(insight.details)}</li>"
+            )
+        parts.append("</ul>")
+
+    parts.append("<h2>High-Risk Indicators</h2>")
+    parts.append("<ul>")
+    parts.extend(f"<li>{e(indicator)}</li>" for indicator in model.high_risk_indicators)
+    parts.append("</ul>")
+    parts.append("<h2>Recommendations</h2>")
+    parts.append("<ul>")
+    parts.extend(f"<li>{e(recommendation)}</li>" for recommendation in model.recommendations)
+    parts.append("</ul>")
+    parts.append("</body>")
+    parts.append("</html>")
+    return "\n".join(parts) + "\n"
+
+
+def render_junit_summary(model: ReportModel) -> str:
+    """
+    Render a ReportModel as a JUnit XML summary for CI dashboards.
+
+    The suite has a release_readiness testcase that fails when the risk level
+    is High, and one testcase per insight that fails for critical insights.
+    Score, risk and metrics are attached as suite properties.
+    """
+    cases = [("release_readiness", f"Risk level {model.risk} (score {model.score} / 100)", model.risk == "High")]
+    for insight in model.insights:
+        cases.append(
+            (insight.code, f"{insight.title}: {insight.details}", insight.severity in _JUNIT_FAILING_SEVERITIES)
+        )
+    failures = sum(1 for _, _, failed in cases if failed)
+
+    counts = {"tests": str(len(cases)), "failures": str(failures), "errors": "0", "skipped": "0"}
+    root = ET.Element("testsuites", {"name": "pre-release-qa-review", **counts})
+    suite = ET.SubElement(root, "testsuite", {"name": "pre-release-qa-review", **counts})
+    properties = ET.SubElement(suite, "properties")
+    ET.SubElement(properties, "property", {"name": "score", "value": str(model.score)})
+    ET.SubElement(properties, "property", {"name": "risk", "value": model.risk})
+    for key, value in model.metrics.items():
+        ET.SubElement(properties, "property", {"name": key, "value": str(value)})
+
+    for name, message, failed in cases:
+        testcase = ET.SubElement(suite, "testcase", {"classname": "qa_review", "name": name})
+        if failed:
+            ET.SubElement(testcase, "failure", {"message": message})
+        else:
+            ET.SubElement(testcase, "system-out").text = message
+
+    ET.indent(root)
+    return ET.tostring(root, encoding="unicode", xml_declaration=True) + "\n"
+
+
+REPORT_FORMATS: dict[str, ReportFormat] = {
+    fmt.name: fmt
+    for fmt in (
+        ReportFormat("md", ".md", render_markdown),
+        ReportFormat("json", ".json", render_json),
+        ReportFormat("html", ".html", render_html),
+        ReportFormat("junit", ".xml", render_junit_summary),
+    )
+}
+
+
+def register_report_format(name: str, extension: str, render: Callable[[ReportModel], str]) -> None:
+    """
+    Register an additional report renderer under a format name.
+
+    Raises ValidationError if the name is already registered.
+    """
+    if name in REPORT_FORMATS:
+        raise ValidationError(f"report format '{name}' is already registered")
+    REPORT_FORMATS[name] = ReportFormat(name, extension, render)
+
+
+def get_report_format(name: str) -> ReportFormat:
+    """Return a registered report format; raises ValidationError for unknown names."""
+    try:
+        return REPORT_FORMATS[name]
+    except KeyError:
+        raise ValidationError(f"unknown report format '{name}' (expected one of: {sorted(REPORT_FORMATS)})") from None
@@ -1,7 +1,34 @@
 from __future__ import annotations
 
+import math
+from collections.abc import Iterable, Iterator, Mapping
 
-def build_markdown_report(metrics: dict, score: int, risk: str, insights: list | None = None) -> str:
+from core.normalization.models import STATUS_CODES, ResultBatch, TestCaseModel, TestResultModel
+from core.reporting.model import ReportModel, build_report_model
+
+# Test ids listed per diff category before the rest are summarized.
+DIFF_IDS_SHOWN = 20
+
+# Report label of each diff_results category, in report order.
+DIFF_LABELS: tuple[tuple[str, str], ...] = (
+    ("new_failures", "New failures"),
+    ("fixed", "Fixed"),
+    ("newly_skipped", "Newly skipped"),
+    ("disappeared", "Disappeared"),
+    ("added", "Added"),
+)
+
+
+def build_markdown_report(
+    metrics: dict,
+    score: int,
+    risk: str,
+    insights: list | None = None,
+    breakdowns: dict[str, list[dict]] | None = None,
+    durations: dict | None = None,
+    diff: dict | None = None,
+    failed_tests: Iterable[dict] | None = None,
+) -> str:
     """
     Build a deterministic Markdown report for pre-release QA risk review.
 
@@ -11,21 +38,70 @@ def build_markdown_report(metrics: dict, score: int, risk: str, insights: list |
         score: Release readiness score (0-100)
         risk: Risk level ("Low", "Medium", or "High")
         insights: Optional list of insights to include in the report
+        breakdowns: Optional per-dimension group rows (see BreakdownAccumulator.breakdowns)
+        durations: Optional duration statistics (see DurationAccumulator.summary)
+        diff: Optional comparison with a baseline run (see diff_results)
+        failed_tests: Optional rows for a per-test failure table (see iter_failed_tests)
 
     Returns:
         Complete Markdown report as a string
     """
-    lines = [
+    return "\n".join(
+        iter_markdown_report(
+            metrics,
+            score,
+            risk,
+            insights=insights,
+            breakdowns=breakdowns,
+            durations=durations,
+            diff=diff,
+            failed_tests=failed_tests,
+        )
+    )
+
+
+def iter_markdown_report(
+    metrics: dict,
+    score: int,
+    risk: str,
+    insights: list | None = None,
+    breakdowns: dict[str, list[dict]] | None = None,
+    durations: dict | None = None,
+    diff: dict | None = None,
+    failed_tests: Iterable[dict] | None = None,
+) -> Iterator[str]:
+    """
+    Yield the lines of the Markdown report (see build_markdown_report), without newlines.
+
+    Lines are produced lazily, so the report can be written to a file as it is
+    rendered (see write_markdown_lines); failed_tests may be a generator, in
+    which case the failure table is streamed row by row.
+    """
+    model = build_report_model(
+        metrics, score, risk, insights=insights, breakdowns=breakdowns, durations=durations, diff=diff
+    )
+    return iter_markdown_lines(model, failed_tests=failed_tests)
+
+
+def render_markdown(model: ReportModel, failed_tests: Iterable[dict] | None = None) -> str:
+    """Render a ReportModel as Markdown."""
+    return "\n".join(iter_markdown_lines(model, failed_tests=failed_tests))
+
+
+def iter_markdown_lines(model: ReportModel, failed_tests: Iterable[dict] | None = None) -> Iterator[str]:
+    """Yield the Markdown lines of a ReportModel, without newlines (see iter_markdown_report)."""
+    metrics = model.metrics
+    yield from [
         "# Pre-Release QA Risk Review",
         "",
         "## Executive Summary",
         "",
-        _build_executive_summary(score, risk),
+        model.executive_summary,
         "",
         "## Release Readiness Score",
         "",
-        f"**Score:** {score} / 100",
-        f"**Risk Level:** {risk}",
+        f"**Score:** {model.score} / 100",
+        f"**Risk Level:** {model.risk}",
         "",
         "## Key Metrics",
         "",
@@ -41,96 +117,149 @@ def build_markdown_report(metrics: dict, score: int, risk: str, insights: list |
         "",
     ]
 
-    # Add insights section if provided
-    if insights:
-        lines.append("## Key Insights")
-        lines.append("")
-        for insight in insights:
-            severity_upper = insight.severity.upper()
-            lines.append(f"- **{severity_upper}** {insight.title}: {insight.details}")
-        lines.append("")
-
-    lines.append("## High-Risk Indicators")
-    lines.append("")
-
-    # Add high-risk indicators
-    risk_indicators = _build_high_risk_indicators(metrics)
-    lines.extend(risk_indicators)
-    lines.append("")
-
-    # Add recommendations
-    lines.append("## Recommendations")
-    lines.append("")
-    recommendations = _build_recommendations(metrics)
-    lines.extend(recommendations)
-
-    return "\n".join(lines)
+    # Add changes since the baseline run if provided
+    if model.diff is not None:
+        yield from _build_diff_section(model.diff)
 
+    # Add a table per breakdown dimension if provided
+    if model.breakdowns:
+        for dimension, rows in model.breakdowns.items():
+            if rows:
+                yield from _build_breakdown_table(dimension, rows)
 
-def _build_executive_summary(score: int, risk: str) -> str:
-    """Build 2-4 sentence executive summary."""
-    risk_lower = risk.lower()
+    # Add duration statistics if any result was timed
+    if model.durations and model.durations["timed_results"] > 0:
+        yield from _build_duration_section(model.durations)
 
-    if risk == "Low":
-        go_no_go = "The current test results suggest a favorable release outlook."
-    elif risk == "Medium":
-        go_no_go = "The current test results indicate moderate risk that warrants review before release."
-    else:  # High
-        go_no_go = "The current test results indicate elevated risk that requires attention before release."
-
-    sentences = [
-        f"This report provides an assessment of release readiness based on test execution results.",
-        f"The release readiness score is {score} out of 100, indicating a {risk_lower} risk level.",
-        go_no_go,
-        "Review the detailed metrics and recommendations below to inform your release decision.",
-    ]
-
-    return " ".join(sentences)
+    # Add insights section if provided
+    if model.insights:
+        yield "## Key Insights"
+        yield ""
+        for insight in model.insights:
+            severity_upper = insight.severity.upper()
+            yield f"- **{severity_upper}** {insight.title}: {insight.details}"
+        yield ""
 
+    yield "## High-Risk Indicators"
+    yield ""
+    for indicator in model.high_risk_indicators:
+        yield f"- {indicator}"
+    yield ""
 
-def _build_high_risk_indicators(metrics: dict) -> list[str]:
-    """Build conditional high-risk indicator bullets."""
-    indicators = []
+    yield "## Recommendations"
+    yield ""
+    for recommendation in model.recommendations:
+        yield f"- {recommendation}"
 
-    if metrics["failed"] > 0:
-        indicators.append(f"- {metrics['failed']} test(s) failed, indicating potential functional issues that may impact release quality.")
+    # Add the per-test failure table last; it may have any number of rows
+    if failed_tests is not None:
+        yield from _iter_failed_tests_table(failed_tests)
 
-    if metrics["unmapped_results"] > 0:
-        indicators.append(f"- {metrics['unmapped_results']} test result(s) could not be mapped to test cases, indicating traceability gaps in test coverage.")
 
-    if metrics["skip_rate"] > 0.2:
-        skip_pct = metrics["skip_rate"] * 100
-        indicators.append(f"- Skip rate is {skip_pct:.1f}%, indicating a high proportion of tests were not executed, which may reduce confidence in release readiness.")
+def iter_failed_tests(
+    test_cases: Mapping[str, TestCaseModel], results: Iterable[TestResultModel] | ResultBatch
+) -> Iterator[dict]:
+    """
+    Yield failure table rows for the failed results, in result order.
 
-    if not indicators:
-        indicators.append("- No critical risk indicators detected.")
+    Each row has: id, title and component (None for unmapped results) and
+    duration_sec (None if not reported).
+    """
+    if isinstance(results, ResultBatch):
+        failed = STATUS_CODES["failed"]
+        rows = (
+            (result_id, None if math.isnan(duration) else duration)
+            for result_id, code, duration in zip(results.ids, results.status_codes, results.durations)
+            if code == failed
+        )
+    else:
+        rows = ((r.id, r.duration_sec) for r in results if r.status == "failed")
+    for result_id, duration in rows:
+        case = test_cases.get(result_id)
+        yield {
+            "id": result_id,
+            "title": case.title if case is not None else None,
+            "component": case.component if case is not None else None,
+            "duration_sec": duration,
+        }
 
-    return indicators
 
+def _build_diff_section(diff: dict) -> list[str]:
+    """Build the changes-since-baseline section from a diff_results dict."""
+    lines = [
+        "## Changes Since Baseline",
+        "",
+        f"Compared {diff['candidate_tests']} test(s) against {diff['baseline_tests']} in the baseline.",
+        "",
+    ]
+    for key, label in DIFF_LABELS:
+        lines.append(f"- {label}: {len(diff[key])}")
+    lines.append("")
 
-def _build_recommendations(metrics: dict) -> list[str]:
-    """Build 3-6 deterministic recommendation bullets."""
-    recommendations = []
+    for key, label in DIFF_LABELS:
+        ids = diff[key]
+        if not ids:
+            continue
+        shown = ", ".join(ids[:DIFF_IDS_SHOWN])
+        more = f" and {len(ids) - DIFF_IDS_SHOWN} more" if len(ids) > DIFF_IDS_SHOWN else ""
+        lines.append(f"**{label}:** {shown}{more}")
+        lines.append("")
+    return lines
 
-    if metrics["failed"] > 0:
-        recommendations.append("- Address all failed tests before release. Investigate root causes and verify fixes through re-execution.")
 
-    if metrics["unmapped_results"] > 0:
-        recommendations.append("- Improve test-to-requirement mapping to ensure full traceability and coverage visibility.")
+def _build_breakdown_table(dimension: str, rows: list[dict]) -> list[str]:
+    """Build a per-group Markdown table for one breakdown dimension."""
+    label = dimension.capitalize()
+    lines = [
+        f"## Breakdown by {label}",
+        "",
+        f"| {label} | Cases | Results | Passed | Failed | Skipped | Failure Rate | Skip Rate |",
+        "|---|---|---|---|---|---|---|---|",
+    ]
+    for row in rows:
+        group = row["group"].replace("|", "\\|")
+        lines.append(
+            f"| {group} | {row['total_cases']} | {row['mapped_results']} | {row['passed']} | "
+            f"{row['failed']} | {row['skipped']} | {row['failure_rate'] * 100:.1f}% | {row['skip_rate'] * 100:.1f}% |"
+        )
+    lines.append("")
+    return lines
 
-    if metrics["skip_rate"] > 0.2:
-        recommendations.append("- Review and resolve reasons for skipped tests. High skip rates reduce test coverage confidence.")
 
-    if metrics["failure_rate"] > 0.1:
-        recommendations.append("- Investigate patterns in test failures to identify systemic issues that may require broader fixes.")
+def _build_duration_section(durations: dict) -> list[str]:
+    """Build the duration statistics section with the slowest tests."""
+    lines = [
+        "## Test Durations",
+        "",
+        f"- Timed results: {durations['timed_results']}",
+        f"- Total duration: {durations['total_sec']:.2f}s",
+        f"- Mean duration: {durations['mean_sec']:.2f}s",
+        f"- p50 / p95 / p99: {durations['p50_sec']:.2f}s / {durations['p95_sec']:.2f}s / {durations['p99_sec']:.2f}s",
+        "",
+    ]
+    if durations["slowest"]:
+        lines.append("**Slowest tests:**")
+        lines.append("")
+        for rank, entry in enumerate(durations["slowest"], start=1):
+            lines.append(f"{rank}. {entry['id']} ({entry['duration_sec']:.2f}s)")
+        lines.append("")
+    return lines
 
-    # Always include at least one general recommendation
-    if metrics["mapped_results"] > 0:
-        recommendations.append("- Re-run test suite after addressing identified issues to validate fixes and confirm readiness.")
-    else:
-        recommendations.append("- Ensure test execution results are available and properly mapped to test cases for accurate assessment.")
 
-    recommendations.append("- Monitor test execution trends over time to identify regressions and maintain release quality standards.")
+def _iter_failed_tests_table(failed_tests: Iterable[dict]) -> Iterator[str]:
+    """Yield the per-test failure table, one line per row."""
+    yield ""
+    yield "## Failed Tests"
+    yield ""
+    yield "| Test | Title | Component | Duration |"
+    yield "|---|---|---|---|"
+    for row in failed_tests:
+        duration = row["duration_sec"]
+        yield (
+            f"| {_table_cell(row['id'])} | {_table_cell(row['title'])} | {_table_cell(row['component'])} | "
+            f"{'-' if duration is None else f'{duration:.2f}s'} |"
+        )
 
-    return recommendations
 
+def _table_cell(value: str | None) -> str:
+    return "-" if not value else value.replace("|", "\\|")
@@ -1,9 +1,35 @@
 """Scoring package (Phase 1 skeleton)."""
 
-from .scorer import classify_risk, compute_metrics, compute_release_readiness_score
+from .breakdown import (
+    BREAKDOWN_DIMENSIONS,
+    UNSPECIFIED_GROUP,
+    BreakdownAccumulator,
+    CatalogGroupIndex,
+    compute_breakdowns,
+)
+from .durations import DurationAccumulator, QuantileSketch, compute_duration_stats
+from .scorer import (
+    MetricsAccumulator,
+    classify_risk,
+    compute_metrics,
+    compute_metrics_from_batch,
+    compute_metrics_from_results,
+    compute_release_readiness_score,
+)
 
 __all__ = [
     "compute_metrics",
+    "compute_metrics_from_results",
+    "compute_metrics_from_batch",
     "compute_release_readiness_score",
     "classify_risk",
+    "MetricsAccumulator",
+    "compute_breakdowns",
+    "BreakdownAccumulator",
+    "CatalogGroupIndex",
+    "BREAKDOWN_DIMENSIONS",
+    "UNSPECIFIED_GROUP",
+    "compute_duration_stats",
+    "DurationAccumulator",
+    "QuantileSketch",
 ]
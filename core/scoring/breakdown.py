@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+
+from core.errors import ValidationError
+from core.normalization.models import STATUS_CODES, NormalizedData, ResultBatch, TestCaseModel, TestResultModel
+
+# TestCaseModel attributes results can be grouped by.
+BREAKDOWN_DIMENSIONS: tuple[str, ...] = ("component", "priority")
+
+# Group label for test cases without a value for the dimension.
+UNSPECIFIED_GROUP = "(unspecified)"
+
+# Per-group counter layout in breakdowns(): [cases, mapped, passed, failed,
+# skipped]; a status code c is counted at index _STATUS_OFFSET + c.
+_CASES, _MAPPED, _STATUS_OFFSET = 0, 1, 2
+_STATUSES = len(STATUS_CODES)
+
+
+def compute_breakdowns(data: NormalizedData) -> dict[str, list[dict]]:
+    """
+    Compute pass/fail/skip counts and rates per group for each dimension.
+
+    Only mapped results are counted. See BreakdownAccumulator.breakdowns for
+    the output layout.
+    """
+    acc = BreakdownAccumulator(data.test_cases)
+    if isinstance(data.results, ResultBatch):
+        acc.add_batch(data.results)
+    else:
+        acc.add_all(data.results)
+    return acc.breakdowns()
+
+
+class CatalogGroupIndex:
+    """
+    Catalog cases resolved to their group cells, built once per catalog.
+
+    A cell is one combination of groups across the dimensions (e.g. component
+    "auth" with priority "P1"); case_cells maps each case id to its cell and
+    cell_cases counts the cases per cell. Building the index is O(cases);
+    accumulators created from it (BreakdownAccumulator.from_index) only
+    allocate counters for the cells.
+    """
+
+    __slots__ = ("dimensions", "case_cells", "cell_groups", "cell_cases")
+
+    def __init__(
+        self, test_cases: Mapping[str, TestCaseModel], dimensions: Sequence[str] = BREAKDOWN_DIMENSIONS
+    ) -> None:
+        for dim in dimensions:
+            if dim not in BREAKDOWN_DIMENSIONS:
+                raise ValidationError(
+                    f"unknown breakdown dimension '{dim}' (expected one of: {list(BREAKDOWN_DIMENSIONS)})"
+                )
+        self.dimensions = tuple(dimensions)
+        self.case_cells: dict[str, int] = {}
+        self.cell_groups: list[tuple[str, ...]] = []
+        self.cell_cases: list[int] = []
+
+        cells: dict[tuple[str, ...], int] = {}
+        for tc in test_cases.values():
+            groups = tuple(getattr(tc, dim) or UNSPECIFIED_GROUP for dim in self.dimensions)
+            cell = cells.get(groups)
+            if cell is None:
+                cell = cells[groups] = len(self.cell_groups)
+                self.cell_groups.append(groups)
+                self.cell_cases.append(0)
+            self.cell_cases[cell] += 1
+            self.case_cells[tc.id] = cell
+
+
+class BreakdownAccumulator:
+    """
+    Grouped counters per component and per priority, filled in a single pass.
+
+    Results are counted per group cell (see CatalogGroupIndex), so a result is
+    a single hash lookup plus one increment: the cost is O(results) plus the
+    index, regardless of how many groups exist. Cells are summed into
+    per-dimension groups only in breakdowns(). Accumulators over the same
+    catalog can be merged (e.g. per shard).
+    """
+
+    __slots__ = ("index", "_counts")
+
+    def __init__(
+        self, test_cases: Mapping[str, TestCaseModel], dimensions: Sequence[str] = BREAKDOWN_DIMENSIONS
+    ) -> None:
+        self._init(CatalogGroupIndex(test_cases, dimensions))
+
+    @classmethod
+    def from_index(cls, index: CatalogGroupIndex) -> BreakdownAccumulator:
+        """Create an empty accumulator over a prebuilt catalog index."""
+        acc = cls.__new__(cls)
+        acc._init(index)
+        return acc
+
+    @property
+    def dimensions(self) -> tuple[str, ...]:
+        return self.index.dimensions
+
+    def _init(self, index: CatalogGroupIndex) -> None:
+        self.index = index
+        # Status counts per cell: cell c, status code s at c * _STATUSES + s.
+        self._counts = [0] * (len(index.cell_groups) * _STATUSES)
+
+    def add(self, result: TestResultModel) -> None:
+        """Count one result (ignored unless it maps to a catalog case)."""
+        cell = self.index.case_cells.get(result.id)
+        if cell is not None:
+            self._counts[cell * _STATUSES + STATUS_CODES[result.status]] += 1
+
+    def add_all(self, results: Iterable[TestResultModel]) -> BreakdownAccumulator:
+        """Count every result of an iterable; returns self."""
+        case_cells = self.index.case_cells
+        counts = self._counts
+        for r in results:
+            cell = case_cells.get(r.id)
+            if cell is not None:
+                counts[cell * _STATUSES + STATUS_CODES[r.status]] += 1
+        return self
+
+    def add_batch(self, batch: ResultBatch) -> BreakdownAccumulator:
+        """Count every result of a columnar ResultBatch; returns self."""
+        case_cells = self.index.case_cells
+        counts = self._counts
+        for result_id, code in zip(batch.ids, batch.status_codes):
+            cell = case_cells.get(result_id)
+            if cell is not None:
+                counts[cell * _STATUSES + code] += 1
+        return self
+
+    def merge(self, other: BreakdownAccumulator) -> BreakdownAccumulator:
+        """
+        Add the result counts of another accumulator into this one; returns self.
+
+        Both must be built over the same catalog; raises ValidationError if
+        their dimensions or groups differ.
+        """
+        if other.index is not self.index and (
+            other.dimensions != self.dimensions or other.index.cell_groups != self.index.cell_groups
+        ):
+            raise ValidationError("cannot merge breakdowns built over different catalogs or dimensions")
+        counts = self._counts
+        for i, n in enumerate(other._counts):
+            counts[i] += n
+        return self
+
+    def breakdowns(self) -> dict[str, list[dict]]:
+        """
+        Return {dimension: [group row, ...]} with groups sorted by name.
+
+        Each row has: group, total_cases, mapped_results, passed, failed,
+        skipped, failure_rate, skip_rate (rates over mapped results, 0.0 if
+        none). The unspecified group, if any, comes last.
+        """
+        index = self.index
+        per_dim: list[dict[str, list[int]]] = [{} for _ in index.dimensions]
+        for cell, groups in enumerate(index.cell_groups):
+            status_counts = self._counts[cell * _STATUSES:(cell + 1) * _STATUSES]
+            for dim_groups, group in zip(per_dim, groups):
+                row = dim_groups.get(group)
+                if row is None:
+                    row = dim_groups[group] = [0] * (_STATUS_OFFSET + _STATUSES)
+                row[_CASES] += index.cell_cases[cell]
+                row[_MAPPED] += sum(status_counts)
+                for code, n in enumerate(status_counts):
+                    row[_STATUS_OFFSET + code] += n
+
+        out: dict[str, list[dict]] = {}
+        for dim, groups in zip(index.dimensions, per_dim):
+            rows = []
+            for group in sorted(groups, key=lambda g: (g == UNSPECIFIED_GROUP, g)):
+                row = groups[group]
+                mapped = row[_MAPPED]
+                failed = row[_STATUS_OFFSET + STATUS_CODES["failed"]]
+                skipped = row[_STATUS_OFFSET + STATUS_CODES["skipped"]]
+                rows.append(
+                    {
+                        "group": group,
+                        "total_cases": row[_CASES],
+                        "mapped_results": mapped,
+                        "passed": row[_STATUS_OFFSET + STATUS_CODES["passed"]],
+                        "failed": failed,
+                        "skipped": skipped,
+                        "failure_rate": failed / mapped if mapped > 0 else 0.0,
+                        "skip_rate": skipped / mapped if mapped > 0 else 0.0,
+                    }
+                )
+            out[dim] = rows
+        return out
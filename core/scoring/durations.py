@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import heapq
+import math
+from collections.abc import Iterable
+
+from core.errors import ValidationError
+from core.normalization.models import NormalizedData, ResultBatch, TestResultModel
+
+DEFAULT_TOP_K = 10
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BUCKETS = 2048
+
+# Durations at or below this are counted as zero (log buckets need x > 0).
+_MIN_POSITIVE_SEC = 1e-9
+
+
+def compute_duration_stats(data: NormalizedData, top_k: int = DEFAULT_TOP_K) -> dict:
+    """
+    Compute duration statistics over all results that carry a duration.
+
+    See DurationAccumulator.summary for the output layout.
+    """
+    acc = DurationAccumulator(top_k=top_k)
+    if isinstance(data.results, ResultBatch):
+        acc.add_batch(data.results)
+    else:
+        acc.add_all(data.results)
+    return acc.summary()
+
+
+class QuantileSketch:
+    """
+    Mergeable, bounded-memory quantile sketch with relative error guarantees.
+
+    Values are counted in logarithmic buckets (as in DDSketch): bucket k covers
+    (gamma**(k-1), gamma**k] with gamma = (1 + a) / (1 - a), so any quantile
+    is reported within relative accuracy a of a true sample value. Memory is
+    at most max_buckets counters; past that the lowest buckets are collapsed,
+    which only loses precision at the fast end of the distribution.
+    """
+
+    __slots__ = (
+        "relative_accuracy",
+        "max_buckets",
+        "count",
+        "zero_count",
+        "min",
+        "max",
+        "_gamma",
+        "_log_gamma",
+        "_buckets",
+    )
+
+    def __init__(
+        self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY, max_buckets: int = DEFAULT_MAX_BUCKETS
+    ) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValidationError(f"relative accuracy must be in (0, 1) (got {relative_accuracy})")
+        if max_buckets < 1:
+            raise ValidationError(f"max buckets must be >= 1 (got {max_buckets})")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.count = 0
+        self.zero_count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: dict[int, int] = {}
+
+    def add(self, value: float) -> None:
+        """Add one non-negative value; inf and NaN are ignored (they have no bucket)."""
+        if not math.isfinite(value):
+            return
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value <= _MIN_POSITIVE_SEC:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        buckets = self._buckets
+        buckets[key] = buckets.get(key, 0) + 1
+        if len(buckets) > self.max_buckets:
+            self._collapse()
+
+    def merge(self, other: QuantileSketch) -> QuantileSketch:
+        """Add all values counted by another sketch; returns self."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValidationError(
+                f"cannot merge sketches with different relative accuracy ({self.relative_accuracy} vs {other.relative_accuracy})"
+            )
+        self.count += other.count
+        self.zero_count += other.zero_count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        buckets = self._buckets
+        for key, n in other._buckets.items():
+            buckets[key] = buckets.get(key, 0) + n
+        if len(buckets) > self.max_buckets:
+            self._collapse()
+        return self
+
+    def quantile(self, q: float) -> float | None:
+        """Return the estimated q-quantile (0 <= q <= 1), or None if empty."""
+        if not 0 <= q <= 1:
+            raise ValidationError(f"quantile must be in [0, 1] (got {q})")
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return max(self.min, 0.0)
+        seen = self.zero_count
+        value = self.max
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if seen > rank:
+                # Midpoint (in relative terms) of the bucket's range.
+                value = 2 * self._gamma**key / (self._gamma + 1)
+                break
+        return min(max(value, self.min), self.max)
+
+    def _collapse(self) -> None:
+        keys = sorted(self._buckets)
+        excess = len(keys) - self.max_buckets
+        target = keys[excess]
+        for key in keys[:excess]:
+            self._buckets[target] += self._buckets.pop(key)
+
+
+class DurationAccumulator:
+    """
+    Streaming duration statistics: total, mean, p50/p95/p99 and top-K slowest.
+
+    Quantiles come from a QuantileSketch and the slowest results from a
+    size-K min-heap, so memory is bounded regardless of the number of results
+    and nothing is ever sorted in full. Results without a duration, or with a
+    non-finite one (JUnit time="inf" / "NaN"), are not counted. Accumulators can be merged (e.g. per shard).
+    """
+
+    __slots__ = ("top_k", "count", "total_sec", "sketch", "_slowest")
+
+    def __init__(self, top_k: int = DEFAULT_TOP_K, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY) -> None:
+        if top_k < 0:
+            raise ValidationError(f"top k must be >= 0 (got {top_k})")
+        self.top_k = top_k
+        self.count = 0
+        self.total_sec = 0.0
+        self.sketch = QuantileSketch(relative_accuracy)
+        self._slowest: list[tuple[float, str]] = []
+
+    def add(self, result: TestResultModel) -> None:
+        """Count one result's duration (ignored if it has none or it is not finite)."""
+        if result.duration_sec is not None and math.isfinite(result.duration_sec):
+            self._add_duration(result.duration_sec, result.id)
+
+    def add_all(self, results: Iterable[TestResultModel]) -> DurationAccumulator:
+        """Count the durations of every result of an iterable; returns self."""
+        for r in results:
+            if r.duration_sec is not None and math.isfinite(r.duration_sec):
+                self._add_duration(r.duration_sec, r.id)
+        return self
+
+    def add_batch(self, batch: ResultBatch) -> DurationAccumulator:
+        """Count the durations of a columnar ResultBatch (NaN = none); returns self."""
+        for result_id, duration in zip(batch.ids, batch.durations):
+            if math.isfinite(duration):
+                self._add_duration(duration, result_id)
+        return self
+
+    def merge(self, other: DurationAccumulator) -> DurationAccumulator:
+        """Add the statistics of another accumulator into this one; returns self."""
+        self.count += other.count
+        self.total_sec += other.total_sec
+        self.sketch.merge(other.sketch)
+        for duration, result_id in other._slowest:
+            self._push_slowest(duration, result_id)
+        return self
+
+    def summary(self) -> dict:
+        """
+        Return the duration statistics.
+
+        Keys: timed_results, total_sec, mean_sec, p50_sec, p95_sec, p99_sec
+        (None when no result had a duration) and slowest, a list of
+        {"id", "duration_sec"} for the top_k slowest results, slowest first.
+        """
+        count = self.count
+        return {
+            "timed_results": count,
+            "total_sec": self.total_sec,
+            "mean_sec": self.total_sec / count if count > 0 else None,
+            "p50_sec": self.sketch.quantile(0.5),
+            "p95_sec": self.sketch.quantile(0.95),
+            "p99_sec": self.sketch.quantile(0.99),
+            "slowest": [
+                {"id": result_id, "duration_sec": duration}
+                for duration, result_id in sorted(self._slowest, key=lambda s: (-s[0], s[1]))
+            ],
+        }
+
+    def _add_duration(self, duration: float, result_id: str) -> None:
+        self.count += 1
+        self.total_sec += duration
+        self.sketch.add(duration)
+        self._push_slowest(duration, result_id)
+
+    def _push_slowest(self, duration: float, result_id: str) -> None:
+        heap = self._slowest
+        if len(heap) < self.top_k:
+            heapq.heappush(heap, (duration, result_id))
+        elif heap and (duration, result_id) > heap[0]:
+            heapq.heapreplace(heap, (duration, result_id))
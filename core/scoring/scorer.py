@@ -1,6 +1,15 @@
 from __future__ import annotations
 
-from core.normalization.models import NormalizedData
+from array import array
+from collections.abc import Collection, Iterable, Mapping
+from itertools import compress
+
+from core.errors import ValidationError
+from core.normalization.models import STATUS_CODES, NormalizedData, ResultBatch, TestCaseModel, TestResultModel
+from core.scoring import vectorized
+
+# Counters serialized by MetricsAccumulator.to_dict, in order.
+_ACCUMULATOR_FIELDS = ("total_cases", "total_results", "mapped_results", "passed", "failed", "skipped")
 
 
 def compute_metrics(data: NormalizedData) -> dict:
@@ -8,36 +17,194 @@ def compute_metrics(data: NormalizedData) -> dict:
     Compute metrics from normalized test data.
 
     Only counts passed/failed/skipped for mapped results (results where
-    result.id exists in data.test_cases).
+    result.id exists in data.test_cases). data.results may be a list of
+    TestResultModel or a columnar ResultBatch.
+    """
+    if isinstance(data.results, ResultBatch):
+        return compute_metrics_from_batch(data.test_cases, data.results)
+    return compute_metrics_from_results(data.test_cases, data.results)
+
+
+def compute_metrics_from_results(
+    test_cases: Mapping[str, TestCaseModel], results: Iterable[TestResultModel]
+) -> dict:
+    """
+    Compute metrics by folding results into counters in a single pass.
+
+    Accepts any iterable (e.g. a generator straight from a loader), so results
+    are never materialized; memory depends only on the test case catalog.
+    Returns the same dictionary as compute_metrics.
+    """
+    return MetricsAccumulator(test_cases).add_all(results).metrics()
+
+
+def compute_metrics_from_batch(test_cases: Mapping[str, TestCaseModel], batch: ResultBatch) -> dict:
+    """
+    Compute metrics from a columnar ResultBatch.
+
+    Mapped status codes are selected with itertools.compress over a membership
+    mask and counted with array.count, so no per-row Python objects are
+    created; large batches use the optional NumPy backend instead. Returns the
+    same dictionary as compute_metrics.
     """
-    total_cases = len(data.test_cases)
-    total_results = len(data.results)
-
-    # Identify mapped and unmapped results
-    mapped_results = [r for r in data.results if r.id in data.test_cases]
-    unmapped_results = total_results - len(mapped_results)
-
-    # Count statuses only for mapped results
-    passed = sum(1 for r in mapped_results if r.status == "passed")
-    failed = sum(1 for r in mapped_results if r.status == "failed")
-    skipped = sum(1 for r in mapped_results if r.status == "skipped")
-
-    # Calculate rates (avoid division by zero)
-    mapped_count = len(mapped_results)
-    failure_rate = failed / mapped_count if mapped_count > 0 else 0.0
-    skip_rate = skipped / mapped_count if mapped_count > 0 else 0.0
-
-    return {
-        "total_cases": total_cases,
-        "total_results": total_results,
-        "mapped_results": mapped_count,
-        "unmapped_results": unmapped_results,
-        "passed": passed,
-        "failed": failed,
-        "skipped": skipped,
-        "failure_rate": failure_rate,
-        "skip_rate": skip_rate,
-    }
+    return MetricsAccumulator(test_cases).add_batch(batch).metrics()
+
+
+class MetricsAccumulator:
+    """
+    Mergeable running counters behind compute_metrics.
+
+    Results are added one at a time (or a whole ResultBatch at once) in a
+    single pass. Accumulators built against the same catalog can be merged, so
+    shards may be scored independently (e.g. on separate machines, shipped
+    with to_dict/from_dict) and reduced centrally; metrics() then returns the
+    same dictionary compute_metrics would for all results together.
+    """
+
+    __slots__ = ("_test_cases", "total_cases", "total_results", "mapped_results", "passed", "failed", "skipped")
+
+    def __init__(self, test_cases: Collection[str]) -> None:
+        # Only membership and size are used, so a catalog dict or a set of ids works.
+        self._test_cases: Collection[str] | None = test_cases
+        self.total_cases = len(test_cases)
+        self.total_results = 0
+        self.mapped_results = 0
+        self.passed = 0
+        self.failed = 0
+        self.skipped = 0
+
+    def add(self, result: TestResultModel) -> None:
+        """Count one result."""
+        self.total_results += 1
+        if result.id not in self._require_catalog():
+            return
+        self.mapped_results += 1
+        if result.status == "passed":
+            self.passed += 1
+        elif result.status == "failed":
+            self.failed += 1
+        elif result.status == "skipped":
+            self.skipped += 1
+
+    def add_all(self, results: Iterable[TestResultModel]) -> MetricsAccumulator:
+        """Count every result of an iterable; returns self."""
+        test_cases = self._require_catalog()
+        total_results = 0
+        mapped = 0
+        passed = 0
+        failed = 0
+        skipped = 0
+
+        for r in results:
+            total_results += 1
+            if r.id not in test_cases:
+                continue
+            # Count statuses only for mapped results
+            mapped += 1
+            if r.status == "passed":
+                passed += 1
+            elif r.status == "failed":
+                failed += 1
+            elif r.status == "skipped":
+                skipped += 1
+
+        self.total_results += total_results
+        self.mapped_results += mapped
+        self.passed += passed
+        self.failed += failed
+        self.skipped += skipped
+        return self
+
+    def add_batch(self, batch: ResultBatch) -> MetricsAccumulator:
+        """
+        Count every result of a columnar ResultBatch; returns self.
+
+        Batches of at least vectorized.VECTORIZE_MIN_RESULTS rows are counted
+        with the NumPy backend when NumPy is installed (same counts).
+        """
+        test_cases = self._require_catalog()
+        if len(batch) >= vectorized.VECTORIZE_MIN_RESULTS and vectorized.numpy_available():
+            mapped, passed, failed, skipped = vectorized.count_mapped_statuses_vectorized(test_cases, batch)
+        else:
+            mapped_codes = array("b", compress(batch.status_codes, map(test_cases.__contains__, batch.ids)))
+            mapped = len(mapped_codes)
+            passed = mapped_codes.count(STATUS_CODES["passed"])
+            failed = mapped_codes.count(STATUS_CODES["failed"])
+            skipped = mapped_codes.count(STATUS_CODES["skipped"])
+
+        self.total_results += len(batch)
+        self.mapped_results += mapped
+        self.passed += passed
+        self.failed += failed
+        self.skipped += skipped
+        return self
+
+    def merge(self, other: MetricsAccumulator) -> MetricsAccumulator:
+        """
+        Add the counters of another accumulator into this one; returns self.
+
+        Raises ValidationError if the two were built against catalogs of
+        different sizes, since their results cannot be scored together.
+        """
+        if other.total_cases != self.total_cases:
+            raise ValidationError(
+                f"cannot merge metrics for different catalogs ({self.total_cases} vs {other.total_cases} test cases)"
+            )
+        self.total_results += other.total_results
+        self.mapped_results += other.mapped_results
+        self.passed += other.passed
+        self.failed += other.failed
+        self.skipped += other.skipped
+        return self
+
+    def metrics(self) -> dict:
+        """Return the metrics dictionary (same keys and values as compute_metrics)."""
+        mapped = self.mapped_results
+
+        # Calculate rates (avoid division by zero)
+        failure_rate = self.failed / mapped if mapped > 0 else 0.0
+        skip_rate = self.skipped / mapped if mapped > 0 else 0.0
+
+        return {
+            "total_cases": self.total_cases,
+            "total_results": self.total_results,
+            "mapped_results": mapped,
+            "unmapped_results": self.total_results - mapped,
+            "passed": self.passed,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "failure_rate": failure_rate,
+            "skip_rate": skip_rate,
+        }
+
+    def to_dict(self) -> dict:
+        """Serialize the counters (JSON-compatible) for shipping a partial aggregate."""
+        return {key: getattr(self, key) for key in _ACCUMULATOR_FIELDS}
+
+    @classmethod
+    def from_dict(cls, state: Mapping[str, int]) -> MetricsAccumulator:
+        """
+        Rebuild an accumulator from to_dict output.
+
+        The result carries counters only, not the catalog: it can be merged and
+        reported but not fed further results. Raises ValidationError for
+        missing or negative counters.
+        """
+        acc = cls.__new__(cls)
+        acc._test_cases = None
+        for key in _ACCUMULATOR_FIELDS:
+            value = state.get(key)
+            if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+                raise ValidationError(f"invalid metrics state: '{key}' must be a non-negative integer")
+            setattr(acc, key, value)
+        if acc.passed + acc.failed + acc.skipped > acc.mapped_results or acc.mapped_results > acc.total_results:
+            raise ValidationError("invalid metrics state: counters are inconsistent")
+        return acc
+
+    def _require_catalog(self) -> Collection[str]:
+        if self._test_cases is None:
+            raise ValidationError("accumulator restored from a dict has no catalog and cannot add results")
+        return self._test_cases
 
 
 def compute_release_readiness_score(metrics: dict) -> int:
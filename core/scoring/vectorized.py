@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from collections.abc import Collection
+
+from core.normalization.models import STATUS_CODES, STATUS_NAMES, ResultBatch
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+# Batches at least this large are counted with NumPy when it is installed;
+# below it, array conversion costs more than the pure-Python path saves.
+VECTORIZE_MIN_RESULTS = 100_000
+
+
+def numpy_available() -> bool:
+    """Return True if the optional NumPy backend can be used."""
+    return np is not None
+
+
+def count_mapped_statuses_vectorized(
+    test_cases: Collection[str], batch: ResultBatch
+) -> tuple[int, int, int, int]:
+    """
+    Return (mapped, passed, failed, skipped) for a batch using NumPy.
+
+    The catalog membership mask is filled with np.fromiter straight from the
+    catalog's hash lookups (no intermediate list), and mapped status codes are
+    counted with np.bincount over the status column viewed in place. The counts
+    are identical to the pure-Python path in MetricsAccumulator.add_batch.
+
+    Raises ImportError if NumPy is not installed.
+    """
+    if np is None:
+        raise ImportError("the vectorized metrics backend requires numpy")
+
+    n = len(batch)
+    mapped_mask = np.fromiter(map(test_cases.__contains__, batch.ids), dtype=np.bool_, count=n)
+    status_codes = np.frombuffer(batch.status_codes, dtype=np.int8, count=n)
+    counts = np.bincount(status_codes[mapped_mask], minlength=len(STATUS_NAMES))
+    return (
+        int(counts.sum()),
+        int(counts[STATUS_CODES["passed"]]),
+        int(counts[STATUS_CODES["failed"]]),
+        int(counts[STATUS_CODES["skipped"]]),
+    )
@@ -3,17 +3,24 @@
 Demo script to generate a pre-release QA risk review report.
 
 Usage:
-    python demo/generate_report.py --tests <csv_path> --results <junit_xml_path> [--outdir reports]
+    python demo/generate_report.py --tests <csv_path> --results <junit_xml_path> [--outdir reports] [--format md,html] [--jobs N]
+
+--results may also be a directory or glob of JUnit shards, which are parsed
+in parallel with --jobs worker processes and merged in sorted path order.
 """
 
 import argparse
+import asyncio
 import sys
 from pathlib import Path
 
-from core.ingestion.csv_loader import load_test_cases_csv
-from core.ingestion.junit_loader import load_junit_results
-from core.pipeline import run_pipeline
-from core.reporting.exporter import save_markdown_report
+from core.control.cli_contract import add_input_options, cache_dir_from_args, id_options_from_args
+from core.history.store import RunHistoryStore
+from core.ingestion.cache import ParseCache, default_cache_dir
+from core.ingestion.id_extraction import IdExtractor
+from core.ingestion.junit_loader import load_junit_result_batch_many, resolve_junit_paths
+from core.pipeline import run_pipeline_async
+from core.reporting.exporter import save_reports
 
 
 def main() -> None:
@@ -28,29 +35,75 @@ def main() -> None:
     parser.add_argument(
         "--results",
         required=True,
-        help="Path to JUnit XML file with test results",
+        help="Path to JUnit XML file, directory or glob of shards with test results",
     )
     parser.add_argument(
         "--outdir",
         default="reports",
         help="Output directory for the report (default: reports)",
     )
+    parser.add_argument(
+        "--format",
+        default="md",
+        help="Comma-separated report formats: md, json, html, junit (default: md)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for parsing JUnit shards in parallel (default: 1)",
+    )
+    add_input_options(parser)
+    parser.add_argument(
+        "--history",
+        default=None,
+        help="SQLite database to append this run to for trend analysis (default: not recorded)",
+    )
+    parser.add_argument(
+        "--baseline",
+        default=None,
+        help="JUnit results of a baseline build (file, directory or glob) to report changes against",
+    )
 
     args = parser.parse_args()
 
     try:
-        test_cases = load_test_cases_csv(args.tests)
-        results = load_junit_results(args.results)
-
-        output = run_pipeline(test_cases, results)
+        cache = None if args.no_cache else ParseCache(cache_dir_from_args(args) or default_cache_dir())
+        id_extractor = IdExtractor.from_schemes(*id_options_from_args(args))
+        baseline = None
+        if args.baseline:
+            baseline = load_junit_result_batch_many(
+                resolve_junit_paths(args.baseline), max_workers=args.jobs, id_extractor=id_extractor
+            )
+        history = RunHistoryStore(args.history) if args.history else None
+        try:
+            # Catalog and results are loaded concurrently.
+            output = asyncio.run(
+                run_pipeline_async(
+                    args.tests,
+                    args.results,
+                    max_workers=args.jobs,
+                    cache=cache,
+                    id_extractor=id_extractor,
+                    history=history,
+                    baseline=baseline,
+                )
+            )
+        finally:
+            if history is not None:
+                history.close()
 
-        report_path = save_markdown_report(
-            output["markdown_report"],
+        report_paths = save_reports(
+            output["report"],
+            formats=[name.strip() for name in args.format.split(",")],
             output_dir=args.outdir,
             prefix="pre_release_report",
         )
 
-        print(f"Report saved: {report_path}")
+        for report_path in report_paths.values():
+            print(f"Report saved: {report_path}")
+        if "run_id" in output:
+            print(f"Run recorded in history: {args.history} (run {output['run_id']})")
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
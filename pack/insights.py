@@ -15,11 +15,26 @@ class Insight:
 
 _SEVERITY_ORDER = {"critical": 0, "warning": 1, "info": 2}
 
-
-def generate_insights(metrics: dict, score: int, risk: str) -> list[Insight]:
+# Slow-suite thresholds applied to duration statistics.
+SLOW_SUITE_TOTAL_SEC = 3600.0
+SLOW_TEST_P95_SEC = 60.0
+
+
+def generate_insights(
+    metrics: dict,
+    score: int,
+    risk: str,
+    durations: dict | None = None,
+    flaky_tests: list[dict] | None = None,
+) -> list[Insight]:
     """
     Generate deterministic insights from metrics, score, and risk.
 
+    With durations (see DurationAccumulator.summary), slow-suite warnings are
+    added when cumulative test time or the p95 test duration exceed
+    SLOW_SUITE_TOTAL_SEC / SLOW_TEST_P95_SEC. With flaky_tests (see
+    FlakinessTracker.flaky_tests), a warning lists the most unstable tests.
+
     Returns a list sorted by severity (critical, warning, info) and then by code.
     Always includes at least one "info" insight for score summary.
     """
@@ -88,6 +103,40 @@ def generate_insights(metrics: dict, score: int, risk: str) -> list[Insight]:
             )
         )
 
+    if durations and durations["timed_results"] > 0:
+        if durations["total_sec"] > SLOW_SUITE_TOTAL_SEC:
+            insights.append(
+                Insight(
+                    code="SLOW_SUITE",
+                    severity="warning",
+                    title="Slow Test Suite",
+                    details=f"Cumulative test time is {durations['total_sec'] / 60:.1f} minutes across {durations['timed_results']} timed result(s), which slows feedback before release.",
+                )
+            )
+        if durations["p95_sec"] > SLOW_TEST_P95_SEC:
+            slowest = durations["slowest"][0] if durations["slowest"] else None
+            slowest_note = f" The slowest is {slowest['id']} at {slowest['duration_sec']:.1f}s." if slowest else ""
+            insights.append(
+                Insight(
+                    code="SLOW_TESTS_PRESENT",
+                    severity="warning",
+                    title="Slow Tests Detected",
+                    details=f"The 95th percentile test duration is {durations['p95_sec']:.1f}s, so a significant share of tests are slow and may be worth optimizing or splitting.{slowest_note}",
+                )
+            )
+
+    if flaky_tests:
+        shown = ", ".join(f"{f['id']} ({f['flips']} flips in {f['observations']} runs)" for f in flaky_tests[:3])
+        more = f" and {len(flaky_tests) - 3} more" if len(flaky_tests) > 3 else ""
+        insights.append(
+            Insight(
+                code="FLAKY_TESTS_DETECTED",
+                severity="warning",
+                title="Flaky Tests Detected",
+                details=f"{len(flaky_tests)} test(s) flipped between passed and failed across recent runs: {shown}{more}. Their results are unreliable evidence of release readiness.",
+            )
+        )
+
     # Info insights (always include at least one)
     insights.append(
         Insight(
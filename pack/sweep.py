@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import itertools
+import json
+from collections import Counter
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, fields
+from pathlib import Path
+
+from core.errors import IngestionError, ValidationError
+from pack.config import ScoringConfig
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+# Metrics used by the score formula, i.e. the columns of the metrics matrix.
+_METRIC_KEYS = ("failed", "skipped", "unmapped_results")
+_CONFIG_FIELDS = tuple(f.name for f in fields(ScoringConfig))
+
+# Upper bound on (configs x distinct runs) score cells evaluated at once.
+_MAX_CELLS_PER_CHUNK = 1 << 22
+
+
+@dataclass(frozen=True, slots=True)
+class SweepResult:
+    """Risk distribution of all runs re-scored under one candidate config."""
+
+    config: ScoringConfig
+    runs: int
+    low: int
+    medium: int
+    high: int
+    mean_score: float
+
+
+def config_grid(base: ScoringConfig | None = None, **axes: Iterable[int]) -> list[ScoringConfig]:
+    """
+    Build the Cartesian product of candidate values per ScoringConfig field.
+
+    Fields not given keep their value from base (default ScoringConfig()).
+    Configs are ordered like itertools.product over the axes in the given
+    order. Raises ValidationError for unknown fields or non-integer values.
+    """
+    base = base or ScoringConfig()
+    names = list(axes)
+    value_lists = []
+    for name in names:
+        if name not in _CONFIG_FIELDS:
+            raise ValidationError(f"unknown config field '{name}' (expected one of: {list(_CONFIG_FIELDS)})")
+        values = list(axes[name])
+        if not values:
+            raise ValidationError(f"config field '{name}' has no candidate values")
+        for v in values:
+            if not isinstance(v, int) or isinstance(v, bool):
+                raise ValidationError(f"config field '{name}' values must be integers (got {v!r})")
+        value_lists.append(values)
+
+    base_values = {name: getattr(base, name) for name in _CONFIG_FIELDS}
+    return [ScoringConfig(**{**base_values, **dict(zip(names, combo))}) for combo in itertools.product(*value_lists)]
+
+
+def sweep_configs(
+    metrics_rows: Iterable[Mapping[str, int]],
+    configs: Sequence[ScoringConfig],
+    use_numpy: bool | None = None,
+) -> list[SweepResult]:
+    """
+    Re-score every run under every config and tally the risk levels per config.
+
+    metrics_rows are metrics dicts as produced by compute_metrics (only failed,
+    skipped and unmapped_results are used). Identical runs are deduplicated
+    first, then all (config, run) scores are evaluated as one vectorized
+    NumPy computation when NumPy is installed (use_numpy=None), or in a plain
+    loop otherwise. Both paths apply exactly the compute_score_with_config /
+    classify_risk_with_config rules and give identical results, in config order.
+
+    Raises ValidationError for runs missing a metric or with negative counts.
+    """
+    runs = Counter(_metric_triple(i, m) for i, m in enumerate(metrics_rows))
+    configs = list(configs)
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy and np is None:
+        raise ImportError("the vectorized sweep requires numpy")
+
+    tallies = _sweep_numpy(runs, configs) if use_numpy else _sweep_python(runs, configs)
+    total_runs = sum(runs.values())
+    return [
+        SweepResult(
+            config=config,
+            runs=total_runs,
+            low=low,
+            medium=medium,
+            high=high,
+            mean_score=score_sum / total_runs if total_runs > 0 else 0.0,
+        )
+        for config, (low, medium, high, score_sum) in zip(configs, tallies)
+    ]
+
+
+def load_sweep_runs(path: str | Path) -> list[dict]:
+    """
+    Load historical runs from a JSON file for sweep_configs.
+
+    The file holds a list whose items are metrics dicts or pipeline outputs
+    (objects with a "metrics" dict). Raises IngestionError if the file cannot
+    be read or parsed and ValidationError if its structure is wrong.
+    """
+    data = _load_json(path, "runs")
+    if not isinstance(data, list):
+        raise ValidationError(f"runs '{path}': expected a JSON list of metrics objects")
+    runs = []
+    for i, item in enumerate(data):
+        if isinstance(item, dict) and isinstance(item.get("metrics"), dict):
+            item = item["metrics"]
+        if not isinstance(item, dict):
+            raise ValidationError(f"runs '{path}': item {i} is not a metrics object")
+        runs.append(item)
+    return runs
+
+
+def load_config_grid(path: str | Path) -> tuple[list[ScoringConfig], list[str]]:
+    """
+    Load a config grid from a JSON object mapping ScoringConfig fields to values.
+
+    A value may be a list of candidates or a single integer. Returns the
+    configs (see config_grid) and the names of the varied fields. Raises
+    IngestionError / ValidationError as load_sweep_runs.
+    """
+    data = _load_json(path, "grid")
+    if not isinstance(data, dict):
+        raise ValidationError(f"grid '{path}': expected a JSON object of config field -> values")
+    axes = {name: values if isinstance(values, list) else [values] for name, values in data.items()}
+    return config_grid(**axes), list(axes)
+
+
+def format_sweep_table(results: Sequence[SweepResult], config_fields: Sequence[str]) -> str:
+    """Render sweep results as an aligned plain-text table, one row per config."""
+    header = [*config_fields, "runs", "low", "medium", "high", "mean_score"]
+    rows = [
+        [
+            *(str(getattr(r.config, name)) for name in config_fields),
+            str(r.runs),
+            str(r.low),
+            str(r.medium),
+            str(r.high),
+            f"{r.mean_score:.1f}",
+        ]
+        for r in results
+    ]
+    widths = [max(len(cell) for cell in column) for column in zip(header, *rows)]
+    return "\n".join("  ".join(cell.rjust(w) for cell, w in zip(row, widths)) for row in [header, *rows])
+
+
+def _load_json(path: str | Path, what: str):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError as e:
+        raise IngestionError(f"{what} '{path}': file not found") from e
+    except (OSError, UnicodeDecodeError) as e:
+        raise IngestionError(f"{what} '{path}': unable to read file ({e})") from e
+    except json.JSONDecodeError as e:
+        raise IngestionError(f"{what} '{path}': invalid JSON ({e})") from e
+
+
+def _metric_triple(index: int, metrics: Mapping[str, int]) -> tuple[int, int, int]:
+    values = []
+    for key in _METRIC_KEYS:
+        value = metrics.get(key)
+        if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+            raise ValidationError(f"run {index}: metric '{key}' must be a non-negative integer (got {value!r})")
+        values.append(value)
+    return values[0], values[1], values[2]
+
+
+def _sweep_python(runs: Counter, configs: list[ScoringConfig]) -> list[tuple[int, int, int, int]]:
+    run_items = list(runs.items())
+    tallies = []
+    for c in configs:
+        low = medium = high = score_sum = 0
+        for (failed, skipped, unmapped), n in run_items:
+            # Inlined compute_score_with_config / classify_risk_with_config.
+            score = 100 - (
+                min(c.max_failed_penalty, failed * c.failed_penalty_per_test)
+                + min(c.max_skipped_penalty, skipped * c.skipped_penalty_per_test)
+                + min(c.max_unmapped_penalty, unmapped * c.unmapped_penalty_per_result)
+            )
+            if score < 0:
+                score = 0
+            if score >= c.low_risk_threshold:
+                low += n
+            elif score >= c.medium_risk_threshold:
+                medium += n
+            else:
+                high += n
+            score_sum += score * n
+        tallies.append((low, medium, high, score_sum))
+    return tallies
+
+
+def _sweep_numpy(runs: Counter, configs: list[ScoringConfig]) -> list[tuple[int, int, int, int]]:
+    if not runs or not configs:
+        return [(0, 0, 0, 0) for _ in configs]
+
+    matrix = np.array(list(runs), dtype=np.int64)  # distinct runs x (failed, skipped, unmapped)
+    weights = np.fromiter(runs.values(), dtype=np.int64, count=len(runs))
+    failed, skipped, unmapped = matrix[:, 0], matrix[:, 1], matrix[:, 2]
+
+    def column(name: str, chunk: list[ScoringConfig]):
+        return np.array([getattr(c, name) for c in chunk], dtype=np.int64)[:, None]
+
+    tallies: list[tuple[int, int, int, int]] = []
+    chunk_size = max(1, _MAX_CELLS_PER_CHUNK // len(runs))
+    for start in range(0, len(configs), chunk_size):
+        chunk = configs[start:start + chunk_size]
+        # Same integer formula as compute_score_with_config, for all pairs at once.
+        penalty = (
+            np.minimum(column("max_failed_penalty", chunk), failed * column("failed_penalty_per_test", chunk))
+            + np.minimum(column("max_skipped_penalty", chunk), skipped * column("skipped_penalty_per_test", chunk))
+            + np.minimum(
+                column("max_unmapped_penalty", chunk), unmapped * column("unmapped_penalty_per_result", chunk)
+            )
+        )
+        scores = np.maximum(0, 100 - penalty)
+
+        low = scores >= column("low_risk_threshold", chunk)
+        medium = ~low & (scores >= column("medium_risk_threshold", chunk))
+        high = ~low & ~medium
+        for row in zip(low @ weights, medium @ weights, high @ weights, scores @ weights):
+            tallies.append(tuple(int(v) for v in row))
+    return tallies
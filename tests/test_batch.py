@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from core.control.batch import load_batch_manifest, run_batch, write_batch_index
+from core.control.cli_contract import EXIT_RISK_GATE, main, parse_batch_plan
+from core.errors import IngestionError, ValidationError
+
+
+def _write_service(root: Path, name: str, failures: int) -> None:
+    (root / f"{name}.csv").write_text("id,name\nTC-1,Login\nTC-2,Logout\n", encoding="utf-8")
+    outcomes = ["<failure/>"] * failures + [""] * (2 - failures)
+    cases = "".join(f'<testcase name="TC-{i}">{outcome}</testcase>' for i, outcome in enumerate(outcomes, start=1))
+    (root / f"{name}.xml").write_text(f"<testsuite>{cases}</testsuite>", encoding="utf-8")
+
+
+def _defaults(tmp_path: Path, *extra: str):
+    manifest = tmp_path / "manifest.json"
+    argv = ["batch", "--manifest", str(manifest), "--outdir", str(tmp_path / "out"), "--no-cache", *extra]
+    return parse_batch_plan(argv).defaults
+
+
+def test_load_manifest_json_and_csv(tmp_path):
+    defaults = _defaults(tmp_path, "--format", "md,json")
+    (tmp_path / "manifest.json").write_text(
+        json.dumps([
+            {"name": "auth", "tests": "auth.csv", "results": "auth.xml"},
+            {"name": "pay", "tests": "pay.csv", "results": "shards/", "format": "html", "history": "pay.db"},
+        ]),
+        encoding="utf-8",
+    )
+    (tmp_path / "manifest.csv").write_text(
+        "name,tests,results,format\nauth,auth.csv,auth.xml,\npay,pay.csv,shards/,html\n", encoding="utf-8"
+    )
+
+    entries = load_batch_manifest(tmp_path / "manifest.json", defaults)
+    from_csv = load_batch_manifest(tmp_path / "manifest.csv", defaults)
+
+    assert [e.name for e in entries] == ["auth", "pay"]
+    auth, pay = (e.plan for e in entries)
+    assert auth.tests_path == tmp_path / "auth.csv"
+    assert auth.outdir == tmp_path / "out" / "auth"
+    assert (auth.formats, pay.formats) == (("md", "json"), ("html",))
+    assert pay.history_path == tmp_path / "pay.db"
+    assert [e.plan.formats for e in from_csv] == [("md", "json"), ("html",)]
+
+
+@pytest.mark.parametrize(
+    "entries, match",
+    [
+        ([{"name": "a", "tests": "a.csv"}], "'results' is required"),
+        ([{"name": "a b", "tests": "a.csv", "results": "a.xml"}], "name 'a b' is invalid"),
+        ([{"name": "a", "tests": "a.csv", "results": "a.xml"}] * 2, "duplicate name 'a'"),
+        ([{"name": "a", "tests": "a.csv", "results": "a.xml", "format": "pdf"}], "format 'pdf' is invalid"),
+        ([{"name": "a", "tests": "a.csv", "results": "a.xml", "jobs": "2"}], r"unknown fields \['jobs'\]"),
+        ({"name": "a"}, "expected a JSON list"),
+    ],
+)
+def test_load_manifest_validation(tmp_path, entries, match):
+    (tmp_path / "manifest.json").write_text(json.dumps(entries), encoding="utf-8")
+    with pytest.raises(ValidationError, match=match):
+        load_batch_manifest(tmp_path / "manifest.json", _defaults(tmp_path))
+
+
+def test_load_manifest_read_errors(tmp_path):
+    with pytest.raises(IngestionError, match="file not found"):
+        load_batch_manifest(tmp_path / "missing.json", _defaults(tmp_path))
+    (tmp_path / "manifest.json").write_text("[", encoding="utf-8")
+    with pytest.raises(IngestionError, match="invalid JSON"):
+        load_batch_manifest(tmp_path / "manifest.json", _defaults(tmp_path))
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_run_batch_isolates_failures_and_writes_index(tmp_path, max_workers):
+    _write_service(tmp_path, "auth", failures=0)
+    _write_service(tmp_path, "pay", failures=2)
+    (tmp_path / "manifest.json").write_text(
+        json.dumps([
+            {"name": "auth", "tests": "auth.csv", "results": "auth.xml"},
+            {"name": "broken", "tests": "missing.csv", "results": "auth.xml"},
+            {"name": "pay", "tests": "pay.csv", "results": "pay.xml", "format": "md,junit"},
+        ]),
+        encoding="utf-8",
+    )
+    entries = load_batch_manifest(tmp_path / "manifest.json", _defaults(tmp_path))
+
+    seen = []
+    results = run_batch(entries, max_workers=max_workers, on_result=lambda r: seen.append(r.name))
+
+    assert sorted(seen) == ["auth", "broken", "pay"]
+    assert [(r.name, r.ok, r.score, r.risk) for r in results] == [
+        ("auth", True, 100, "Low"),
+        ("broken", False, None, None),
+        ("pay", True, 80, "Medium"),
+    ]
+    assert "file not found" in results[1].error
+    assert sorted(results[2].reports) == ["junit", "md"]
+    assert all(Path(p).is_file() for p in results[2].reports.values())
+
+    paths = write_batch_index(results, tmp_path / "out")
+    index = json.loads(Path(paths["json"]).read_text(encoding="utf-8"))
+    assert (index["succeeded"], index["failed"]) == (2, 1)
+    assert index["entries"][0]["reports"]["md"].startswith("auth/pre_release_report_")
+    markdown = Path(paths["md"]).read_text(encoding="utf-8")
+    assert "2 of 3 review(s) succeeded." in markdown
+    assert "| pay | 80 | Medium | [md](pay/" in markdown
+
+
+def test_cli_batch_exit_codes(tmp_path, capsys):
+    _write_service(tmp_path, "auth", failures=0)
+    _write_service(tmp_path, "pay", failures=2)
+    manifest = tmp_path / "manifest.csv"
+    manifest.write_text("name,tests,results\nauth,auth.csv,auth.xml\npay,pay.csv,pay.xml\n", encoding="utf-8")
+    argv = ["batch", "--manifest", str(manifest), "--outdir", str(tmp_path / "out"), "--no-cache", "--jobs", "1"]
+
+    assert main(argv) == 0
+    out = capsys.readouterr().out
+    assert "[ok] pay: score 80 / 100 (Medium risk)" in out
+    assert "2 of 2 review(s) succeeded" in out
+    assert (tmp_path / "out" / "batch_index.md").is_file()
+
+    assert main([*argv, "--fail-on", "medium"]) == EXIT_RISK_GATE
+    assert "for: pay" in capsys.readouterr().err
+
+    manifest.write_text("name,tests,results\nauth,auth.csv,missing.xml\n", encoding="utf-8")
+    assert main(argv) == 2
+    assert "1 review(s) failed: auth" in capsys.readouterr().err
+    assert main([*argv[:-2], "--jobs", "0"]) == 2
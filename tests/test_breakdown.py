@@ -0,0 +1,77 @@
+import pytest
+
+from core.errors import ValidationError
+from core.normalization.models import NormalizedData, ResultBatch, TestCaseModel, TestResultModel
+from core.scoring import UNSPECIFIED_GROUP, BreakdownAccumulator, CatalogGroupIndex, compute_breakdowns
+
+
+def _catalog():
+    return {
+        "TC-1": TestCaseModel(id="TC-1", title="Login", component="auth", priority="P1"),
+        "TC-2": TestCaseModel(id="TC-2", title="Logout", component="auth", priority="P2"),
+        "TC-3": TestCaseModel(id="TC-3", title="Pay", component="checkout", priority="P1"),
+        "TC-4": TestCaseModel(id="TC-4", title="Misc"),
+    }
+
+
+RESULTS = [
+    TestResultModel(id="TC-1", status="passed"),
+    TestResultModel(id="TC-2", status="failed"),
+    TestResultModel(id="TC-3", status="skipped"),
+    TestResultModel(id="TC-3", status="failed"),
+    TestResultModel(id="TC-4", status="passed"),
+    TestResultModel(id="UNKNOWN", status="failed"),
+]
+
+
+def test_breakdowns_per_component_and_priority():
+    breakdowns = compute_breakdowns(NormalizedData(test_cases=_catalog(), results=RESULTS))
+
+    assert [r["group"] for r in breakdowns["component"]] == ["auth", "checkout", UNSPECIFIED_GROUP]
+    auth, checkout, unspecified = breakdowns["component"]
+    assert (auth["total_cases"], auth["mapped_results"], auth["passed"], auth["failed"]) == (2, 2, 1, 1)
+    assert auth["failure_rate"] == 0.5
+    assert (checkout["failed"], checkout["skipped"], checkout["skip_rate"]) == (1, 1, 0.5)
+    assert (unspecified["total_cases"], unspecified["passed"]) == (1, 1)
+
+    p1 = breakdowns["priority"][0]
+    assert (p1["group"], p1["total_cases"], p1["mapped_results"]) == ("P1", 2, 3)
+    # Unmapped results are never attributed to a group.
+    assert sum(r["mapped_results"] for r in breakdowns["priority"]) == 5
+
+
+def test_batch_and_merged_shards_match_single_pass():
+    catalog = _catalog()
+    expected = compute_breakdowns(NormalizedData(test_cases=catalog, results=RESULTS))
+
+    batch = ResultBatch.from_results(RESULTS)
+    assert compute_breakdowns(NormalizedData(test_cases=catalog, results=batch)) == expected
+
+    left = BreakdownAccumulator(catalog).add_all(RESULTS[:3])
+    right = BreakdownAccumulator(catalog)
+    for r in RESULTS[3:]:
+        right.add(r)
+    assert left.merge(right).breakdowns() == expected
+
+
+def test_accumulators_from_shared_index():
+    catalog = _catalog()
+    index = CatalogGroupIndex(catalog)
+    expected = compute_breakdowns(NormalizedData(test_cases=catalog, results=RESULTS))
+
+    # One cell per distinct (component, priority) combination.
+    assert len(index.cell_groups) == 4
+    first = BreakdownAccumulator.from_index(index).add_all(RESULTS)
+    second = BreakdownAccumulator.from_index(index).add_all(RESULTS[:2])
+    assert first.breakdowns() == expected
+    assert second.breakdowns()["component"][0]["mapped_results"] == 2
+    assert BreakdownAccumulator.from_index(index).merge(first).breakdowns() == expected
+
+
+def test_breakdown_rejects_unknown_dimension_and_mismatched_merge():
+    with pytest.raises(ValidationError, match="unknown breakdown dimension 'title'"):
+        BreakdownAccumulator(_catalog(), dimensions=("title",))
+
+    acc = BreakdownAccumulator(_catalog())
+    with pytest.raises(ValidationError, match="cannot merge"):
+        acc.merge(BreakdownAccumulator(_catalog(), dimensions=("component",)))
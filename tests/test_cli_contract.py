@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import json
+import subprocess
 import sys
 from pathlib import Path
 
 import pytest
 
-from core.control.cli_contract import RunPlan, build_parser, main, parse_run_plan
+from core.control.cli_contract import EXIT_RISK_GATE, RunPlan, build_parser, main, parse_run_plan
 from core.errors import ValidationError
 
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
 
 def test_parse_run_plan_success_defaults():
     argv = ["run", "--tests", "a.csv", "--results", "b.xml"]
@@ -72,7 +75,7 @@ def test_prefix_validation_accepts_good():
 
 
 def test_main_outputs_json_and_exit_code_0(capsys):
-    argv = ["run", "--tests", "a.csv", "--results", "b.xml"]
+    argv = ["run", "--tests", "a.csv", "--results", "b.xml", "--dry-run"]
     exit_code = main(argv)
 
     assert exit_code == 0
@@ -110,6 +113,12 @@ def test_main_missing_required_args_exit_code_2(capsys):
     assert captured.out == ""
 
 
+def test_main_help_exit_code_0(capsys):
+    assert main(["--help"]) == 0
+    assert main(["run", "--help"]) == 0
+    assert "--fail-on" in capsys.readouterr().out
+
+
 def test_parse_run_plan_validates_empty_paths():
     # Empty tests path
     with pytest.raises(ValidationError, match="tests path must be non-empty"):
@@ -141,3 +150,106 @@ def test_build_parser():
     assert args.tests == "a.csv"
     assert args.results == "b.xml"
 
+
+
+def test_parse_run_plan_jobs():
+    plan = parse_run_plan(["run", "--tests", "a.csv", "--results", "shards/", "--jobs", "8"])
+    assert plan.jobs == 8
+    assert plan.results_path == Path("shards/")
+
+    assert parse_run_plan(["run", "--tests", "a.csv", "--results", "b.xml"]).jobs == 1
+
+    with pytest.raises(ValidationError, match="jobs must be >= 1"):
+        parse_run_plan(["run", "--tests", "a.csv", "--results", "b.xml", "--jobs", "0"])
+
+
+def test_parse_run_plan_cache_options():
+    plan = parse_run_plan(["run", "--tests", "a.csv", "--results", "b.xml"])
+    assert plan.use_cache is True
+    assert plan.cache_dir is None
+
+    plan = parse_run_plan(["run", "--tests", "a.csv", "--results", "b.xml", "--no-cache", "--cache-dir", "c"])
+    assert plan.use_cache is False
+    assert plan.cache_dir == Path("c")
+
+    with pytest.raises(ValidationError, match="cache dir must be non-empty"):
+        parse_run_plan(["run", "--tests", "a.csv", "--results", "b.xml", "--cache-dir", " "])
+
+
+def test_parse_run_plan_history():
+    assert parse_run_plan(["run", "--tests", "a.csv", "--results", "b.xml"]).history_path is None
+    plan = parse_run_plan(["run", "--tests", "a.csv", "--results", "b.xml", "--history", "runs.db"])
+    assert plan.history_path == Path("runs.db")
+
+    with pytest.raises(ValidationError, match="history path must be non-empty"):
+        parse_run_plan(["run", "--tests", "a.csv", "--results", "b.xml", "--history", " "])
+
+
+def test_parse_run_plan_format_list():
+    plan = parse_run_plan(["run", "--tests", "a.csv", "--results", "b.xml", "--format", "md, html,md,junit"])
+    assert plan.format == "md,html,junit"
+    assert plan.formats == ("md", "html", "junit")
+    assert parse_run_plan(["run", "--tests", "a.csv", "--results", "b.xml"]).formats == ("md",)
+
+    for bad in ["pdf", "md,", "md,pdf"]:
+        with pytest.raises(ValidationError, match="comma-separated list of md, json, html, junit"):
+            parse_run_plan(["run", "--tests", "a.csv", "--results", "b.xml", "--format", bad])
+
+
+def _write_inputs(tmp_path, failures: int) -> tuple[str, str]:
+    tests_csv = tmp_path / "cases.csv"
+    tests_csv.write_text("id,name\nTC-1,Login\nTC-2,Logout\n", encoding="utf-8")
+    outcomes = ["<failure/>"] * failures + [""] * (2 - failures)
+    cases = "".join(f'<testcase name="TC-{i}">{outcome}</testcase>' for i, outcome in enumerate(outcomes, start=1))
+    results_xml = tmp_path / "results.xml"
+    results_xml.write_text(f"<testsuite>{cases}</testsuite>", encoding="utf-8")
+    return str(tests_csv), str(results_xml)
+
+
+def test_main_run_saves_reports(tmp_path, capsys):
+    tests_csv, results_xml = _write_inputs(tmp_path, failures=0)
+    outdir = tmp_path / "out"
+
+    exit_code = main([
+        "run", "--tests", tests_csv, "--results", results_xml, "--outdir", str(outdir),
+        "--format", "md,json", "--cache-dir", str(tmp_path / "cache"), "--fail-on", "medium",
+    ])
+
+    assert exit_code == 0
+    out = capsys.readouterr().out
+    assert "Score: 100 / 100 (Low risk)" in out
+    assert sorted(p.suffix for p in outdir.iterdir()) == [".json", ".md"]
+    report = json.loads(next(outdir.glob("*.json")).read_text(encoding="utf-8"))
+    assert report["metrics"]["passed"] == 2
+
+
+def test_main_run_fail_on_gate(tmp_path, capsys):
+    tests_csv, results_xml = _write_inputs(tmp_path, failures=2)  # score 80: Medium risk
+    argv = ["run", "--tests", tests_csv, "--results", results_xml, "--outdir", str(tmp_path / "out"), "--no-cache"]
+
+    assert main(argv) == 0
+    assert main([*argv, "--fail-on", "high"]) == 0
+    capsys.readouterr()
+    assert main([*argv, "--fail-on", "medium"]) == EXIT_RISK_GATE
+    assert "risk level Medium meets --fail-on medium" in capsys.readouterr().err
+
+    with pytest.raises(SystemExit):
+        parse_run_plan([*argv, "--fail-on", "low"])
+
+    assert main(["run", "--tests", str(tmp_path / "missing.csv"), "--results", results_xml, "--no-cache"]) == 2
+    assert "Error:" in capsys.readouterr().err
+
+
+def test_cli_startup_does_not_import_heavy_modules():
+    heavy = ["core.ingestion", "core.pipeline", "core.reporting", "numpy", "sqlite3", "xml.etree.ElementTree"]
+    code = (
+        "import sys, io, contextlib\n"
+        "from cli import main\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        "    main(['run', '--tests', 'a.csv', '--results', 'b.xml', '--dry-run'])\n"
+        f"print([name for name in {heavy!r} if name in sys.modules])\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
@@ -1,7 +1,19 @@
+import bz2
+import gzip
+import lzma
+
 import pytest
 
-from core.errors import IngestionError
-from core.ingestion.csv_loader import load_test_cases_csv
+from core.errors import IngestionError, ValidationError
+from core.ingestion.csv_loader import (
+    iter_test_case_models_csv,
+    iter_test_cases_csv,
+    load_test_case_catalog_csv,
+    load_test_case_catalog_csv_parallel,
+    load_test_cases_csv,
+)
+from core.normalization import normalize_test_cases
+from core.normalization.models import TestCaseModel
 
 
 def test_csv_supports_id_synonyms_test_id(tmp_path):
@@ -69,3 +81,140 @@ def test_csv_raises_if_row_id_empty(tmp_path):
 
 
 
+
+
+@pytest.mark.parametrize("codec", [gzip, bz2, lzma], ids=["gzip", "bz2", "xz"])
+def test_csv_reads_compressed_input_by_magic_bytes(tmp_path, codec):
+    # No compression suffix: detection must rely on content, not the name.
+    p = tmp_path / "cases.csv"
+    p.write_bytes(codec.compress(b"id,name,priority\nTC-1,Login,High\nTC-2,\"Multi\nline\",\n"))
+
+    rows = load_test_cases_csv(str(p))
+    assert [r["id"] for r in rows] == ["TC-1", "TC-2"]
+    assert rows[1]["title"] == "Multi\nline"
+    assert rows[0]["priority"] == "High"
+
+
+def test_csv_raises_on_corrupt_compressed_input(tmp_path):
+    p = tmp_path / "cases.csv.gz"
+    p.write_bytes(b"\x1f\x8b\x08\x00garbage")
+
+    with pytest.raises(IngestionError) as e:
+        load_test_cases_csv(str(p))
+    assert "unable to read file" in str(e.value)
+
+
+def test_csv_iter_yields_rows_lazily(tmp_path):
+    p = tmp_path / "cases.csv"
+    p.write_text("id,name\nTC-1,A\n,B\n", encoding="utf-8")
+
+    rows = iter_test_cases_csv(str(p))
+    assert next(rows)["id"] == "TC-1"
+    with pytest.raises(IngestionError, match="empty id at row 3"):
+        next(rows)
+
+
+def test_csv_fused_catalog_matches_two_step_normalize(tmp_path):
+    p = tmp_path / "cases.csv"
+    p.write_text(
+        "ID,Title,Steps,Severity,Area,ID\n"
+        "x,  Login ,  do it ,High,,TC-1\n"
+        "\n"
+        "y,Short row\n",
+        encoding="utf-8",
+    )
+
+    # Repeated header resolves to the last column; short rows read missing cells as blank.
+    with pytest.raises(IngestionError, match="empty id at row 3"):
+        load_test_case_catalog_csv(str(p))
+
+    p.write_text("id,title,priority\nTC-1,  Login ,High\nTC-2,Logout,\n", encoding="utf-8")
+    assert load_test_case_catalog_csv(str(p)) == normalize_test_cases(load_test_cases_csv(str(p)))
+    assert list(iter_test_case_models_csv(str(p)))[0] == TestCaseModel(id="TC-1", title="Login", priority="High")
+
+
+def test_csv_fused_catalog_raises_validation_error_on_duplicate_id(tmp_path):
+    p = tmp_path / "cases.csv"
+    p.write_text("id,title\nTC-1,A\nTC-1,B\n", encoding="utf-8")
+
+    with pytest.raises(ValidationError, match="Duplicate test case id: TC-1"):
+        load_test_case_catalog_csv(str(p))
+
+
+def _write_tricky_catalog(p, rows=40):
+    lines = ['id,title,description,priority,component,"free\nnotes"']
+    for i in range(rows):
+        desc = f'"line one\n""quoted"", {i}\nline three"' if i % 3 == 0 else f"plain {i}"
+        lines.append(f'TC-{i},"Title, {i}",{desc},P{i % 3},')
+        if i % 7 == 0:
+            lines.append("")
+    p.write_text("\r\n".join(lines) + "\r\n", encoding="utf-8")
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_csv_parallel_catalog_matches_serial_with_quoted_newlines(tmp_path, max_workers):
+    p = tmp_path / "cases.csv"
+    _write_tricky_catalog(p)
+
+    serial = load_test_case_catalog_csv(str(p))
+    parallel = load_test_case_catalog_csv_parallel(str(p), max_workers=max_workers, chunk_bytes=64)
+    assert list(parallel) == list(serial)
+    assert serial["TC-3"].description == 'line one\n"quoted", 3\nline three'
+    # description is projected away by default
+    assert all(tc.description is None for tc in parallel.values())
+    assert [(tc.title, tc.priority) for tc in parallel.values()] == [(tc.title, tc.priority) for tc in serial.values()]
+
+    with_desc = load_test_case_catalog_csv_parallel(str(p), chunk_bytes=64, include_description=True)
+    assert with_desc == serial
+
+
+def test_csv_parallel_reports_global_row_numbers_and_duplicates(tmp_path):
+    p = tmp_path / "cases.csv"
+    body = "".join(f'TC-{i},"multi\nline {i}"\n\n' for i in range(30))
+    p.write_text("id,title\n" + body + ",blank id\n", encoding="utf-8")
+
+    with pytest.raises(IngestionError) as serial_err:
+        load_test_case_catalog_csv(str(p))
+    with pytest.raises(IngestionError) as parallel_err:
+        load_test_case_catalog_csv_parallel(str(p), max_workers=2, chunk_bytes=50)
+    assert str(parallel_err.value) == str(serial_err.value)
+    assert "row 32" in str(parallel_err.value)
+
+    p.write_text("id,title\n" + body + "TC-4,again\n", encoding="utf-8")
+    with pytest.raises(ValidationError, match="Duplicate test case id: TC-4"):
+        load_test_case_catalog_csv_parallel(str(p), max_workers=2, chunk_bytes=50)
+
+
+@pytest.mark.parametrize("chunk_bytes", [50, 100, 300])
+def test_csv_parallel_matches_serial_with_stray_quote_in_unquoted_field(tmp_path, chunk_bytes):
+    # A literal quote in an unquoted field (accepted by csv) flips quote parity
+    # for the rest of the file, so parity-based split points land inside the
+    # quoted multi-line steps below; the parallel loader must notice.
+    lines = ["id,title,steps"]
+    for i in range(200):
+        title = '5" screen' if i == 10 else f"Case {i}"
+        steps = f'"line 1\nline 2"' if i % 4 == 0 else f"step {i}"
+        lines.append(f"TC-{i},{title},{steps}")
+    p = tmp_path / "cases.csv"
+    p.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    serial = load_test_case_catalog_csv(str(p))
+    assert len(serial) == 200
+    for max_workers in (1, 2):
+        parallel = load_test_case_catalog_csv_parallel(
+            str(p), max_workers=max_workers, chunk_bytes=chunk_bytes, include_description=True
+        )
+        assert parallel == serial
+
+    # A stray quote in the header row is caught before any chunk is parsed.
+    p.write_text('id,title 5",steps\n' + "\n".join(lines[1:]) + "\n", encoding="utf-8")
+    assert load_test_case_catalog_csv_parallel(str(p), max_workers=2, chunk_bytes=chunk_bytes) == {
+        tc_id: TestCaseModel(id=tc_id, title="") for tc_id in load_test_case_catalog_csv(str(p))
+    }
+
+
+def test_csv_parallel_falls_back_to_serial_for_compressed_input(tmp_path):
+    p = tmp_path / "cases.csv.gz"
+    p.write_bytes(gzip.compress(b"id,title\nTC-1,A\nTC-2,B\n"))
+
+    assert list(load_test_case_catalog_csv_parallel(str(p), max_workers=2, chunk_bytes=4)) == ["TC-1", "TC-2"]
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from core.control.cli_contract import main, parse_diff_plan
+from core.errors import ValidationError
+from core.history import RunHistoryStore
+from core.normalization.models import ResultBatch, TestResultModel
+from core.pipeline import run_pipeline
+from core.reasoning import DIFF_CATEGORIES, diff_history_runs, diff_results
+
+
+def _run(**statuses: str) -> list[TestResultModel]:
+    return [TestResultModel(id=test_id, status=status) for test_id, status in statuses.items()]
+
+
+def _junit(path, **statuses: str) -> None:
+    outcome = {"passed": "", "failed": "<failure/>", "skipped": "<skipped/>"}
+    cases = "".join(f'<testcase name="{i}">{outcome[s]}</testcase>' for i, s in statuses.items())
+    path.write_text(f"<testsuite>{cases}</testsuite>", encoding="utf-8")
+
+
+BASELINE = dict(A="passed", B="failed", C="passed", D="failed", E="passed", F="skipped")
+CANDIDATE = dict(A="failed", B="passed", C="skipped", D="failed", G="failed", F="passed", H="passed")
+
+
+def test_diff_categories():
+    diff = diff_results(_run(**BASELINE), _run(**CANDIDATE))
+
+    assert diff == {
+        "baseline_tests": 6,
+        "candidate_tests": 7,
+        "new_failures": ["A", "G"],
+        "fixed": ["B"],
+        "newly_skipped": ["C"],
+        "disappeared": ["E"],
+        "added": ["G", "H"],
+    }
+    assert all(key in diff for key in DIFF_CATEGORIES)
+
+
+def test_batches_match_models_and_last_rerun_wins():
+    baseline = _run(**BASELINE)
+    candidate = _run(**CANDIDATE) + [TestResultModel(id="A", status="passed")]
+
+    diff = diff_results(ResultBatch.from_results(baseline), ResultBatch.from_results(candidate))
+
+    assert diff == diff_results(baseline, candidate)
+    assert diff["new_failures"] == ["G"]
+
+
+def test_diff_history_runs(tmp_path):
+    output = run_pipeline([], [])
+    with RunHistoryStore(tmp_path / "history.db") as store:
+        first = store.record_run(output, _run(**BASELINE))
+        second = store.record_run(output, _run(**CANDIDATE))
+
+        assert diff_history_runs(store, first, second) == diff_results(_run(**BASELINE), _run(**CANDIDATE))
+        with pytest.raises(ValidationError, match="no run with id 99"):
+            diff_history_runs(store, first, 99)
+
+
+def test_pipeline_reports_changes_since_baseline():
+    cases = [{"id": "TC-1", "title": "One"}, {"id": "TC-2", "title": "Two"}]
+    results = [{"id": "TC-1", "status": "failed"}, {"id": "TC-2", "status": "passed"}]
+
+    output = run_pipeline(cases, results, baseline=_run(**{"TC-1": "passed", "TC-2": "failed"}))
+
+    assert output["diff"]["new_failures"] == ["TC-1"]
+    assert output["diff"]["fixed"] == ["TC-2"]
+    assert "## Changes Since Baseline" in output["markdown_report"]
+    assert "**New failures:** TC-1" in output["markdown_report"]
+    assert "diff" not in run_pipeline(cases, results)
+
+
+def test_parse_diff_plan_requires_run_ids_with_history():
+    plan = parse_diff_plan(["diff", "--baseline", "old.xml", "--candidate", "new/"])
+    assert (plan.baseline, plan.candidate, plan.history_path, plan.format) == ("old.xml", "new/", None, "text")
+
+    with pytest.raises(ValidationError, match="baseline must be a run id"):
+        parse_diff_plan(["diff", "--baseline", "old.xml", "--candidate", "2", "--history", "runs.db"])
+    with pytest.raises(ValidationError, match="candidate must be non-empty"):
+        parse_diff_plan(["diff", "--baseline", "old.xml", "--candidate", " "])
+
+
+def test_cli_diff_junit_and_history(tmp_path, capsys):
+    _junit(tmp_path / "old.xml", **{"TC-1": "passed", "TC-2": "failed"})
+    _junit(tmp_path / "new.xml", **{"TC-1": "failed", "TC-2": "passed", "TC-3": "passed"})
+
+    assert main(["diff", "--baseline", str(tmp_path / "old.xml"), "--candidate", str(tmp_path / "new.xml")]) == 0
+    out = capsys.readouterr().out
+    assert "baseline: 2 tests, candidate: 3 tests" in out
+    assert "new_failures (1): TC-1" in out
+    assert "disappeared (0)" in out
+
+    with RunHistoryStore(tmp_path / "history.db") as store:
+        store.record_run(run_pipeline([], []), _run(**{"TC-1": "passed"}))
+        store.record_run(run_pipeline([], []), _run(**{"TC-1": "failed"}))
+    argv = ["diff", "--baseline", "1", "--candidate", "2", "--history", str(tmp_path / "history.db")]
+    assert main([*argv, "--format", "json"]) == 0
+    assert json.loads(capsys.readouterr().out)["new_failures"] == ["TC-1"]
+
+    assert main(["diff", "--baseline", str(tmp_path / "nope.xml"), "--candidate", str(tmp_path / "new.xml")]) == 2
+
+
+def test_cli_run_reports_changes_since_baseline(tmp_path, capsys):
+    (tmp_path / "tests.csv").write_text("id,title\nTC-1,One\nTC-2,Two\n", encoding="utf-8")
+    _junit(tmp_path / "old.xml", **{"TC-1": "passed", "TC-2": "failed"})
+    _junit(tmp_path / "new.xml", **{"TC-1": "failed", "TC-2": "passed"})
+    history = str(tmp_path / "history.db")
+    run = ["run", "--tests", str(tmp_path / "tests.csv"), "--format", "json", "--no-cache", "--history", history]
+
+    def report(outdir: str) -> dict:
+        (path,) = (tmp_path / outdir).iterdir()
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    # A JUnit baseline, while the run itself is recorded as run 1.
+    argv = [*run, "--results", str(tmp_path / "new.xml"), "--outdir", str(tmp_path / "a")]
+    assert main([*argv, "--baseline", str(tmp_path / "old.xml")]) == 0
+    assert (report("a")["diff"]["new_failures"], report("a")["diff"]["fixed"]) == (["TC-1"], ["TC-2"])
+
+    # A stored run id: run 2 compared against run 1.
+    argv = [*run, "--results", str(tmp_path / "old.xml"), "--outdir", str(tmp_path / "b")]
+    assert main([*argv, "--baseline", "1"]) == 0
+    assert (report("b")["diff"]["new_failures"], report("b")["diff"]["fixed"]) == (["TC-2"], ["TC-1"])
+    capsys.readouterr()
+
+    assert main([*argv, "--baseline", "99"]) == 2
+    assert "no run with id 99" in capsys.readouterr().err
+    assert main(["run", "--tests", "a.csv", "--results", "b.xml", "--baseline", "41", "--dry-run"]) == 0
+    assert json.loads(capsys.readouterr().out)["baseline"] == "41"
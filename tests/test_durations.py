@@ -0,0 +1,85 @@
+import math
+import random
+
+import pytest
+
+from core.errors import ValidationError
+from core.normalization.models import NormalizedData, ResultBatch, TestResultModel
+from core.scoring import DurationAccumulator, QuantileSketch, compute_duration_stats
+
+
+def _exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def test_sketch_quantiles_within_relative_accuracy():
+    rng = random.Random(3)
+    values = [rng.lognormvariate(0, 2) for _ in range(20_000)]
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for v in values:
+        sketch.add(v)
+
+    for q in (0.0, 0.5, 0.95, 0.99, 1.0):
+        exact = _exact_quantile(values, q)
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.0101)
+    assert QuantileSketch().quantile(0.5) is None
+
+
+def test_sketch_memory_is_bounded_and_merge_matches_single_pass():
+    values = [10 ** (i / 100) for i in range(-600, 600)]
+    bounded = QuantileSketch(max_buckets=64)
+    for v in values:
+        bounded.add(v)
+    assert len(bounded._buckets) <= 64
+    # Collapsing only affects the fast end of the distribution.
+    assert bounded.quantile(0.99) == pytest.approx(_exact_quantile(values, 0.99), rel=0.0101)
+
+    whole = QuantileSketch()
+    left, right = QuantileSketch(), QuantileSketch()
+    for i, v in enumerate(values):
+        whole.add(v)
+        (left if i % 2 else right).add(v)
+    assert left.merge(right).quantile(0.5) == whole.quantile(0.5)
+
+    with pytest.raises(ValidationError, match="relative accuracy"):
+        whole.merge(QuantileSketch(relative_accuracy=0.05))
+
+
+def test_duration_stats_total_mean_and_slowest():
+    results = [
+        TestResultModel(id="TC-1", status="passed", duration_sec=1.0),
+        TestResultModel(id="TC-2", status="failed", duration_sec=5.0),
+        TestResultModel(id="TC-3", status="passed", duration_sec=None),
+        TestResultModel(id="TC-4", status="passed", duration_sec=0.0),
+        TestResultModel(id="TC-5", status="skipped", duration_sec=3.0),
+    ]
+
+    stats = compute_duration_stats(NormalizedData(test_cases={}, results=results), top_k=2)
+
+    assert stats["timed_results"] == 4
+    assert stats["total_sec"] == 9.0
+    assert stats["mean_sec"] == 2.25
+    # Lower-rank convention: p99 of 4 values is the 3rd smallest.
+    assert stats["p99_sec"] == pytest.approx(3.0, rel=0.01)
+    assert stats["slowest"] == [{"id": "TC-2", "duration_sec": 5.0}, {"id": "TC-5", "duration_sec": 3.0}]
+
+    batch_stats = compute_duration_stats(NormalizedData(test_cases={}, results=ResultBatch.from_results(results)), top_k=2)
+    assert batch_stats == stats
+
+
+def test_merged_accumulators_keep_global_top_k():
+    rng = random.Random(5)
+    results = [TestResultModel(id=f"TC-{i}", status="passed", duration_sec=rng.uniform(0, 100)) for i in range(500)]
+
+    shards = [DurationAccumulator(top_k=5).add_all(results[i::4]) for i in range(4)]
+    merged = shards[0]
+    for shard in shards[1:]:
+        merged.merge(shard)
+
+    expected = sorted(results, key=lambda r: -r.duration_sec)[:5]
+    assert [s["id"] for s in merged.summary()["slowest"]] == [r.id for r in expected]
+    assert merged.summary()["total_sec"] == pytest.approx(math.fsum(r.duration_sec for r in results))
+
+    empty = DurationAccumulator().summary()
+    assert (empty["timed_results"], empty["mean_sec"], empty["p50_sec"], empty["slowest"]) == (0, None, None, [])
@@ -1,9 +1,11 @@
+import io
 import re
 from pathlib import Path
 
 import pytest
 
-from core.reporting.exporter import save_markdown_report
+from core.reporting.exporter import save_markdown_report, save_markdown_report_lines, write_markdown_lines
+from core.reporting.report_builder import build_markdown_report, iter_markdown_report
 
 
 def test_save_markdown_report_creates_file(tmp_path):
@@ -56,3 +58,33 @@ def test_save_markdown_report_default_prefix(tmp_path):
     pattern = r"^pre_release_report_\d{8}_\d{6}\.md$"
     assert re.match(pattern, filename), f"Filename '{filename}' does not match default prefix pattern"
 
+
+
+def test_save_markdown_report_lines_matches_string_path(tmp_path):
+    metrics = {
+        "total_cases": 1,
+        "total_results": 2,
+        "mapped_results": 1,
+        "unmapped_results": 1,
+        "passed": 0,
+        "failed": 1,
+        "skipped": 0,
+        "failure_rate": 1.0,
+        "skip_rate": 0.0,
+    }
+    failed = [{"id": f"TC-{i}", "title": "Täst", "component": None, "duration_sec": None} for i in range(1000)]
+    markdown = build_markdown_report(metrics, 70, "Medium", failed_tests=failed)
+
+    string_path = save_markdown_report(markdown, output_dir=str(tmp_path / "a"))
+    lines_path = save_markdown_report_lines(
+        iter_markdown_report(metrics, 70, "Medium", failed_tests=iter(failed)), output_dir=str(tmp_path / "b")
+    )
+
+    assert Path(lines_path).read_bytes() == Path(string_path).read_bytes()
+
+
+def test_write_markdown_lines_joins_with_newlines():
+    for lines in ([], [""], ["a"], ["a", "", "b"]):
+        sink = io.StringIO()
+        write_markdown_lines(lines, sink)
+        assert sink.getvalue() == "\n".join(lines)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import pytest
+
+from core.errors import ValidationError
+from core.history import TREND_METRICS, RunHistoryStore
+from core.normalization.models import ResultBatch, TestResultModel
+from core.pipeline import Pipeline, run_pipeline
+from core.reasoning import FlakinessTracker
+
+
+def _run(**statuses: str) -> list[TestResultModel]:
+    return [TestResultModel(id=test_id, status=status) for test_id, status in statuses.items()]
+
+
+def test_flips_counted_across_runs_and_skips_ignored():
+    tracker = FlakinessTracker()
+    for statuses in (
+        {"A": "passed", "B": "passed", "C": "failed"},
+        {"A": "failed", "B": "passed", "C": "failed"},
+        {"A": "skipped", "B": "passed", "C": "failed"},
+        {"A": "passed", "B": "passed", "C": "failed"},
+        {"A": "failed", "B": "failed", "C": "failed"},
+    ):
+        tracker.add_all(_run(**statuses)).end_run()
+
+    assert tracker.flips("A") == 3  # P F P F (the skip is not an observation)
+    assert tracker.flips("B") == 1
+    assert tracker.flips("C") == 0
+    assert tracker.flips("missing") == 0
+    assert tracker.flaky_tests() == [{"id": "A", "flips": 3, "observations": 4, "failures": 2}]
+    assert [f["id"] for f in tracker.flaky_tests(min_flips=1)] == ["A", "B"]
+
+
+def test_window_keeps_only_recent_observations():
+    tracker = FlakinessTracker(window=4)
+    for status in ["passed", "failed"] * 5 + ["passed"] * 4:
+        tracker.add(TestResultModel(id="T", status=status))
+        tracker.end_run()
+
+    # Only the last four (all passed) observations remain.
+    assert tracker.flips("T") == 0
+    assert tracker.flaky_tests(min_flips=1) == []
+    with pytest.raises(ValidationError, match="window must be >= 2"):
+        FlakinessTracker(window=1)
+
+
+def test_merge_in_order_matches_sequential_tracking():
+    import random
+
+    rng = random.Random(7)
+    shards = [
+        [TestResultModel(id=f"T{rng.randrange(5)}", status=rng.choice(["passed", "failed", "skipped"])) for _ in range(30)]
+        for _ in range(4)
+    ]
+    sequential = FlakinessTracker(window=8)
+    merged = FlakinessTracker(window=8)
+    for run in (shards[:2], shards[2:]):
+        # Shards of one run merge into its open run; closed runs are appended.
+        for shard in run:
+            sequential.add_all(shard)
+        sequential.end_run()
+        merged.merge(FlakinessTracker(window=8).add_all(run[0]).merge(FlakinessTracker(window=8).add_all(run[1])).end_run())
+
+    assert merged.flaky_tests(min_flips=1) == sequential.flaky_tests(min_flips=1)
+    assert [merged.flips(f"T{i}") for i in range(5)] == [sequential.flips(f"T{i}") for i in range(5)]
+    assert all(f["observations"] <= 2 for f in merged.flaky_tests(min_flips=0))
+    with pytest.raises(ValidationError, match="windows"):
+        merged.merge(FlakinessTracker(window=4))
+
+
+def test_batch_matches_results_and_history_replay(tmp_path):
+    runs = [
+        _run(A="passed", B="failed"),
+        _run(A="failed", B="failed"),
+        _run(A="passed", B="skipped"),
+    ]
+    expected = FlakinessTracker()
+    for run in runs:
+        expected.add_all(run).end_run()
+
+    batched = FlakinessTracker()
+    for run in runs:
+        batched.add_batch(ResultBatch.from_results(run)).end_run()
+    assert batched.flaky_tests(min_flips=1) == expected.flaky_tests(min_flips=1)
+
+    metrics = dict.fromkeys(TREND_METRICS, 0)
+    output = {"metrics": metrics, "score": 100, "risk": "Low"}
+    with RunHistoryStore(tmp_path / "history.db") as store:
+        for i, run in enumerate(runs):
+            store.record_run(output, run, recorded_at=float(i))
+        replayed = FlakinessTracker.from_history(store)
+        assert replayed.flaky_tests(min_flips=1) == expected.flaky_tests(min_flips=1)
+        # Only the most recent stored run.
+        assert FlakinessTracker.from_history(store, runs=1).flaky_tests(min_flips=1) == []
+
+
+def test_pipeline_flags_flaky_tests_from_history(tmp_path):
+    cases = [{"id": "TC-1", "title": "A"}, {"id": "TC-2", "title": "B"}]
+    with RunHistoryStore(tmp_path / "history.db") as store:
+        outputs = [
+            run_pipeline(cases, [{"id": "TC-1", "status": s}, {"id": "TC-2", "status": "passed"}], history=store)
+            for s in ("passed", "failed", "passed")
+        ]
+
+    assert outputs[0]["flaky_tests"] == []
+    assert outputs[-1]["flaky_tests"] == [{"id": "TC-1", "flips": 2, "observations": 3, "failures": 1}]
+    flaky_insight = next(i for i in outputs[-1]["insights"] if i["code"] == "FLAKY_TESTS_DETECTED")
+    assert flaky_insight["severity"] == "warning"
+    assert "TC-1 (2 flips in 3 runs)" in flaky_insight["details"]
+
+    # Reruns inside a single run are one observation, failed if any rerun failed.
+    reruns = [{"id": "TC-1", "status": s} for s in ("passed", "failed", "passed", "failed")]
+    assert run_pipeline(cases, reruns)["flaky_tests"] == []
+    with RunHistoryStore(tmp_path / "history.db") as store:
+        output = run_pipeline(cases, reruns + [{"id": "TC-2", "status": "passed"}], history=store)
+    assert output["flaky_tests"] == [{"id": "TC-1", "flips": 3, "observations": 4, "failures": 2}]
+
+
+def test_no_tracker_is_kept_without_history():
+    pipeline = Pipeline([{"id": "TC-1", "title": "A"}])
+    shard = _run(**{f"X-{i}": "failed" for i in range(100)})
+    accumulators = pipeline.accumulators().fold(shard).merge(pipeline.accumulators().fold(shard))
+    assert accumulators.flakiness is None
+    assert pipeline.evaluate_accumulated(accumulators)["flaky_tests"] == []
+
+    # A tracker on either side of a merge is kept.
+    tracked = pipeline.accumulators()
+    tracked.flakiness = FlakinessTracker().add_all(_run(A="passed")).end_run()
+    assert accumulators.merge(tracked.fold(_run(A="failed"))).flakiness.flips("A") == 1
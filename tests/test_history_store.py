@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from core.errors import IngestionError, ValidationError
+from core.history import RunHistoryStore
+from core.normalization.models import ResultBatch, TestResultModel
+from core.pipeline import run_pipeline, run_pipeline_async, run_pipeline_from_files
+
+
+def _output(failed: int, score: int = 90, risk: str = "Low") -> dict:
+    return {
+        "metrics": {
+            "total_cases": 10,
+            "total_results": 10,
+            "mapped_results": 10,
+            "unmapped_results": 0,
+            "passed": 10 - failed,
+            "failed": failed,
+            "skipped": 0,
+            "failure_rate": failed / 10,
+            "skip_rate": 0.0,
+        },
+        "score": score,
+        "risk": risk,
+    }
+
+
+def test_record_and_query_runs(tmp_path):
+    with RunHistoryStore(tmp_path / "history.db") as store:
+        assert store.latest_run_id() is None
+        first = store.record_run(
+            _output(0),
+            [TestResultModel(id="TC-1", status="passed", duration_sec=1.5), TestResultModel(id="TC-2", status="passed")],
+            recorded_at=100.0,
+            label="build-1",
+        )
+        batch = ResultBatch()
+        batch.append("TC-1", "failed", 2.0)
+        batch.append("TC-2", "skipped")
+        second = store.record_run(_output(3, score=60, risk="High"), batch, recorded_at=200.0)
+
+        assert store.latest_run_id() == second
+        runs = store.recent_runs(limit=10)
+        assert [r.run_id for r in runs] == [second, first]
+        assert runs[1].label == "build-1"
+        assert runs[0].metrics["failed"] == 3 and runs[0].risk == "High"
+
+        assert store.metric_trend("failure_rate") == [(first, 100.0, 0.0), (second, 200.0, 0.3)]
+        assert [v for _, _, v in store.metric_trend("score", limit=1)] == [60]
+
+        history = store.test_history("TC-1")
+        assert [(h.run_id, h.status, h.duration_sec) for h in history] == [(second, "failed", 2.0), (first, "passed", 1.5)]
+        assert store.test_history("TC-1", limit=1)[0].run_id == second
+
+        assert list(store.run_results(second).iter_results()) == list(batch.iter_results())
+        with pytest.raises(ValidationError, match="no run with id 999"):
+            store.run_results(999)
+        with pytest.raises(ValidationError, match="unknown trend metric"):
+            store.metric_trend("passed; DROP TABLE runs")
+
+    # Data persists across connections.
+    with RunHistoryStore(tmp_path / "history.db") as store:
+        assert len(store.recent_runs()) == 2
+
+
+def test_queries_use_indexes(tmp_path):
+    with RunHistoryStore(tmp_path / "history.db") as store:
+        conn = store._conn
+        plan = " ".join(
+            row[-1]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT run_id FROM runs ORDER BY recorded_at DESC, run_id DESC LIMIT 200"
+            )
+        )
+        assert "idx_runs_recorded_at" in plan
+        plan = " ".join(
+            row[-1]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT status FROM test_results WHERE test_id = ? ORDER BY run_id DESC", ("TC-1",)
+            )
+        )
+        assert "idx_test_results_test_id" in plan
+
+
+def test_unreadable_database_raises_ingestion_error(tmp_path):
+    bogus = tmp_path / "not_a_db.db"
+    bogus.write_bytes(b"this is not sqlite" * 100)
+    with pytest.raises(IngestionError, match="unable to open database"):
+        RunHistoryStore(bogus)
+
+
+def test_pipelines_record_runs(tmp_path):
+    with RunHistoryStore(tmp_path / "history.db") as store:
+        output = run_pipeline(
+            [{"id": "TC-1", "title": "A"}],
+            ({"id": i, "status": s} for i, s in [("TC-1", "failed"), ("OTHER", "passed")]),
+            history=store,
+        )
+        stored = store.get_run(output["run_id"])
+        assert stored.metrics == output["metrics"]
+        assert stored.score == output["score"]
+        assert [r.id for r in store.run_results(output["run_id"]).iter_results()] == ["TC-1", "OTHER"]
+
+        csv_path = tmp_path / "cases.csv"
+        csv_path.write_text("id,title\nTC-1,A\n", encoding="utf-8")
+        xml_path = tmp_path / "results.xml"
+        xml_path.write_text('<testsuite><testcase name="TC-1 ok" time="0.5"/></testsuite>', encoding="utf-8")
+        file_output = run_pipeline_from_files(str(csv_path), str(xml_path), history=store)
+        assert store.test_history("TC-1")[0].run_id == file_output["run_id"]
+        assert store.test_history("TC-1")[0].duration_sec == 0.5
+        assert "run_id" not in run_pipeline_from_files(str(csv_path), str(xml_path))
+
+        async_output = asyncio.run(run_pipeline_async(str(csv_path), str(xml_path), history=store))
+        assert store.latest_run_id() == async_output["run_id"]
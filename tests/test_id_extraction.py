@@ -0,0 +1,141 @@
+import pickle
+
+import pytest
+
+from core.control import cli_contract
+from core.errors import ValidationError
+from core.ingestion.id_extraction import BUILTIN_ID_SCHEMES, IdExtractor
+from core.ingestion.junit_loader import load_junit_results
+from core.pipeline import Pipeline, _reextract_ids, run_pipeline, run_pipeline_from_files
+
+
+def test_default_scheme_matches_tc_ids_and_falls_back_to_raw_name():
+    extractor = IdExtractor.from_schemes()
+    assert extractor.extract("login flow TC-123 should work") == "TC-123"
+    assert extractor.extract("login works") == "login works"
+    assert extractor.extract("ATC-1 is not a word boundary") == "ATC-1 is not a word boundary"
+
+
+def test_combined_schemes_take_leftmost_match():
+    extractor = IdExtractor.from_schemes(["tc", "jira", "testrail"])
+    assert extractor.extract("[C1234] checkout PAY-77") == "C1234"
+    assert extractor.extract("PAY-77 checkout [C1234]") == "PAY-77"
+    # TC-5 is also a valid JIRA-style key; the earlier scheme wins a tie.
+    assert extractor.extract("TC-5 smoke") == "TC-5"
+
+
+def test_custom_pattern_with_id_group_and_classname_fallback():
+    extractor = IdExtractor.from_schemes(["classname"], [r"case_(?P<id>\d+)", r"(?P<id>QA\d+)"])
+    assert extractor.extract("test_case_42[chrome]") == "42"
+    assert extractor.extract("QA7 smoke") == "QA7"
+    assert extractor.extract("test_login", classname="tests.auth") == "tests.auth::test_login"
+    assert extractor.extract("test_login") == "test_login"
+
+
+def test_extractor_memoizes_and_survives_pickling():
+    extractor = IdExtractor.from_schemes(["jira"])
+    assert extractor.extract("ABC-1 x") == "ABC-1"
+    assert extractor._memo == {"ABC-1 x": "ABC-1"}
+
+    clone = pickle.loads(pickle.dumps(extractor))
+    assert clone.signature == extractor.signature
+    assert clone.extract("ABC-1 x") == "ABC-1"
+
+
+def test_invalid_configuration_raises_validation_error():
+    with pytest.raises(ValidationError, match="unknown id scheme"):
+        IdExtractor.from_schemes(["nope"])
+    with pytest.raises(ValidationError, match="invalid id pattern"):
+        IdExtractor.from_schemes([], ["("])
+
+
+def test_junit_loader_uses_extractor_with_classname(tmp_path):
+    p = tmp_path / "junit.xml"
+    p.write_text(
+        '<testsuite><testcase classname="suite.Auth" name="test_login"/>'
+        '<testcase classname="suite.Pay" name="test_pay [C9]"/></testsuite>',
+        encoding="utf-8",
+    )
+
+    extractor = IdExtractor.from_schemes(["testrail", "classname"])
+    assert [r["id"] for r in load_junit_results(str(p), extractor)] == ["suite.Auth::test_login", "C9"]
+
+
+def test_run_pipeline_accepts_id_extractor():
+    test_cases = [{"id": "PAY-1", "title": "Pay"}]
+    results = [{"id": "checkout PAY-1", "status": "passed", "raw_name": "checkout PAY-1"}]
+
+    assert run_pipeline(test_cases, results)["metrics"]["mapped_results"] == 0
+    output = run_pipeline(test_cases, results, id_extractor=IdExtractor.from_schemes(["jira"]))
+    assert output["metrics"]["mapped_results"] == 1
+
+
+def test_cli_scheme_choices_match_builtin_schemes():
+    assert set(cli_contract._ID_SCHEMES) == set(BUILTIN_ID_SCHEMES)
+
+    plan = cli_contract.parse_run_plan(
+        ["run", "--tests", "a.csv", "--results", "b.xml", "--id-scheme", "jira", "--id-pattern", "X-(?P<id>\\d+)"]
+    )
+    assert plan.id_schemes == ("jira",)
+    assert plan.id_patterns == ("X-(?P<id>\\d+)",)
+    assert cli_contract.parse_run_plan(["run", "--tests", "a.csv", "--results", "b.xml"]).id_schemes == ("tc",)
+
+    with pytest.raises(ValidationError, match="id pattern"):
+        cli_contract.parse_run_plan(["run", "--tests", "a.csv", "--results", "b.xml", "--id-pattern", "("])
+
+
+def test_cli_id_patterns_are_validated_as_one_alternation(tmp_path, capsys):
+    (tmp_path / "tests.csv").write_text("id,title\nabc-12,Login\n", encoding="utf-8")
+    (tmp_path / "junit.xml").write_text('<testsuite><testcase name="login abc-12"/></testsuite>', encoding="utf-8")
+    argv = ["run", "--tests", str(tmp_path / "tests.csv"), "--results", str(tmp_path / "junit.xml"), "--outdir", str(tmp_path / "out"), "--no-cache"]
+
+    # An inline global flag applies to its own pattern only.
+    assert cli_contract.main(argv + ["--id-pattern", r"(?i)(?P<id>abc-\d+)", "--id-pattern", r"\bQA\d+\b", "--format", "json"]) == 0
+    assert "Score: 100 / 100" in capsys.readouterr().out
+    extractor = IdExtractor.from_schemes(["tc"], [r"(?i)abc-\d+"])
+    assert (extractor.extract("x Abc-1"), extractor.extract("tc-1"), extractor.extract("TC-1")) == ("Abc-1", "tc-1", "TC-1")
+
+    # Groups referenced by number would be shifted by the alternation.
+    assert cli_contract.main(argv + ["--id-pattern", r"(\d)\1-X"]) == 2
+    assert "group reference \\1 by number" in capsys.readouterr().err
+    with pytest.raises(ValidationError, match="by number"):
+        cli_contract.parse_run_plan(["run", "--tests", "a.csv", "--results", "b.xml", "--id-pattern", r"(a)(?(1)b|c)"])
+
+    # Patterns that only clash once combined are reported as validation errors.
+    assert cli_contract.main(argv + ["--id-pattern", "(?P<x>a)", "--id-pattern", "(?P<x>b)"]) == 2
+    assert "redefinition of group name" in capsys.readouterr().err
+
+
+def test_subcommands_share_the_id_options():
+    commands = {
+        cli_contract.parse_run_plan: ["run", "--tests", "a.csv", "--results", "b.xml"],
+        cli_contract.parse_batch_plan: ["batch", "--manifest", "m.json"],
+        cli_contract.parse_diff_plan: ["diff", "--baseline", "a.xml", "--candidate", "b.xml"],
+        cli_contract.parse_watch_plan: ["watch", "--tests", "a.csv", "--results", "shards/"],
+    }
+    for parse, argv in commands.items():
+        plan = parse(argv + ["--id-scheme", "jira", "--id-pattern", r"X-\d+"])
+        options = getattr(plan, "defaults", None) or getattr(plan, "run", plan)
+        assert (options.id_schemes, options.id_patterns) == (("jira",), (r"X-\d+",))
+        with pytest.raises(ValidationError, match="by number"):
+            parse(argv + ["--id-pattern", r"(a)\1"])
+
+
+def test_dict_and_file_paths_extract_the_same_ids_with_classname(tmp_path):
+    testcases = [("suite.Auth", "test_login", ""), ("suite.Pay", "test_pay [C9]", "<failure/>"), ("", "test_bare", "")]
+    junit = "".join(f'<testcase classname="{c}" name="{n}">{o}</testcase>' for c, n, o in testcases)
+    (tmp_path / "junit.xml").write_text(f"<testsuite>{junit}</testsuite>", encoding="utf-8")
+    (tmp_path / "tests.csv").write_text("id,title\nsuite.Auth::test_login,Login\nC9,Pay\n", encoding="utf-8")
+    extractor = IdExtractor.from_schemes(["testrail", "classname"])
+
+    from_file = run_pipeline_from_files(str(tmp_path / "tests.csv"), str(tmp_path / "junit.xml"), id_extractor=extractor)
+    dicts = [
+        {"id": n, "status": "failed" if o else "passed", "raw_name": n, "classname": c} for c, n, o in testcases
+    ]
+    from_dicts = Pipeline.from_csv(str(tmp_path / "tests.csv"), id_extractor=extractor).evaluate_dicts(dicts)
+
+    file_ids = [r["id"] for r in load_junit_results(str(tmp_path / "junit.xml"), extractor)]
+    assert file_ids == ["suite.Auth::test_login", "C9", "test_bare"]
+    assert [d["id"] for d in _reextract_ids(dicts, extractor)] == file_ids
+    assert from_dicts["metrics"] == from_file["metrics"]
+    assert from_file["metrics"]["mapped_results"] == 2
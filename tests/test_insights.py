@@ -120,3 +120,35 @@ def test_skip_rate_threshold_adds_warning():
     assert skip_insight.severity == "warning"
     assert "30.0" in skip_insight.details or "30" in skip_insight.details
 
+
+
+def test_slow_suite_and_slow_tests_add_warnings():
+    metrics = {
+        "total_cases": 10,
+        "total_results": 10,
+        "mapped_results": 10,
+        "unmapped_results": 0,
+        "passed": 10,
+        "failed": 0,
+        "skipped": 0,
+        "failure_rate": 0.0,
+        "skip_rate": 0.0,
+    }
+    durations = {
+        "timed_results": 10,
+        "total_sec": 4000.0,
+        "mean_sec": 400.0,
+        "p50_sec": 300.0,
+        "p95_sec": 900.0,
+        "p99_sec": 950.0,
+        "slowest": [{"id": "TC-9", "duration_sec": 960.0}],
+    }
+
+    codes = {i.code: i for i in generate_insights(metrics, 100, "Low", durations=durations)}
+    assert codes["SLOW_SUITE"].severity == "warning"
+    assert "TC-9" in codes["SLOW_TESTS_PRESENT"].details
+
+    fast = {**durations, "total_sec": 10.0, "p95_sec": 1.0}
+    fast_codes = {i.code for i in generate_insights(metrics, 100, "Low", durations=fast)}
+    assert not fast_codes & {"SLOW_SUITE", "SLOW_TESTS_PRESENT"}
+    assert [i.code for i in generate_insights(metrics, 100, "Low")] == ["SCORE_SUMMARY"]
@@ -1,7 +1,19 @@
+import bz2
+import gzip
+import lzma
+
 import pytest
 
 from core.errors import IngestionError
-from core.ingestion.junit_loader import load_junit_results
+from core.ingestion.junit_loader import (
+    iter_junit_result_models,
+    iter_junit_results,
+    load_junit_result_models,
+    load_junit_results,
+    load_junit_results_many,
+    resolve_junit_paths,
+)
+from core.normalization import iter_normalized_results
 
 
 def test_junit_parses_passed_failed_skipped(tmp_path):
@@ -72,3 +84,145 @@ def test_junit_raises_if_testcase_name_missing_or_empty(tmp_path):
 
 
 
+
+
+def test_junit_iter_streams_large_system_out_and_nested_suites(tmp_path):
+    p = tmp_path / "junit.xml"
+    big = "x" * 300_000
+    p.write_text(
+        f"""<?xml version="1.0" encoding="utf-8"?>
+<testsuites xmlns="urn:example">
+  <testsuite name="a">
+    <system-out>{big}</system-out>
+    <testcase name="TC-1 ok" time="0.1"><system-out>{big}</system-out></testcase>
+    <testcase name="TC-2 err"><error message="boom">{big}</error></testcase>
+  </testsuite>
+  <testsuite name="b">
+    <testcase name="TC-3 skip"><skipped/></testcase>
+  </testsuite>
+</testsuites>
+""",
+        encoding="utf-8",
+    )
+
+    stream = iter_junit_results(str(p))
+    first = next(stream)
+    assert first == {"id": "TC-1", "status": "passed", "duration_sec": 0.1, "raw_name": "TC-1 ok"}
+    rest = list(stream)
+    assert [r["status"] for r in rest] == ["failed", "skipped"]
+    assert load_junit_results(str(p)) == [first, *rest]
+
+
+def test_junit_invalid_xml_raises_ingestion_error(tmp_path):
+    p = tmp_path / "junit.xml"
+    p.write_text("<testsuite><testcase name='TC-1'>", encoding="utf-8")
+
+    with pytest.raises(IngestionError) as e:
+        load_junit_results(str(p))
+    assert "invalid XML" in str(e.value)
+
+
+def test_junit_missing_file_raises_ingestion_error(tmp_path):
+    with pytest.raises(IngestionError) as e:
+        list(iter_junit_results(str(tmp_path / "missing.xml")))
+    assert "file not found" in str(e.value)
+
+
+def _write_shard(path, names):
+    body = "".join(
+        f'<testcase name="{n}"><failure/></testcase>' if n.endswith("bad") else f'<testcase name="{n}"/>'
+        for n in names
+    )
+    path.write_text(f"<testsuite>{body}</testsuite>", encoding="utf-8")
+
+
+def test_resolve_junit_paths_directory_and_glob_are_sorted(tmp_path):
+    shards = tmp_path / "shards"
+    shards.mkdir()
+    for name in ["shard-2.xml", "shard-10.xml", "shard-1.xml"]:
+        _write_shard(shards / name, ["TC-1"])
+    (shards / "notes.txt").write_text("ignore", encoding="utf-8")
+
+    by_dir = resolve_junit_paths(str(shards))
+    by_glob = resolve_junit_paths(str(shards / "shard-*.xml"))
+    assert [p.name for p in by_dir] == ["shard-1.xml", "shard-10.xml", "shard-2.xml"]
+    assert by_glob == by_dir
+    assert resolve_junit_paths(str(shards / "shard-1.xml")) == [shards / "shard-1.xml"]
+
+
+def test_resolve_junit_paths_raises_when_nothing_matches(tmp_path):
+    with pytest.raises(IngestionError) as e:
+        resolve_junit_paths(str(tmp_path / "*.xml"))
+    assert "no result files matched" in str(e.value)
+
+
+def test_load_junit_results_many_parallel_matches_serial(tmp_path):
+    paths = []
+    for i in range(4):
+        p = tmp_path / f"shard-{i}.xml"
+        _write_shard(p, [f"TC-{i}{j} {'bad' if j % 3 == 0 else 'ok'}" for j in range(5)])
+        paths.append(p)
+
+    serial = [r for p in paths for r in load_junit_results(str(p))]
+    assert load_junit_results_many(paths, max_workers=1) == serial
+    assert load_junit_results_many(paths, max_workers=3) == serial
+
+
+def test_load_junit_results_many_propagates_shard_errors(tmp_path):
+    good = tmp_path / "a.xml"
+    _write_shard(good, ["TC-1"])
+    bad = tmp_path / "b.xml"
+    bad.write_text("<testsuite>", encoding="utf-8")
+
+    with pytest.raises(IngestionError) as e:
+        load_junit_results_many([good, bad], max_workers=2)
+    assert "b.xml" in str(e.value)
+
+
+def test_junit_reads_compressed_input_and_shard_directories(tmp_path):
+    xml = b'<testsuite><testcase name="TC-1"/><testcase name="TC-2"><skipped/></testcase></testsuite>'
+    (tmp_path / "a.xml.gz").write_bytes(gzip.compress(xml))
+    (tmp_path / "b.xml.bz2").write_bytes(bz2.compress(xml))
+    (tmp_path / "c.xml.xz").write_bytes(lzma.compress(xml))
+    (tmp_path / "d.xml").write_bytes(xml)
+
+    paths = resolve_junit_paths(str(tmp_path))
+    assert [p.name for p in paths] == ["a.xml.gz", "b.xml.bz2", "c.xml.xz", "d.xml"]
+    for p in paths:
+        rows = load_junit_results(str(p))
+        assert [(r["id"], r["status"]) for r in rows] == [("TC-1", "passed"), ("TC-2", "skipped")]
+
+
+def test_junit_raises_on_truncated_compressed_input(tmp_path):
+    p = tmp_path / "junit.xml.gz"
+    p.write_bytes(gzip.compress(b"<testsuite><testcase name='TC-1'/></testsuite>")[:-12])
+
+    with pytest.raises(IngestionError) as e:
+        load_junit_results(str(p))
+    assert "unable to read file" in str(e.value)
+
+
+def test_junit_fused_models_match_two_step_normalize(tmp_path):
+    p = tmp_path / "junit.xml"
+    p.write_text(
+        """<testsuite>
+  <testcase name=" TC-1 login " time="0.25"/>
+  <testcase name="checkout"><error/></testcase>
+  <testcase name="TC-3"><skipped/></testcase>
+</testsuite>
+""",
+        encoding="utf-8",
+    )
+
+    fused = load_junit_result_models(str(p))
+    assert fused == list(iter_normalized_results(load_junit_results(str(p))))
+    assert fused[0].raw_name == "TC-1 login"
+    assert next(iter_junit_result_models(str(p))).duration_sec == 0.25
+
+
+def test_junit_fused_models_raise_same_ingestion_errors(tmp_path):
+    p = tmp_path / "junit.xml"
+    p.write_text('<testsuite><testcase name="TC-1" time="soon"/></testsuite>', encoding="utf-8")
+
+    with pytest.raises(IngestionError, match="invalid testcase time value 'soon'"):
+        load_junit_result_models(str(p))
@@ -1,7 +1,7 @@
 import pytest
 
 from core.errors import ValidationError
-from core.normalization import normalize
+from core.normalization import iter_normalized_results, normalize, normalize_test_cases
 from core.normalization.models import NormalizedData, TestCaseModel, TestResultModel
 
 
@@ -91,3 +91,19 @@ def test_normalize_raises_on_empty_id():
         normalize(test_cases, results)
     assert "empty or whitespace-only" in str(e.value)
 
+
+
+def test_iter_normalized_results_is_lazy():
+    results = iter_normalized_results(
+        d for d in [{"id": "R1", "status": "passed"}, {"id": "R2", "status": "bogus"}]
+    )
+
+    first = next(results)
+    assert first == TestResultModel(id="R1", status="passed")
+    with pytest.raises(ValidationError, match="Invalid status"):
+        next(results)
+
+
+def test_normalize_test_cases_builds_catalog_from_iterable():
+    catalog = normalize_test_cases(iter([{"id": "TC-1", "title": "A", "component": " "}]))
+    assert catalog == {"TC-1": TestCaseModel(id="TC-1", title="A")}
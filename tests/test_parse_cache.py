@@ -0,0 +1,104 @@
+import os
+
+import pytest
+
+from core.errors import IngestionError, ValidationError
+from core.ingestion import cache as cache_module
+from core.ingestion.cache import ParseCache
+from core.ingestion.csv_loader import load_test_case_catalog_csv
+from core.ingestion.junit_loader import load_junit_result_batch
+from core.pipeline import run_pipeline_from_files
+
+
+def _write_inputs(tmp_path):
+    tests_csv = tmp_path / "cases.csv"
+    tests_csv.write_text("id,title,priority\nTC-1,Login,High\nTC-2,Logout,\n", encoding="utf-8")
+    junit = tmp_path / "junit.xml"
+    junit.write_text(
+        '<testsuite><testcase name="TC-1" time="0.5"/><testcase name="TC-2"><failure/></testcase></testsuite>',
+        encoding="utf-8",
+    )
+    return tests_csv, junit
+
+
+def test_cache_hit_skips_parsing(tmp_path, monkeypatch):
+    tests_csv, junit = _write_inputs(tmp_path)
+    cache = ParseCache(tmp_path / "cache")
+
+    assert cache.load_test_case_catalog(str(tests_csv)) == load_test_case_catalog_csv(str(tests_csv))
+    first = list(cache.load_junit_result_batch(str(junit)).iter_results())
+    assert first == list(load_junit_result_batch(str(junit)).iter_results())
+
+    def fail(path):
+        raise AssertionError("parsed despite cache hit")
+
+    monkeypatch.setattr(cache_module, "load_test_case_catalog_csv", fail)
+    monkeypatch.setattr(cache_module, "load_junit_result_batch", fail)
+    assert cache.load_test_case_catalog(str(tests_csv))["TC-1"].priority == "High"
+    assert list(cache.load_junit_result_batch(str(junit)).iter_results()) == first
+
+
+def test_cache_misses_when_content_changes(tmp_path):
+    tests_csv, _ = _write_inputs(tmp_path)
+    cache = ParseCache(tmp_path / "cache")
+    cache.load_test_case_catalog(str(tests_csv))
+
+    tests_csv.write_text("id,title\nTC-9,New\n", encoding="utf-8")
+    assert list(cache.load_test_case_catalog(str(tests_csv))) == ["TC-9"]
+
+
+def test_cache_propagates_loader_errors(tmp_path):
+    cache = ParseCache(tmp_path / "cache")
+    with pytest.raises(IngestionError, match="file not found"):
+        cache.load_junit_result_batch(str(tmp_path / "missing.xml"))
+
+    dup = tmp_path / "dup.csv"
+    dup.write_text("id,title\nTC-1,A\nTC-1,B\n", encoding="utf-8")
+    with pytest.raises(ValidationError, match="Duplicate test case id"):
+        cache.load_test_case_catalog(str(dup))
+    assert list((tmp_path / "cache").glob("*.bin")) == []
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache_dir = tmp_path / "cache"
+    files = []
+    for i in range(3):
+        p = tmp_path / f"shard-{i}.xml"
+        p.write_text(f'<testsuite><testcase name="TC-{i}"/></testsuite>', encoding="utf-8")
+        files.append(p)
+
+    cache = ParseCache(cache_dir)
+    for p in files:
+        cache.load_junit_result_batch(str(p))
+    entries = sorted(cache_dir.glob("*.bin"), key=lambda e: e.stat().st_mtime_ns)
+    assert len(entries) == 3
+    for age, entry in enumerate(entries):
+        os.utime(entry, ns=(age * 10**9, age * 10**9))
+
+    entry_size = entries[0].stat().st_size
+    small = ParseCache(cache_dir, max_bytes=entry_size * 2)
+    small._evict()
+    assert sorted(cache_dir.glob("*.bin")) == sorted(entries[1:])
+
+
+def test_pipeline_with_cache_matches_uncached(tmp_path):
+    tests_csv, junit = _write_inputs(tmp_path)
+    cache = ParseCache(tmp_path / "cache")
+
+    expected = run_pipeline_from_files(str(tests_csv), str(junit))
+    assert run_pipeline_from_files(str(tests_csv), str(junit), cache=cache) == expected
+    assert run_pipeline_from_files(str(tests_csv), str(junit), cache=cache) == expected
+    assert len(list((tmp_path / "cache").glob("*.bin"))) == 2
+
+
+def test_cache_key_includes_id_extractor(tmp_path):
+    from core.ingestion.id_extraction import IdExtractor
+
+    junit = tmp_path / "junit.xml"
+    junit.write_text('<testsuite><testcase name="PAY-1 TC-2"/></testsuite>', encoding="utf-8")
+    cache = ParseCache(tmp_path / "cache")
+
+    assert cache.load_junit_result_batch(str(junit)).ids == ["TC-2"]
+    jira = IdExtractor.from_schemes(["jira"])
+    assert cache.load_junit_result_batch(str(junit), jira).ids == ["PAY-1"]
+    assert cache.load_junit_result_batch_many([junit], id_extractor=jira).ids == ["PAY-1"]
@@ -152,3 +152,175 @@ def test_pipeline_end_to_end_with_skipped():
     assert output["metrics"]["skip_rate"] > 0
     assert output["score"] < 100  # Should be penalized for skips
 
+
+
+def test_pipeline_accepts_generators_from_loaders(tmp_path):
+    from core.ingestion import iter_junit_results, iter_test_cases_csv
+
+    tests_csv = tmp_path / "cases.csv"
+    tests_csv.write_text("id,name\nTC-1,A\nTC-2,B\n", encoding="utf-8")
+    junit = tmp_path / "junit.xml"
+    junit.write_text(
+        '<testsuite><testcase name="TC-1"/><testcase name="TC-2"><failure/></testcase>'
+        '<testcase name="extra"/></testsuite>',
+        encoding="utf-8",
+    )
+
+    streamed = run_pipeline(iter_test_cases_csv(str(tests_csv)), iter_junit_results(str(junit)))
+    eager = run_pipeline(
+        [{"id": "TC-1", "title": "A"}, {"id": "TC-2", "title": "B"}],
+        [
+            {"id": "TC-1", "status": "passed", "raw_name": "TC-1"},
+            {"id": "TC-2", "status": "failed", "raw_name": "TC-2"},
+            {"id": "extra", "status": "passed", "raw_name": "extra"},
+        ],
+    )
+
+    assert streamed == eager
+    assert streamed["counts"]["results_count"] == 3
+
+
+def test_pipeline_from_files_matches_run_pipeline(tmp_path):
+    from core.ingestion import load_junit_results, load_test_cases_csv
+    from core.pipeline import run_pipeline_from_files
+
+    tests_csv = tmp_path / "cases.csv"
+    tests_csv.write_text("id,name,component\nTC-1,A,auth\nTC-2,B,\n", encoding="utf-8")
+    shards = tmp_path / "shards"
+    shards.mkdir()
+    (shards / "a.xml").write_text('<testsuite><testcase name="TC-1"/></testsuite>', encoding="utf-8")
+    (shards / "b.xml").write_text(
+        '<testsuite><testcase name="TC-2"><skipped/></testcase><testcase name="x"/></testsuite>',
+        encoding="utf-8",
+    )
+
+    expected = run_pipeline(
+        load_test_cases_csv(str(tests_csv)),
+        load_junit_results(str(shards / "a.xml")) + load_junit_results(str(shards / "b.xml")),
+    )
+    assert run_pipeline_from_files(str(tests_csv), str(shards)) == expected
+    assert run_pipeline_from_files(str(tests_csv), str(shards), max_workers=2) == expected
+
+
+def test_pipeline_ignores_non_finite_durations(tmp_path):
+    from core.control.cli_contract import main
+    from core.ingestion import load_junit_results, load_test_cases_csv
+    from core.ingestion.cache import ParseCache
+    from core.pipeline import run_pipeline_from_files
+
+    tests_csv = tmp_path / "cases.csv"
+    tests_csv.write_text("id,name\nTC-1,A\nTC-2,B\nTC-3,C\n", encoding="utf-8")
+    results_xml = tmp_path / "results.xml"
+    results_xml.write_text(
+        '<testsuite><testcase name="TC-1" time="inf"/><testcase name="TC-2" time="NaN"/>'
+        '<testcase name="TC-3" time="1.5"/></testsuite>',
+        encoding="utf-8",
+    )
+
+    output = run_pipeline(load_test_cases_csv(str(tests_csv)), load_junit_results(str(results_xml)))
+    assert output["score"] == 100
+    assert output["durations"]["timed_results"] == 1
+    assert output["durations"]["total_sec"] == 1.5
+    assert output["durations"]["slowest"] == [{"id": "TC-3", "duration_sec": 1.5}]
+    # Streamed models and the columnar (cached) path agree.
+    assert run_pipeline_from_files(str(tests_csv), str(results_xml)) == output
+    cache = ParseCache(tmp_path / "cache")
+    assert run_pipeline_from_files(str(tests_csv), str(results_xml), cache=cache)["durations"] == output["durations"]
+
+    argv = ["run", "--tests", str(tests_csv), "--results", str(results_xml), "--outdir", str(tmp_path / "out")]
+    assert main([*argv, "--no-cache"]) == 0
+
+
+def test_pipeline_async_matches_from_files(tmp_path):
+    import asyncio
+
+    from core.errors import IngestionError
+    from core.ingestion.cache import ParseCache
+    from core.pipeline import run_pipeline_async, run_pipeline_from_files
+
+    tests_csv = tmp_path / "cases.csv"
+    tests_csv.write_text("id,name\nTC-1,A\nTC-2,B\n", encoding="utf-8")
+    junit = tmp_path / "junit.xml"
+    junit.write_text(
+        '<testsuite><testcase name="TC-1"/><testcase name="TC-2"><failure/></testcase></testsuite>',
+        encoding="utf-8",
+    )
+
+    expected = run_pipeline_from_files(str(tests_csv), str(junit))
+    assert asyncio.run(run_pipeline_async(str(tests_csv), str(junit))) == expected
+    cache = ParseCache(tmp_path / "cache")
+    assert asyncio.run(run_pipeline_async(str(tests_csv), str(junit), cache=cache)) == expected
+
+    with pytest.raises(IngestionError, match="file not found"):
+        asyncio.run(run_pipeline_async(str(tests_csv), str(tmp_path / "missing.xml")))
+
+
+def test_pipeline_includes_breakdowns():
+    test_cases = [
+        {"id": "TC-1", "title": "A", "component": "auth", "priority": "P1"},
+        {"id": "TC-2", "title": "B", "component": "billing"},
+    ]
+    results = [
+        {"id": "TC-1", "status": "failed"},
+        {"id": "TC-2", "status": "passed"},
+        {"id": "TC-2", "status": "passed"},
+    ]
+
+    output = run_pipeline(test_cases, results)
+
+    components = {r["group"]: r for r in output["breakdowns"]["component"]}
+    assert components["auth"]["failed"] == 1
+    assert components["billing"]["passed"] == 2
+    assert [r["group"] for r in output["breakdowns"]["priority"]] == ["P1", "(unspecified)"]
+    assert "## Breakdown by Component" in output["markdown_report"]
+
+
+def test_pipeline_includes_durations():
+    test_cases = [{"id": "TC-1", "title": "A"}, {"id": "TC-2", "title": "B"}]
+    results = [
+        {"id": "TC-1", "status": "passed", "duration_sec": 1.0},
+        {"id": "TC-2", "status": "passed", "duration_sec": 4.0},
+        {"id": "TC-2", "status": "passed"},
+    ]
+
+    output = run_pipeline(test_cases, results)
+
+    durations = output["durations"]
+    assert durations["timed_results"] == 2
+    assert durations["total_sec"] == 5.0
+    assert durations["slowest"][0] == {"id": "TC-2", "duration_sec": 4.0}
+    assert "## Test Durations" in output["markdown_report"]
+
+
+def test_pipeline_object_matches_run_pipeline_across_evaluations(tmp_path):
+    from core.normalization.models import TestResultModel
+    from core.pipeline import Pipeline
+    from core.pipeline import run_pipeline_from_files
+    from pack.config import ScoringConfig
+
+    cases = [
+        {"id": "TC-1", "title": "One", "component": "auth", "priority": "P1"},
+        {"id": "TC-2", "title": "Two", "component": "auth"},
+        {"id": "TC-3", "title": "Three", "component": "pay", "priority": "P1"},
+    ]
+    result_sets = [
+        [{"id": "TC-1", "status": "passed"}, {"id": "TC-2", "status": "failed", "duration_sec": 2.0}],
+        [{"id": "TC-3", "status": "skipped"}, {"id": "TC-9", "status": "failed"}],
+        [],
+    ]
+
+    pipeline = Pipeline(cases)
+    for results in result_sets:
+        assert pipeline.evaluate_dicts(results) == run_pipeline(cases, results)
+    models = [TestResultModel(id="TC-1", status="failed")]
+    assert pipeline.evaluate(models) == run_pipeline(cases, [{"id": "TC-1", "status": "failed"}])
+
+    strict = Pipeline(pipeline.test_cases, config=ScoringConfig(failed_penalty_per_test=40))
+    assert strict.evaluate(models)["score"] == 60
+
+    tests_csv = tmp_path / "cases.csv"
+    tests_csv.write_text("id,name,component\nTC-1,A,auth\nTC-2,B,\n", encoding="utf-8")
+    results_xml = tmp_path / "results.xml"
+    results_xml.write_text('<testsuite><testcase name="TC-1"><failure/></testcase></testsuite>', encoding="utf-8")
+    from_csv = Pipeline.from_csv(str(tests_csv))
+    assert from_csv.evaluate_file(str(results_xml)) == run_pipeline_from_files(str(tests_csv), str(results_xml))
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+from core.errors import ValidationError
+from core.pipeline import run_pipeline
+from core.reporting import renderers
+from core.reporting import (
+    REPORT_FORMATS,
+    build_markdown_report,
+    build_report_model,
+    get_report_format,
+    register_report_format,
+    render_html,
+    render_json,
+    render_junit_summary,
+    render_markdown,
+    save_reports,
+)
+from pack.insights import generate_insights
+
+METRICS = {
+    "total_cases": 3,
+    "total_results": 3,
+    "mapped_results": 3,
+    "unmapped_results": 0,
+    "passed": 1,
+    "failed": 2,
+    "skipped": 0,
+    "failure_rate": 2 / 3,
+    "skip_rate": 0.0,
+}
+
+
+def _model(score: int = 80, risk: str = "Medium"):
+    row = {"group": "<ui>", "total_cases": 3, "mapped_results": 3, "passed": 1, "failed": 2, "skipped": 0}
+    breakdowns = {"component": [{**row, "failure_rate": 2 / 3, "skip_rate": 0.0}]}
+    return build_report_model(
+        METRICS, score, risk, insights=generate_insights(METRICS, score, risk), breakdowns=breakdowns
+    )
+
+
+def test_markdown_renderer_matches_build_markdown_report():
+    model = _model()
+    expected = build_markdown_report(
+        METRICS, 80, "Medium", insights=list(model.insights), breakdowns=model.breakdowns
+    )
+    assert render_markdown(model) == expected
+
+
+def test_json_renderer_serializes_model():
+    data = json.loads(render_json(_model()))
+
+    assert data["score"] == 80
+    assert data["risk"] == "Medium"
+    assert data["metrics"] == METRICS
+    assert data["insights"][0]["code"] == "FAILED_TESTS_PRESENT"
+    assert data["high_risk_indicators"][0].startswith("2 test(s) failed")
+    assert data["diff"] is None
+
+
+def test_html_renderer_is_self_contained_and_escaped():
+    page = render_html(_model())
+
+    assert page.startswith("<!DOCTYPE html>")
+    assert "<style>" in page and "<link" not in page and "<script" not in page
+    assert "<td>&lt;ui&gt;</td>" in page
+    assert '<span class="risk-medium">Medium</span>' in page
+
+
+def test_html_diff_section_caps_ids_like_markdown():
+    diff = {
+        "baseline_tests": 30,
+        "candidate_tests": 30,
+        "new_failures": [f"TC-{i:02d}" for i in range(25)],
+        "fixed": ["TC-99"],
+        "newly_skipped": [],
+        "disappeared": [],
+        "added": [],
+    }
+    model = build_report_model(METRICS, 80, "Medium", diff=diff)
+    page = render_html(model)
+
+    assert "<tr><th>New failures</th><td>25</td><td>TC-00, " in page
+    assert "TC-19 and 5 more</td></tr>" in page and "TC-20" not in page
+    assert "<tr><th>Fixed</th><td>1</td><td>TC-99</td></tr>" in page
+    assert "<tr><th>Newly skipped</th><td>0</td><td></td></tr>" in page
+    assert "TC-19 and 5 more" in render_markdown(model)
+
+
+def test_junit_summary_fails_on_high_risk_and_critical_insights():
+    suite = ET.fromstring(render_junit_summary(_model(40, "High"))).find("testsuite")
+
+    failed = [case.get("name") for case in suite.iter("testcase") if case.find("failure") is not None]
+    assert failed[:2] == ["release_readiness", "FAILED_TESTS_PRESENT"]
+    assert suite.get("failures") == str(len(failed))
+    assert {p.get("name"): p.get("value") for p in suite.iter("property")}["risk"] == "High"
+
+    passing = ET.fromstring(render_junit_summary(_model(95, "Low"))).find("testsuite")
+    assert passing.find("testcase").find("failure") is None
+
+
+def test_save_reports_writes_each_format_from_one_model(tmp_path):
+    output = run_pipeline(
+        [{"id": "TC-1", "title": "One"}], [{"id": "TC-1", "status": "failed"}, {"id": "TC-2", "status": "passed"}]
+    )
+
+    paths = save_reports(output["report"], formats=["md", "json", "html", "junit"], output_dir=str(tmp_path))
+
+    assert list(paths) == ["md", "json", "html", "junit"]
+    assert {Path(p).stem for p in paths.values()} == {Path(paths["md"]).stem}
+    assert Path(paths["md"]).read_text(encoding="utf-8") == output["markdown_report"]
+    assert json.loads(Path(paths["json"]).read_text(encoding="utf-8"))["score"] == output["score"]
+    assert Path(paths["junit"]).suffix == ".xml"
+
+    with pytest.raises(ValidationError, match="unknown report format 'pdf'"):
+        save_reports(output["report"], formats=["md", "pdf"], output_dir=str(tmp_path / "none"))
+    assert not (tmp_path / "none").exists()
+
+
+def test_register_report_format(monkeypatch):
+    monkeypatch.setattr(renderers, "REPORT_FORMATS", dict(REPORT_FORMATS))
+
+    register_report_format("txt", ".txt", lambda model: f"{model.score}")
+
+    assert get_report_format("txt").render(_model()) == "80"
+    with pytest.raises(ValidationError, match="already registered"):
+        register_report_format("md", ".md", render_markdown)
@@ -1,6 +1,7 @@
 import pytest
 
-from core.reporting import build_markdown_report
+from core.normalization.models import ResultBatch, TestCaseModel, TestResultModel
+from core.reporting import build_markdown_report, iter_failed_tests
 
 
 def test_report_contains_sections():
@@ -382,3 +383,135 @@ def test_insights_formatting():
     assert "**CRITICAL** Critical Title:" in report
     assert "**WARNING** Warning Title:" in report
     assert "**INFO** Info Title:" in report
+
+
+def test_breakdown_tables_rendered_per_dimension():
+    """Verify one table per breakdown dimension, with escaped group names."""
+    metrics = {
+        "total_cases": 3,
+        "total_results": 4,
+        "mapped_results": 4,
+        "unmapped_results": 0,
+        "passed": 3,
+        "failed": 1,
+        "skipped": 0,
+        "failure_rate": 0.25,
+        "skip_rate": 0.0,
+    }
+    row = {"total_cases": 2, "mapped_results": 4, "passed": 3, "failed": 1, "skipped": 0, "failure_rate": 0.25, "skip_rate": 0.0}
+    breakdowns = {
+        "component": [{"group": "a|b", **row}],
+        "priority": [],
+    }
+
+    report = build_markdown_report(metrics, 90, "Low", breakdowns=breakdowns)
+
+    assert "## Breakdown by Component" in report
+    assert "| a\\|b | 2 | 4 | 3 | 1 | 0 | 25.0% | 0.0% |" in report
+    assert "## Breakdown by Priority" not in report
+    assert report.index("## Breakdown by Component") < report.index("## High-Risk Indicators")
+    assert build_markdown_report(metrics, 90, "Low", breakdowns=None) == build_markdown_report(metrics, 90, "Low")
+
+
+def test_duration_section_lists_percentiles_and_slowest():
+    """Verify the durations section renders when results were timed."""
+    metrics = {
+        "total_cases": 2,
+        "total_results": 2,
+        "mapped_results": 2,
+        "unmapped_results": 0,
+        "passed": 2,
+        "failed": 0,
+        "skipped": 0,
+        "failure_rate": 0.0,
+        "skip_rate": 0.0,
+    }
+    durations = {
+        "timed_results": 2,
+        "total_sec": 4.5,
+        "mean_sec": 2.25,
+        "p50_sec": 1.5,
+        "p95_sec": 3.0,
+        "p99_sec": 3.0,
+        "slowest": [{"id": "TC-2", "duration_sec": 3.0}, {"id": "TC-1", "duration_sec": 1.5}],
+    }
+
+    report = build_markdown_report(metrics, 100, "Low", durations=durations)
+
+    assert "## Test Durations" in report
+    assert "- p50 / p95 / p99: 1.50s / 3.00s / 3.00s" in report
+    assert "1. TC-2 (3.00s)" in report
+    untimed = {**durations, "timed_results": 0}
+    assert "## Test Durations" not in build_markdown_report(metrics, 100, "Low", durations=untimed)
+
+
+def test_diff_section_lists_changed_tests():
+    """Verify the changes-since-baseline section renders counts and truncated id lists."""
+    metrics = {
+        "total_cases": 1,
+        "total_results": 1,
+        "mapped_results": 1,
+        "unmapped_results": 0,
+        "passed": 1,
+        "failed": 0,
+        "skipped": 0,
+        "failure_rate": 0.0,
+        "skip_rate": 0.0,
+    }
+    diff = {
+        "baseline_tests": 30,
+        "candidate_tests": 25,
+        "new_failures": [f"TC-{i:02d}" for i in range(25)],
+        "fixed": [],
+        "newly_skipped": [],
+        "disappeared": ["TC-99"],
+        "added": [],
+    }
+
+    report = build_markdown_report(metrics, 100, "Low", diff=diff)
+
+    assert "## Changes Since Baseline" in report
+    assert "- New failures: 25" in report
+    assert "- Fixed: 0" in report
+    assert "TC-19 and 5 more" in report
+    assert "TC-20" not in report
+    assert "**Disappeared:** TC-99" in report
+    assert "**Fixed:**" not in report
+    assert "## Changes Since Baseline" not in build_markdown_report(metrics, 100, "Low")
+
+
+def test_failed_tests_table_streams_rows_from_results():
+    """Verify the failure table lists failed results with catalog details, for models and batches."""
+    metrics = {
+        "total_cases": 2,
+        "total_results": 3,
+        "mapped_results": 2,
+        "unmapped_results": 1,
+        "passed": 1,
+        "failed": 1,
+        "skipped": 0,
+        "failure_rate": 0.5,
+        "skip_rate": 0.0,
+    }
+    test_cases = {
+        "TC-1": TestCaseModel(id="TC-1", title="Login | SSO", component="auth"),
+        "TC-2": TestCaseModel(id="TC-2", title="Logout"),
+    }
+    results = [
+        TestResultModel(id="TC-1", status="failed", duration_sec=1.25),
+        TestResultModel(id="TC-2", status="passed"),
+        TestResultModel(id="TC-9", status="failed"),
+    ]
+
+    rows = list(iter_failed_tests(test_cases, results))
+    assert rows == list(iter_failed_tests(test_cases, ResultBatch.from_results(results)))
+    report = build_markdown_report(metrics, 80, "Medium", failed_tests=iter(rows))
+
+    assert report.endswith(
+        "## Failed Tests\n\n"
+        "| Test | Title | Component | Duration |\n"
+        "|---|---|---|---|\n"
+        "| TC-1 | Login \\| SSO | auth | 1.25s |\n"
+        "| TC-9 | - | - | - |"
+    )
+    assert "## Failed Tests" not in build_markdown_report(metrics, 80, "Medium")
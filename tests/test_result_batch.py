@@ -0,0 +1,77 @@
+import math
+import pickle
+from array import array
+
+import pytest
+
+from core.ingestion.junit_loader import load_junit_result_batch, load_junit_result_batch_many, load_junit_results
+from core.normalization import iter_normalized_results
+from core.normalization.models import NormalizedData, ResultBatch, TestCaseModel, TestResultModel
+from core.scoring import compute_metrics
+
+
+def test_result_batch_columns_and_round_trip():
+    results = [
+        TestResultModel(id="TC-1", status="passed", duration_sec=0.5),
+        TestResultModel(id="TC-2", status="failed"),
+        TestResultModel(id="TC-1", status="skipped", duration_sec=0.0),
+    ]
+
+    batch = ResultBatch.from_results(results)
+    assert len(batch) == 3
+    assert batch.status_codes == array("b", [0, 1, 2])
+    assert math.isnan(batch.durations[1])
+    assert batch.ids[0] is batch.ids[2]
+    assert list(batch.iter_results()) == results
+
+
+def test_result_batch_rejects_unknown_status():
+    with pytest.raises(KeyError):
+        ResultBatch().append("TC-1", "flaky")
+
+
+def test_result_batch_pickles_and_extends():
+    batch = ResultBatch.from_results([TestResultModel(id="TC-1", status="failed", duration_sec=1.5)])
+    copy = pickle.loads(pickle.dumps(batch))
+    copy.extend(batch)
+    assert [r.status for r in copy.iter_results()] == ["failed", "failed"]
+
+
+def test_compute_metrics_from_batch_matches_list_path():
+    test_cases = {
+        "TC-1": TestCaseModel(id="TC-1", title="A"),
+        "TC-2": TestCaseModel(id="TC-2", title="B"),
+    }
+    results = [
+        TestResultModel(id="TC-1", status="passed"),
+        TestResultModel(id="TC-2", status="failed"),
+        TestResultModel(id="TC-2", status="skipped"),
+        TestResultModel(id="NOPE", status="failed"),
+    ]
+
+    expected = compute_metrics(NormalizedData(test_cases=test_cases, results=results))
+    batch = ResultBatch.from_results(results)
+    assert compute_metrics(NormalizedData(test_cases=test_cases, results=batch)) == expected
+
+
+def test_load_junit_result_batch_matches_dict_loader(tmp_path):
+    shards = []
+    for i in range(2):
+        p = tmp_path / f"shard-{i}.xml"
+        p.write_text(
+            f'<testsuite><testcase name="TC-{i}" time="0.{i}"/>'
+            f'<testcase name="case {i}"><failure/></testcase></testsuite>',
+            encoding="utf-8",
+        )
+        shards.append(p)
+
+    batch = load_junit_result_batch(str(shards[0]))
+    expected = [
+        TestResultModel(id=r.id, status=r.status, duration_sec=r.duration_sec)
+        for r in iter_normalized_results(load_junit_results(str(shards[0])))
+    ]
+    assert list(batch.iter_results()) == expected
+
+    merged = load_junit_result_batch_many(shards, max_workers=2)
+    assert merged.ids == ["TC-0", "case 0", "TC-1", "case 1"]
+    assert list(merged.status_codes) == [0, 1, 0, 1]
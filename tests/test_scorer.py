@@ -1,7 +1,14 @@
 import pytest
 
-from core.normalization.models import NormalizedData, TestCaseModel, TestResultModel
-from core.scoring import classify_risk, compute_metrics, compute_release_readiness_score
+from core.errors import ValidationError
+from core.normalization.models import NormalizedData, ResultBatch, TestCaseModel, TestResultModel
+from core.scoring import (
+    MetricsAccumulator,
+    classify_risk,
+    compute_metrics,
+    compute_metrics_from_results,
+    compute_release_readiness_score,
+)
 
 
 def test_metrics_counts_only_mapped():
@@ -165,3 +172,77 @@ def test_score_integration():
     assert 0 <= score <= 100
     assert risk in ("Low", "Medium", "High")
 
+
+
+def test_compute_metrics_from_results_accepts_generator():
+    test_cases = {
+        "TC-1": TestCaseModel(id="TC-1", title="Test 1"),
+        "TC-2": TestCaseModel(id="TC-2", title="Test 2"),
+    }
+    results = [
+        TestResultModel(id="TC-1", status="passed"),
+        TestResultModel(id="TC-2", status="skipped"),
+        TestResultModel(id="TC-2", status="failed"),
+        TestResultModel(id="OTHER", status="failed"),
+    ]
+
+    streamed = compute_metrics_from_results(test_cases, (r for r in results))
+    assert streamed == compute_metrics(NormalizedData(test_cases=test_cases, results=results))
+    assert streamed["total_results"] == 4
+    assert streamed["unmapped_results"] == 1
+
+
+def _accumulator_fixture():
+    test_cases = {
+        "TC-1": TestCaseModel(id="TC-1", title="Test 1"),
+        "TC-2": TestCaseModel(id="TC-2", title="Test 2"),
+        "TC-3": TestCaseModel(id="TC-3", title="Test 3"),
+    }
+    results = [
+        TestResultModel(id="TC-1", status="passed"),
+        TestResultModel(id="TC-2", status="failed"),
+        TestResultModel(id="UNKNOWN", status="failed"),
+        TestResultModel(id="TC-3", status="skipped"),
+        TestResultModel(id="TC-1", status="failed"),
+    ]
+    return test_cases, results
+
+
+def test_accumulator_merge_of_shards_matches_compute_metrics():
+    test_cases, results = _accumulator_fixture()
+    expected = compute_metrics(NormalizedData(test_cases=test_cases, results=results))
+
+    left = MetricsAccumulator(test_cases)
+    for r in results[:2]:
+        left.add(r)
+    right = MetricsAccumulator(test_cases).add_batch(ResultBatch.from_results(results[2:]))
+
+    assert left.merge(right).metrics() == expected
+
+
+def test_accumulator_round_trips_through_dict_and_merges():
+    test_cases, results = _accumulator_fixture()
+    expected = compute_metrics(NormalizedData(test_cases=test_cases, results=results))
+
+    shards = [MetricsAccumulator(set(test_cases)).add_all(results[i:i + 2]) for i in range(0, len(results), 2)]
+    # Partial aggregates travel as JSON-compatible dicts and are reduced centrally.
+    restored = [MetricsAccumulator.from_dict(s.to_dict()) for s in shards]
+    total = restored[0]
+    for acc in restored[1:]:
+        total.merge(acc)
+
+    assert total.metrics() == expected
+    with pytest.raises(ValidationError, match="no catalog"):
+        total.add(results[0])
+
+
+def test_accumulator_rejects_mismatched_catalogs_and_bad_state():
+    test_cases, _ = _accumulator_fixture()
+    acc = MetricsAccumulator(test_cases)
+
+    with pytest.raises(ValidationError, match="different catalogs"):
+        acc.merge(MetricsAccumulator({"TC-1"}))
+    with pytest.raises(ValidationError, match="'passed' must be a non-negative integer"):
+        MetricsAccumulator.from_dict({**acc.to_dict(), "passed": -1})
+    with pytest.raises(ValidationError, match="inconsistent"):
+        MetricsAccumulator.from_dict({**acc.to_dict(), "failed": 1})
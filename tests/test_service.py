@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import gzip
+import http.client
+import json
+import socket
+import threading
+import time
+
+import pytest
+
+from api import main as api_main, parse_catalogs
+from core.control.service import ReviewRequestHandler, ReviewService, make_server
+from core.errors import ValidationError
+from core.pipeline import Pipeline, run_pipeline
+from core.reporting.model import report_model_to_dict
+
+_CASES = [
+    {"id": "TC-1", "title": "Login", "component": "auth"},
+    {"id": "TC-2", "title": "Logout", "component": "auth"},
+    {"id": "TC-3", "title": "Pay", "component": "billing"},
+]
+_XML = (
+    b"<testsuites><testsuite>"
+    b'<testcase name="TC-1" time="0.5"/>'
+    b'<testcase name="TC-2"><failure/></testcase>'
+    b'<testcase name="TC-3"><skipped/></testcase>'
+    b'<testcase name="TC-9"/>'
+    b"</testsuite></testsuites>"
+)
+_RESULTS = [
+    {"id": "TC-1", "status": "passed", "duration_sec": 0.5, "raw_name": "TC-1"},
+    {"id": "TC-2", "status": "failed", "duration_sec": None, "raw_name": "TC-2"},
+    {"id": "TC-3", "status": "skipped", "duration_sec": None, "raw_name": "TC-3"},
+    {"id": "TC-9", "status": "passed", "duration_sec": None, "raw_name": "TC-9"},
+]
+
+
+@pytest.fixture
+def serve():
+    servers = []
+
+    def start(max_workers: int = 2, max_queue: int = 2, max_body_bytes: int = 1 << 20):
+        service = ReviewService(
+            {"web": Pipeline(_CASES)}, max_workers=max_workers, max_queue=max_queue, max_body_bytes=max_body_bytes
+        )
+        server = make_server(service, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _request(server, method: str, path: str, body: bytes | None = None, headers: dict | None = None):
+    conn = http.client.HTTPConnection(*server.server_address[:2], timeout=10)
+    try:
+        conn.request(method, path, body=body, headers=headers or {})
+        response = conn.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        conn.close()
+
+
+def test_review_matches_run_pipeline_in_every_format(serve):
+    server = serve()
+    expected = run_pipeline(_CASES, _RESULTS)
+
+    status, headers, body = _request(server, "POST", "/review/web", _XML)
+    assert status == 200
+    assert headers["Content-Type"] == "application/json"
+    assert json.loads(body) == json.loads(json.dumps(report_model_to_dict(expected["report"])))
+
+    status, headers, body = _request(server, "POST", "/review/web?format=md", _XML)
+    assert status == 200
+    assert headers["Content-Type"].startswith("text/markdown")
+    assert body.decode("utf-8") == expected["markdown_report"]
+
+    status, headers, body = _request(server, "POST", "/review/web?format=junit", gzip.compress(_XML), {"Content-Encoding": "gzip"})
+    assert status == 200
+    assert b"<testsuites" in body
+
+    status, _, body = _request(server, "GET", "/health")
+    assert status == 200
+    assert json.loads(body) == {"status": "ok", "catalogs": ["web"], "in_flight": 0, "max_workers": 2, "max_queue": 2}
+
+
+def test_chunked_body_is_parsed_as_it_arrives(serve):
+    server = serve()
+    conn = http.client.HTTPConnection(*server.server_address[:2], timeout=10)
+    chunks = [_XML[i : i + 7] for i in range(0, len(_XML), 7)]
+    conn.request("POST", "/review/web", body=iter(chunks), encode_chunked=True)
+    response = conn.getresponse()
+    assert response.status == 200
+    assert json.loads(response.read())["metrics"]["failed"] == 1
+
+    # The connection stays usable for the next review.
+    conn.request("POST", "/review/web", body=_XML)
+    response = conn.getresponse()
+    assert response.status == 200
+    response.read()
+    conn.close()
+
+
+def test_errors_are_reported_as_json(serve):
+    server = serve()
+
+    status, _, body = _request(server, "POST", "/review/mobile", _XML)
+    assert status == 404
+    assert "unknown catalog 'mobile'" in json.loads(body)["error"]
+
+    status, _, body = _request(server, "POST", "/review/web", b"<testsuite><testcase name='TC-1'>")
+    assert status == 400
+    assert "invalid XML" in json.loads(body)["error"]
+
+    status, _, body = _request(server, "POST", "/review/web?format=pdf", _XML)
+    assert status == 400
+    assert "unknown report format 'pdf'" in json.loads(body)["error"]
+
+    status, _, _ = _request(server, "POST", "/review/web", _XML, {"Content-Encoding": "br"})
+    assert status == 415
+
+    status, _, _ = _request(server, "GET", "/review/web")
+    assert status == 404
+
+    # The server is still healthy and nothing is left admitted.
+    status, _, body = _request(server, "GET", "/health")
+    assert status == 200
+    assert json.loads(body)["in_flight"] == 0
+
+
+def test_full_queue_is_rejected_with_429(serve):
+    server = serve(max_workers=1, max_queue=0)
+    service = server.service
+
+    # Start a chunked upload and leave it open: it holds the only admission place.
+    slow = socket.create_connection(server.server_address[:2], timeout=10)
+    slow.sendall(b"POST /review/web HTTP/1.1\r\nHost: x\r\nTransfer-Encoding: chunked\r\n\r\n")
+    slow.sendall(b"%x\r\n%s\r\n" % (len(_XML[:20]), _XML[:20]))
+    deadline = time.monotonic() + 5
+    while service.in_flight == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert service.in_flight == 1
+
+    status, headers, body = _request(server, "POST", "/review/web", _XML)
+    assert status == 429
+    assert headers["Retry-After"] == "1"
+    assert "queue is full" in json.loads(body)["error"]
+
+    # Finishing the upload completes the first review and frees the place.
+    rest = _XML[20:]
+    slow.sendall(b"%x\r\n%s\r\n0\r\n\r\n" % (len(rest), rest))
+    response = http.client.HTTPResponse(slow)
+    response.begin()
+    assert response.status == 200
+    assert json.loads(response.read())["score"] == run_pipeline(_CASES, _RESULTS)["score"]
+    slow.close()
+
+    status, _, _ = _request(server, "POST", "/review/web", _XML)
+    assert status == 200
+
+
+def _start_slow_upload(server) -> socket.socket:
+    slow = socket.create_connection(server.server_address[:2], timeout=10)
+    slow.sendall(b"POST /review/web HTTP/1.1\r\nHost: x\r\nTransfer-Encoding: chunked\r\n\r\n")
+    slow.sendall(b"%x\r\n%s\r\n" % (len(_XML[:20]), _XML[:20]))
+    deadline = time.monotonic() + 5
+    while server.service.in_flight == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert server.service.in_flight == 1
+    return slow
+
+
+def test_slow_upload_does_not_hold_a_worker(serve):
+    server = serve(max_workers=1, max_queue=1)
+    slow = _start_slow_upload(server)
+
+    # The only worker is free while the first body is still arriving.
+    status, _, body = _request(server, "POST", "/review/web", _XML)
+    assert status == 200
+    assert json.loads(body)["metrics"]["failed"] == 1
+
+    rest = _XML[20:]
+    slow.sendall(b"%x\r\n%s\r\n0\r\n\r\n" % (len(rest), rest))
+    response = http.client.HTTPResponse(slow)
+    response.begin()
+    assert response.status == 200
+    response.read()
+    slow.close()
+
+
+def test_oversized_and_unreadable_bodies_are_rejected(serve):
+    server = serve(max_body_bytes=len(_XML) - 1)
+
+    status, _, body = _request(server, "POST", "/review/web", _XML)
+    assert status == 413
+    assert "exceeds the limit" in json.loads(body)["error"]
+    conn = http.client.HTTPConnection(*server.server_address[:2], timeout=10)
+    conn.request("POST", "/review/web", body=iter([_XML[:50], _XML[50:]]), encode_chunked=True)
+    assert conn.getresponse().status == 413
+    conn.close()
+    # The limit applies to the decoded body.
+    status, _, _ = _request(server, "POST", "/review/web", gzip.compress(_XML), {"Content-Encoding": "gzip"})
+    assert status == 413
+
+    status, _, body = _request(server, "POST", "/review/web", b"not gzip", {"Content-Encoding": "gzip"})
+    assert status == 400
+    assert "unable to read stream" in json.loads(body)["error"]
+    status, _, body = _request(server, "GET", "/health")
+    assert json.loads(body)["in_flight"] == 0
+
+
+def test_stalled_upload_times_out(serve, monkeypatch):
+    monkeypatch.setattr(ReviewRequestHandler, "timeout", 0.2)
+    server = serve(max_workers=1, max_queue=0)
+
+    slow = socket.create_connection(server.server_address[:2], timeout=10)
+    slow.sendall(b"POST /review/web HTTP/1.1\r\nHost: x\r\nContent-Length: %d\r\n\r\n" % len(_XML))
+    slow.sendall(_XML[:20])
+    response = http.client.HTTPResponse(slow)
+    response.begin()
+    assert response.status == 408
+    assert "stalled" in json.loads(response.read())["error"]
+    slow.close()
+
+    # The admission place is given back.
+    status, _, _ = _request(server, "POST", "/review/web", _XML)
+    assert status == 200
+
+
+def test_service_and_api_argument_validation(tmp_path, capsys):
+    with pytest.raises(ValidationError, match="max_workers"):
+        ReviewService({}, max_workers=0)
+    with pytest.raises(ValidationError, match="max_body_bytes"):
+        ReviewService({}, max_body_bytes=0)
+    with pytest.raises(ValidationError, match="unknown catalog"):
+        ReviewService({}).review("web", None)
+
+    assert parse_catalogs(["web=tests.csv", "api = api.csv"]) == {"web": "tests.csv", "api": "api.csv"}
+    for value in (["web"], ["-bad=x.csv"], ["web=a.csv", "web=b.csv"]):
+        with pytest.raises(ValidationError):
+            parse_catalogs(value)
+
+    assert api_main(["--catalog", f"web={tmp_path / 'missing.csv'}", "--no-cache", "--port", "0"]) == 2
+    assert "not found" in capsys.readouterr().err
+    assert api_main(["--catalog", "web=tests.csv", "--id-pattern", "(?i)x", "--id-pattern", r"(\d)\1"]) == 2
+    assert "by number" in capsys.readouterr().err
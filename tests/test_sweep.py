@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+
+from core.control.cli_contract import main
+from core.errors import IngestionError, ValidationError
+from pack.config import ScoringConfig, classify_risk_with_config, compute_score_with_config
+from pack.sweep import config_grid, load_config_grid, load_sweep_runs, sweep_configs
+
+
+def _runs(n: int = 300, seed: int = 11) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {"failed": rng.randrange(6), "skipped": rng.randrange(12), "unmapped_results": rng.randrange(4)}
+        for _ in range(n)
+    ]
+
+
+def _brute_force(runs, configs):
+    table = []
+    for config in configs:
+        scores = [compute_score_with_config(m, config) for m in runs]
+        risks = [classify_risk_with_config(s, config) for s in scores]
+        table.append((risks.count("Low"), risks.count("Medium"), risks.count("High"), sum(scores) / len(runs)))
+    return table
+
+
+def test_config_grid_is_cartesian_product_over_base():
+    configs = config_grid(low_risk_threshold=[80, 90], failed_penalty_per_test=[5, 10, 15])
+
+    assert len(configs) == 6
+    assert configs[1] == ScoringConfig(low_risk_threshold=80, failed_penalty_per_test=10)
+    assert config_grid() == [ScoringConfig()]
+    with pytest.raises(ValidationError, match="unknown config field 'bogus'"):
+        config_grid(bogus=[1])
+    with pytest.raises(ValidationError, match="must be integers"):
+        config_grid(low_risk_threshold=[80.5])
+
+
+def test_python_sweep_matches_double_loop():
+    runs = _runs()
+    configs = config_grid(low_risk_threshold=[75, 85, 95], medium_risk_threshold=[50, 70], max_skipped_penalty=[10, 20])
+
+    results = sweep_configs(runs, configs, use_numpy=False)
+
+    assert [r.config for r in results] == configs
+    assert [(r.low, r.medium, r.high, r.mean_score) for r in results] == _brute_force(runs, configs)
+    assert all(r.runs == len(runs) for r in results)
+
+
+def test_numpy_sweep_matches_python_sweep(monkeypatch):
+    pytest.importorskip("numpy")
+    import pack.sweep as sweep
+
+    runs = _runs(1000)
+    configs = config_grid(
+        failed_penalty_per_test=[5, 10, 20], skipped_penalty_per_test=[1, 2, 5], low_risk_threshold=[80, 85, 90]
+    )
+    # Force several chunks to exercise chunked evaluation.
+    monkeypatch.setattr(sweep, "_MAX_CELLS_PER_CHUNK", 1000)
+
+    assert sweep_configs(runs, configs, use_numpy=True) == sweep_configs(runs, configs, use_numpy=False)
+
+
+def test_sweep_validates_run_metrics():
+    with pytest.raises(ValidationError, match="run 1: metric 'skipped'"):
+        sweep_configs([{"failed": 0, "skipped": 0, "unmapped_results": 0}, {"failed": 1}], [ScoringConfig()])
+    assert sweep_configs([], [ScoringConfig()], use_numpy=False)[0].mean_score == 0.0
+
+
+def test_loaders_accept_pipeline_outputs_and_scalars(tmp_path):
+    runs_path = tmp_path / "runs.json"
+    runs_path.write_text(json.dumps([{"metrics": {"failed": 1, "skipped": 0, "unmapped_results": 0}}]))
+    grid_path = tmp_path / "grid.json"
+    grid_path.write_text(json.dumps({"low_risk_threshold": [80, 90], "max_failed_penalty": 50}))
+
+    assert load_sweep_runs(runs_path) == [{"failed": 1, "skipped": 0, "unmapped_results": 0}]
+    configs, varied = load_config_grid(grid_path)
+    assert varied == ["low_risk_threshold", "max_failed_penalty"]
+    assert [c.max_failed_penalty for c in configs] == [50, 50]
+
+    with pytest.raises(IngestionError, match="file not found"):
+        load_sweep_runs(tmp_path / "missing.json")
+    grid_path.write_text("[1, 2]")
+    with pytest.raises(ValidationError, match="expected a JSON object"):
+        load_config_grid(grid_path)
+
+
+def test_cli_sweep_prints_table_and_json(tmp_path, capsys):
+    runs_path = tmp_path / "runs.json"
+    runs_path.write_text(json.dumps([
+        {"failed": 0, "skipped": 0, "unmapped_results": 0},
+        {"failed": 2, "skipped": 0, "unmapped_results": 0},
+    ]))
+    grid_path = tmp_path / "grid.json"
+    grid_path.write_text(json.dumps({"low_risk_threshold": [80, 85]}))
+
+    assert main(["sweep", "--runs", str(runs_path), "--grid", str(grid_path)]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].split() == ["low_risk_threshold", "runs", "low", "medium", "high", "mean_score"]
+    # Scores are 100 and 80: 80 is Low only when the threshold is 80.
+    assert lines[1].split() == ["80", "2", "2", "0", "0", "90.0"]
+    assert lines[2].split() == ["85", "2", "1", "1", "0", "90.0"]
+
+    assert main(["sweep", "--runs", str(runs_path), "--grid", str(grid_path), "--format", "json"]) == 0
+    rows = json.loads(capsys.readouterr().out)
+    assert rows[1]["config"]["low_risk_threshold"] == 85
+    assert (rows[1]["low"], rows[1]["medium"]) == (1, 1)
+
+    assert main(["sweep", "--runs", str(tmp_path / "nope.json"), "--grid", str(grid_path)]) == 2
+    assert "file not found" in capsys.readouterr().err
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from core.normalization.models import NormalizedData, ResultBatch, STATUS_NAMES, TestCaseModel, TestResultModel
+from core.scoring import MetricsAccumulator, compute_metrics, vectorized
+
+
+def _random_inputs(n_results: int, seed: int = 7):
+    rng = random.Random(seed)
+    test_cases = {f"TC-{i}": TestCaseModel(id=f"TC-{i}", title=f"Test {i}") for i in range(50)}
+    results = [
+        TestResultModel(id=f"TC-{rng.randrange(80)}", status=rng.choice(STATUS_NAMES))
+        for _ in range(n_results)
+    ]
+    return test_cases, results
+
+
+def test_vectorized_counts_match_pure_python():
+    pytest.importorskip("numpy")
+    test_cases, results = _random_inputs(5_000)
+    batch = ResultBatch.from_results(results)
+
+    acc = MetricsAccumulator(test_cases).add_all(results)
+    assert vectorized.count_mapped_statuses_vectorized(test_cases, batch) == (
+        acc.mapped_results,
+        acc.passed,
+        acc.failed,
+        acc.skipped,
+    )
+    assert vectorized.count_mapped_statuses_vectorized(test_cases, ResultBatch()) == (0, 0, 0, 0)
+
+
+def test_large_batches_select_vectorized_backend(monkeypatch):
+    pytest.importorskip("numpy")
+    test_cases, results = _random_inputs(1_000)
+    expected = compute_metrics(NormalizedData(test_cases=test_cases, results=results))
+
+    calls = []
+    original = vectorized.count_mapped_statuses_vectorized
+    monkeypatch.setattr(vectorized, "VECTORIZE_MIN_RESULTS", 500)
+    monkeypatch.setattr(
+        vectorized, "count_mapped_statuses_vectorized", lambda *args: calls.append(1) or original(*args)
+    )
+
+    batch = ResultBatch.from_results(results)
+    assert compute_metrics(NormalizedData(test_cases=test_cases, results=batch)) == expected
+    assert calls == [1]
+
+
+def test_falls_back_to_pure_python_without_numpy(monkeypatch):
+    test_cases, results = _random_inputs(1_000)
+    expected = compute_metrics(NormalizedData(test_cases=test_cases, results=results))
+
+    monkeypatch.setattr(vectorized, "np", None)
+    monkeypatch.setattr(vectorized, "VECTORIZE_MIN_RESULTS", 0)
+
+    batch = ResultBatch.from_results(results)
+    assert compute_metrics(NormalizedData(test_cases=test_cases, results=batch)) == expected
+    with pytest.raises(ImportError, match="requires numpy"):
+        vectorized.count_mapped_statuses_vectorized(test_cases, batch)
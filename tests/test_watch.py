@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from core.control import watch
+from core.control.cli_contract import EXIT_RISK_GATE, main, parse_watch_plan
+from core.control.watch import ResultsWatcher, watch_results
+from core.errors import ValidationError
+from core.pipeline import Pipeline, run_pipeline_from_files
+
+_CATALOG = "id,name,component\nTC-1,Login,auth\nTC-2,Logout,auth\nTC-3,Pay,billing\nTC-4,Refund,billing\n"
+
+
+def _shard(path: Path, *outcomes: tuple[str, str], mtime_ns: int | None = None) -> None:
+    cases = "".join(f'<testcase name="{tc}" time="0.5">{outcome}</testcase>' for tc, outcome in outcomes)
+    path.write_text(f"<testsuite>{cases}</testsuite>", encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    (tmp_path / "tests.csv").write_text(_CATALOG, encoding="utf-8")
+    (tmp_path / "results").mkdir()
+    return tmp_path
+
+
+def test_poll_parses_only_new_or_changed_files(workspace, monkeypatch):
+    results = workspace / "results"
+    parsed = []
+    load = watch.load_junit_result_batch
+    monkeypatch.setattr(watch, "load_junit_result_batch", lambda path, ex: parsed.append(Path(path).name) or load(path, ex))
+
+    watcher = ResultsWatcher(Pipeline.from_csv(str(workspace / "tests.csv")), str(results))
+    assert watcher.poll_once() == []
+
+    _shard(results / "shard1.xml", ("TC-1", ""), ("TC-2", "<failure/>"), mtime_ns=1_000)
+    _shard(results / "shard2.xml", ("TC-3", "<skipped/>"), mtime_ns=1_000)
+    assert watcher.poll_once() == [str(results / "shard1.xml"), str(results / "shard2.xml")]
+    assert watcher.poll_once() == []
+    assert parsed == ["shard1.xml", "shard2.xml"]
+    assert watcher.evaluate() == run_pipeline_from_files(str(workspace / "tests.csv"), str(results))
+
+    # A rewritten shard replaces its earlier contribution; a deleted one drops out.
+    _shard(results / "shard1.xml", ("TC-1", ""), ("TC-2", ""), mtime_ns=2_000)
+    (results / "shard2.xml").unlink()
+    assert watcher.poll_once() == [str(results / "shard1.xml"), str(results / "shard2.xml")]
+    assert parsed == ["shard1.xml", "shard2.xml", "shard1.xml"]
+    output = watcher.evaluate()
+    assert output == run_pipeline_from_files(str(workspace / "tests.csv"), str(results))
+    assert (output["metrics"]["passed"], output["metrics"]["failed"], output["metrics"]["skipped"]) == (2, 0, 0)
+    assert (watcher.files, watcher.results) == (1, 2)
+
+    # Shards appended after the last one read and shards landing out of order give the same run.
+    _shard(results / "shard3.xml", ("TC-4", "<failure/>"))
+    assert watcher.poll_once() == [str(results / "shard3.xml")]
+    assert watcher.evaluate() == run_pipeline_from_files(str(workspace / "tests.csv"), str(results))
+    _shard(results / "shard0.xml", ("TC-3", "<skipped/>"), ("TC-4", ""))
+    assert watcher.poll_once() == [str(results / "shard0.xml")]
+    assert watcher.evaluate() == run_pipeline_from_files(str(workspace / "tests.csv"), str(results))
+
+
+def test_incomplete_shard_is_pending_until_it_changes(workspace):
+    results = workspace / "results"
+    watcher = ResultsWatcher(Pipeline.from_csv(str(workspace / "tests.csv")), str(results))
+
+    _shard(results / "a.xml", ("TC-1", ""))
+    (results / "b.xml").write_text('<testsuite><testcase name="TC-3">', encoding="utf-8")
+    assert watcher.poll_once() == [str(results / "a.xml")]
+    assert list(watcher.pending) == [str(results / "b.xml")]
+    assert "invalid XML" in watcher.pending[str(results / "b.xml")]
+
+    _shard(results / "b.xml", ("TC-3", "<failure/>"), ("TC-4", ""))
+    assert watcher.poll_once() == [str(results / "b.xml")]
+    assert watcher.pending == {}
+    assert watcher.evaluate()["metrics"]["failed"] == 1
+
+
+def test_updates_are_debounced(workspace):
+    results = workspace / "results"
+    watcher = ResultsWatcher(Pipeline.from_csv(str(workspace / "tests.csv")), str(results))
+    now = [0.0]
+    landing = {1.0: "s1", 2.0: "s2", 3.0: "s3", 12.0: "s4"}  # shard written at time t
+
+    def sleep(seconds: float) -> None:
+        now[0] += seconds
+        name = landing.get(now[0])
+        if name is not None:
+            _shard(results / f"{name}.xml", (f"TC-{name[1]}", ""))
+
+    updates = []
+    output = watch_results(
+        watcher,
+        lambda out: updates.append((now[0], out["metrics"]["total_results"])),
+        interval=1.0,
+        debounce=5.0,
+        timeout=14.0,
+        clock=lambda: now[0],
+        sleep=sleep,
+    )
+
+    # s1 is reported at once, s2 and s3 together once the debounce has passed, s4 after that.
+    assert updates == [(1.0, 1), (6.0, 3), (12.0, 4)]
+    assert output["metrics"]["total_results"] == 4
+
+
+def test_watch_command_rewrites_reports_in_place(workspace, capsys):
+    results = workspace / "results"
+    _shard(results / "shard1.xml", ("TC-1", "<failure/>"), ("TC-2", "<failure/>"))
+    argv = [
+        "watch", "--tests", str(workspace / "tests.csv"), "--results", str(results), "--outdir", str(workspace / "out"),
+        "--format", "md,json", "--interval", "0.01", "--timeout", "0.05", "--no-cache",
+    ]
+
+    assert main(argv + ["--fail-on", "medium"]) == EXIT_RISK_GATE
+    out = capsys.readouterr().out
+    assert "Score: 80 / 100 (Medium risk) - 2 result(s) from 1 file(s)" in out
+    assert sorted(p.name for p in (workspace / "out").iterdir()) == ["live_report.json", "live_report.md"]
+
+    for shard in results.iterdir():
+        shard.unlink()
+    assert main(argv) == 2
+    assert "no JUnit results were read" in capsys.readouterr().err
+
+
+def test_parse_watch_plan_validation():
+    plan = parse_watch_plan(["watch", "--tests", "t.csv", "--results", "shards/", "--debounce", "0", "--format", "md,html"])
+    assert (plan.interval, plan.debounce, plan.timeout) == (2.0, 0.0, None)
+    assert (plan.run.prefix, plan.run.formats) == ("live_report", ("md", "html"))
+
+    for extra in (["--interval", "0"], ["--debounce", "-1"], ["--timeout", "0"], ["--prefix", "bad name"]):
+        with pytest.raises(ValidationError):
+            parse_watch_plan(["watch", "--tests", "t.csv", "--results", "shards/", *extra])